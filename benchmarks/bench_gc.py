@@ -0,0 +1,99 @@
+"""
+GC-pause benchmark for flash-sale cart churn.
+
+Simulates flash-sale churn: every cart gets a few lines from a live catalog
+plus one transient product (a bundle built on the fly) and is totalled. The
+most recent ``--live`` carts stay alive (open sessions); older ones are
+abandoned. The same workload runs under different collector settings:
+
+- default: the interpreter's thresholds
+- thresholds: ``gc_tuned`` with a higher generation 0 threshold
+- freeze: ``gc_tuned`` with the catalog moved to the permanent generation
+- both: higher thresholds and a frozen catalog
+
+For each variant it prints carts per second, the allocation rate (cart
+objects, ``(product, qty)`` line tuples and transient products created per
+second), the number of collections per generation and the total, maximum
+and p99 GC pause measured through ``gc.callbacks``. The one-off collection
+done by ``freeze`` is not timed.
+
+There is no pooled variant. Pooling cart lines and transient products was
+measured and declined: the pool bookkeeping made carts slower and did not
+reduce pauses, while the collector settings above did.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_gc --carts 200000 --catalog 200000
+"""
+import argparse
+import gc
+import random
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from exercises.ecommerce.book import Book
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.gc_tuning import GCPauseMonitor, gc_tuned
+
+from .generators import make_products
+
+
+def run_carts(catalog, carts: int, lines: int, live: int, seed: int) -> int:
+    """
+    Fill, total and abandon ``carts`` carts, keeping ``live`` of them alive.
+
+    Returns:
+        int: Number of carts, line tuples and transient products created
+    """
+    rng = random.Random(seed)
+    sessions = deque(maxlen=live)
+    for n in range(carts):
+        cart = ShoppingCart()
+        for product in rng.sample(catalog, lines):
+            cart.add(product, 1 + n % 3)
+        cart.add(Book(f"Bundle {n}", 9.99, "Various", "bundle"), 1)
+        cart.total()
+        sessions.append(cart)  # the oldest session is dropped
+    # per cart: the cart, one line per catalog product plus the bundle's line, the bundle
+    return carts * (1 + (lines + 1) + 1)
+
+
+def measure(name: str, catalog, args, thresholds=None, freeze: bool = False):
+    """Run one variant and print its row."""
+    tuned = thresholds is not None or freeze
+    with gc_tuned(thresholds=thresholds, freeze=freeze) if tuned else nullcontext():
+        gc.collect()
+        before = [stats["collections"] for stats in gc.get_stats()]
+        with GCPauseMonitor() as monitor:
+            start = time.perf_counter()
+            allocated = run_carts(catalog, args.carts, args.lines, args.live, args.seed)
+            elapsed = time.perf_counter() - start
+        collections = [stats["collections"] - old for stats, old in zip(gc.get_stats(), before)]
+    pauses = monitor.summary()
+    print(
+        f"{name:<11} {args.carts / elapsed:>10,.0f} {allocated / elapsed:>12,.0f} {'/'.join(map(str, collections)):>14} "
+        f"{pauses.total_seconds * 1e3:>9.1f} {pauses.max_seconds * 1e3:>8.2f} {pauses.p99_seconds * 1e3:>8.2f}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--carts", type=int, default=100000)
+    parser.add_argument("--lines", type=int, default=5, help="catalog lines per cart")
+    parser.add_argument("--live", type=int, default=20000, help="carts kept alive at once")
+    parser.add_argument("--catalog", type=int, default=100000, help="live products kept for the whole run")
+    parser.add_argument("--threshold", type=int, default=50000, help="generation 0 threshold when tuned")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    catalog = make_products(args.catalog, args.seed)
+    thresholds = (args.threshold, 10, 10)
+    print(f"{'variant':<11} {'carts/s':>10} {'objects/s':>12} {'gc gen0/1/2':>14} {'pause ms':>9} {'max ms':>8} {'p99 ms':>8}")
+    measure("default", catalog, args)
+    measure("thresholds", catalog, args, thresholds=thresholds)
+    measure("freeze", catalog, args, freeze=True)
+    measure("both", catalog, args, thresholds=thresholds, freeze=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Write-throughput benchmark for the payment ledger.
+
+Concurrent writer threads append payment outcomes, each waiting until its
+record is durable. Compares one fsync per append with group commit (one
+fsync per group of concurrent appends), and reports writes per second and
+records per fsync.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ledger --threads 1 8 32 --records 2000
+"""
+import argparse
+import tempfile
+import threading
+import time
+
+from exercises.ecommerce.ledger import PaymentLedger
+
+MODES = {
+    "fsync-each": {"group_commit": False},
+    "group": {"group_commit": True},
+}
+
+
+def run(mode: str, threads: int, records: int, directory: str) -> tuple:
+    """Append ``records`` records from ``threads`` threads; return (seconds, fsyncs)."""
+    ledger = PaymentLedger(directory, **MODES[mode])
+    per_thread = records // threads
+
+    def write(worker):
+        for n in range(per_thread):
+            ledger.append(f"{worker}-{n}", 19.99, True, "card", "1234")
+
+    workers = [threading.Thread(target=write, args=(worker,)) for worker in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    ledger.close()
+    return elapsed, ledger.stats().fsyncs, per_thread * threads
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--directory", help="where to create the ledgers (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<11} {'threads':>7} {'writes/s':>10} {'fsyncs':>7} {'records/fsync':>13}")
+    for threads in args.threads:
+        for mode in MODES:
+            with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+                elapsed, fsyncs, written = run(mode, threads, args.records, directory)
+            print(f"{mode:<11} {threads:>7} {written / elapsed:>10,.0f} {fsyncs:>7,} {written / max(fsyncs, 1):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Runtime and packing-density benchmark for the rectangle packer.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_packing --sizes 1000 10000 100000 1000000
+
+MaxRects keeps a growing free-rectangle list per sheet, so by default it is
+only run up to 100k items; pass --max-maxrects to change that.
+"""
+import argparse
+import random
+import time
+
+from exercises.shapes.packing import SHEET_TYPES, RectanglePacker
+from exercises.shapes.rectangle import Rectangle
+
+
+def make_rectangles(count: int, seed: int = 0, low: int = 5, high: int = 120) -> list:
+    """Return ``count`` random Rectangle instances."""
+    rng = random.Random(seed)
+    return [Rectangle(rng.randint(low, high), rng.randint(low, high)) for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--algorithms", nargs="+", default=sorted(SHEET_TYPES))
+    parser.add_argument("--sheet", type=float, nargs=2, default=(1000.0, 1000.0))
+    parser.add_argument("--max-maxrects", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print(f"{'items':>9}  {'algorithm':>10}  {'seconds':>8}  {'items/s':>10}  {'sheets':>7}  {'density':>7}")
+    for size in args.sizes:
+        rectangles = make_rectangles(size)
+        for algorithm in args.algorithms:
+            if algorithm == "maxrects" and size > args.max_maxrects:
+                continue
+            packer = RectanglePacker(*args.sheet, algorithm=algorithm)
+            start = time.perf_counter()
+            result = packer.pack(rectangles)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{size:>9,}  {algorithm:>10}  {elapsed:>8.2f}  {size / elapsed:>10,.0f}"
+                f"  {result.sheets:>7,}  {result.utilization:>7.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
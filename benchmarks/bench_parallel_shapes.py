@@ -0,0 +1,62 @@
+"""
+Scaling benchmark for parallel shape aggregation.
+
+Builds synthetic shape columns (no shape objects) and times
+``ParallelAggregator.total_area`` for 1..N worker processes.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parallel_shapes --rows 2000000 --max-workers 8
+"""
+import argparse
+import array
+import os
+import random
+import time
+
+from exercises.shapes.columnar import KIND_COLUMNS, ShapeColumns
+from exercises.shapes.parallel import ParallelAggregator
+
+
+def make_columns(rows: int, seed: int = 0) -> ShapeColumns:
+    """Return ``rows`` random shapes per kind as columns."""
+    rng = random.Random(seed)
+    columns = {}
+    for kind, names in KIND_COLUMNS.items():
+        columns[kind] = {
+            name: array.array("d", (rng.uniform(1.0, 10.0) for _ in range(rows)))
+            for name in names
+        }
+    return ShapeColumns(columns)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per shape kind")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    columns = make_columns(args.rows)
+    print(f"{len(columns):,} shapes, best of {args.repeat}")
+    print(f"{'workers':>7}  {'seconds':>8}  {'speedup':>7}  {'efficiency':>10}")
+
+    baseline = None
+    workers = 1
+    while workers <= args.max_workers:
+        with ParallelAggregator(columns, workers=workers) as aggregator:
+            aggregator.total_area()  # warm up the pool
+            best = min(_timed(aggregator.total_area) for _ in range(args.repeat))
+        baseline = baseline or best
+        speedup = baseline / best
+        print(f"{workers:>7}  {best:>8.3f}  {speedup:>6.2f}x  {speedup / workers:>9.0%}")
+        workers *= 2
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Throughput benchmark for the discrete-event scheduler.
+
+Queues a seeded random workload for a mixed population and times
+``Scheduler.run`` with ``record=False`` for several queue bucket widths. A
+width of ``inf`` puts every event in one bucket, i.e. a single heap over the
+whole queue.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_scheduler --animals 10000 --events 300000 --widths inf 0.1 1 10
+"""
+import argparse
+import time
+
+from simulation.scheduler import Scheduler
+
+from .generators import make_animals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--animals", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=300_000)
+    parser.add_argument("--horizon", type=float, default=3600.0, help="simulated seconds the events start in")
+    parser.add_argument("--widths", type=float, nargs="+", default=[float("inf"), 0.1, 1.0, 10.0])
+    parser.add_argument("--repeat", type=int, default=3, help="keep the fastest of this many runs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{args.animals:,} animals, {args.events:,} queued events over {args.horizon:g} s")
+    print(f"{'width':>7}  {'processed':>10}  {'seconds':>8}  {'events/s':>10}")
+    for width in args.widths:
+        best = None
+        for _ in range(args.repeat):
+            scheduler = Scheduler(make_animals(args.animals, args.seed), seed=args.seed, record=False, bucket_width=width)
+            scheduler.schedule_random(args.events, args.horizon)
+            start = time.perf_counter()
+            processed = scheduler.run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{width:>7g}  {processed:>10,}  {best:>8.3f}  {processed / best:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
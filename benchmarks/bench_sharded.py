@@ -0,0 +1,61 @@
+"""
+Scaling benchmark for the sharded population simulation.
+
+Builds a mixed population of dogs, cats and birds directly as columns and
+times ``ShardedSimulation.run`` for 1..N worker processes (one shard per
+worker).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_sharded --animals 1000000 --ticks 20 --max-workers 8
+"""
+import argparse
+import os
+import time
+
+from simulation.population import Population
+from simulation.sharded import ShardedSimulation
+
+
+def make_population(animals: int) -> Population:
+    """Return a population with equal numbers of dogs, cats and birds."""
+    population = Population()
+    for n in range(animals):
+        if n % 3 == 0:
+            population.add_dog(f"Dog{n}", 3, "Lab")
+        elif n % 3 == 1:
+            population.add_cat(f"Cat{n}", 2, "Grey")
+        else:
+            population.add_bird(f"Bird{n}", 1, 8.0)
+    return population
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--animals", type=int, default=300_000)
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    print(f"{args.animals:,} animals, {args.ticks} ticks")
+    print(f"{'workers':>7}  {'seconds':>8}  {'ticks/s':>8}  {'speedup':>7}  {'efficiency':>10}")
+
+    baseline = None
+    workers = 1
+    while workers <= args.max_workers:
+        population = make_population(args.animals)
+        with ShardedSimulation(population, shards=workers, workers=workers) as simulation:
+            simulation.step()  # warm up the pool
+            start = time.perf_counter()
+            simulation.run(args.ticks)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(
+            f"{workers:>7}  {elapsed:>8.3f}  {args.ticks / elapsed:>8.2f}  "
+            f"{speedup:>6.2f}x  {speedup / workers:>9.0%}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Deterministic synthetic data for the benchmark suite.
+
+Every generator takes an object count and a seed and returns the same data
+for the same arguments. Objects are the real classes from ``exercises`` and
+``inheritance.py``; the mixes roughly match the examples in the lessons.
+"""
+import random
+
+from exercises.ecommerce.book import Book
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.clothing import Clothing
+from exercises.ecommerce.credit_card import CreditCardPayment
+from exercises.ecommerce.electronics import Electronics
+from exercises.ecommerce.paypal import PayPalPayment
+from exercises.shapes.circle import Circle
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.triangle import Triangle
+from inheritance import Bird, Cat, Dog
+
+SIZES = ("XS", "S", "M", "L", "XL")
+
+
+def make_products(count: int, seed: int = 0) -> list:
+    """Return a mix of books, electronics and clothing."""
+    rng = random.Random(seed)
+    products = []
+    for n in range(count):
+        price = round(rng.uniform(1.0, 500.0), 2)
+        kind = n % 3
+        if kind == 0:
+            products.append(Book(f"Book {n}", price, f"Author {n % 997}", f"978{n:010d}"))
+        elif kind == 1:
+            products.append(Electronics(f"Device {n}", price, rng.randint(1, 3)))
+        else:
+            products.append(Clothing(f"Shirt {n}", price, rng.choice(SIZES)))
+    return products
+
+
+def make_cart(count: int, seed: int = 0) -> ShoppingCart:
+    """Return a cart with ``count`` lines of random quantity."""
+    rng = random.Random(seed + 1)
+    cart = ShoppingCart()
+    for product in make_products(count, seed):
+        cart.add(product, rng.randint(1, 5))
+    return cart
+
+
+def make_payments(count: int, seed: int = 0) -> list:
+    """Return (payment method, amount) pairs; a few amounts are invalid."""
+    rng = random.Random(seed)
+    payments = []
+    for n in range(count):
+        if n % 2:
+            method = CreditCardPayment(f"{rng.randrange(10000):04d}")
+        else:
+            email = f"user{n}@example.com" if rng.random() > 0.05 else f"user{n}"
+            method = PayPalPayment(email)
+        amount = round(rng.uniform(-10.0, 1000.0), 2)
+        payments.append((method, amount))
+    return payments
+
+
+def make_shapes(count: int, seed: int = 0) -> list:
+    """Return a mix of circles, rectangles and triangles with all sides."""
+    rng = random.Random(seed)
+    shapes = []
+    for n in range(count):
+        kind = n % 3
+        if kind == 0:
+            shapes.append(Circle(rng.uniform(0.5, 10.0)))
+        elif kind == 1:
+            shapes.append(Rectangle(rng.uniform(0.5, 10.0), rng.uniform(0.5, 10.0)))
+        else:
+            base = rng.uniform(1.0, 10.0)
+            shapes.append(Triangle(base, rng.uniform(0.5, 10.0), base * 0.8, base * 0.9))
+    return shapes
+
+
+def make_animals(count: int, seed: int = 0) -> list:
+    """Return a mix of dogs, cats and birds."""
+    rng = random.Random(seed)
+    animals = []
+    for n in range(count):
+        kind = n % 3
+        age = rng.randint(1, 15)
+        if kind == 0:
+            animals.append(Dog(f"Dog{n}", age, "Labrador"))
+        elif kind == 1:
+            animals.append(Cat(f"Cat{n}", age, "Grey"))
+        else:
+            animals.append(Bird(f"Bird{n}", age, round(rng.uniform(4.0, 40.0), 1)))
+    return animals
@@ -0,0 +1,212 @@
+"""
+Benchmark harness: registry, measurement, JSON results and regression checks.
+
+A benchmark is a pair of functions registered under a dotted name:
+
+    @benchmark("cart.total")
+    def cart_total(count, seed):
+        cart = make_cart(count, seed)   # setup, not timed
+        return cart.total               # the callable that is timed
+
+The setup runs once per scale; the returned callable is timed. Timing uses
+``time.perf_counter`` with the garbage collector disabled, repeats the
+callable enough times per sample to get above ``min_time`` (like
+``timeit.autorange``) and reports the best and median of ``repeat`` samples.
+Peak memory is measured in a separate run under ``tracemalloc`` so its
+overhead does not affect the timings.
+"""
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+# Scale labels accepted on the command line
+SCALES = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+BENCHMARKS = {}
+
+Comparison = namedtuple("Comparison", "key metric baseline current ratio regressed")
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark setup function.
+
+    Args:
+        name (str): Dotted benchmark name, e.g. "shapes.area"
+
+    Returns:
+        callable: Decorator that registers ``setup(count, seed) -> callable``
+    """
+    def register(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def measure(function, repeat: int = 5, min_time: float = 0.05) -> dict:
+    """
+    Time a callable.
+
+    Args:
+        function (callable): Called without arguments
+        repeat (int, optional): Number of samples
+        min_time (float, optional): Minimum duration of one sample in seconds;
+            fast callables are run several times per sample
+
+    Returns:
+        dict: best, median and stdev seconds per call, plus the calls per sample
+    """
+    clock = time.perf_counter
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = 1
+        while True:
+            start = clock()
+            for _ in range(number):
+                function()
+            elapsed = clock() - start
+            if elapsed >= min_time:
+                break
+            number = max(number * 2, math.ceil(number * min_time / max(elapsed, 1e-9)))
+        samples = [elapsed / number]
+        for _ in range(repeat - 1):
+            start = clock()
+            for _ in range(number):
+                function()
+            samples.append((clock() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "best": min(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+    }
+
+
+def measure_memory(function) -> int:
+    """
+    Return the peak bytes allocated during one call.
+
+    Args:
+        function (callable): Called without arguments
+
+    Returns:
+        int: Peak traced memory in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(names=None, scales=("1k", "10k"), repeat: int = 5, min_time: float = 0.05,
+                   memory: bool = True, seed: int = 0, progress=None) -> dict:
+    """
+    Run registered benchmarks at several scales.
+
+    Args:
+        names (optional): Benchmark names or name prefixes (defaults to all)
+        scales (optional): Scale labels from ``SCALES``
+        repeat (int, optional): Timing samples per benchmark
+        min_time (float, optional): Minimum duration of one sample
+        memory (bool, optional): Also measure peak memory
+        seed (int, optional): Seed for the data generators
+        progress (callable, optional): Called with each finished result
+
+    Returns:
+        dict: Results document with "meta" and "results" (see ``write_results``)
+    """
+    selected = [
+        name for name in sorted(BENCHMARKS)
+        if not names or any(name == prefix or name.startswith(prefix + ".") for prefix in names)
+    ]
+    results = {}
+    for scale in scales:
+        count = SCALES[scale]
+        for name in selected:
+            function = BENCHMARKS[name](count, seed)
+            function()  # warm up caches and lazy state
+            result = {"benchmark": name, "scale": scale, "items": count}
+            result.update(measure(function, repeat, min_time))
+            result["per_item_ns"] = result["best"] / count * 1e9
+            if memory:
+                result["peak_bytes"] = measure_memory(function)
+            del function
+            results[f"{name}@{scale}"] = result
+            if progress is not None:
+                progress(result)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def write_results(document: dict, path):
+    """Write a results document as JSON."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def read_results(path) -> dict:
+    """Read a results document written by ``write_results``."""
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10, memory_threshold: float = 0.25) -> list:
+    """
+    Compare two results documents.
+
+    Only benchmark/scale pairs present in both are compared. Time uses the
+    best sample; memory uses the peak bytes when both runs measured it.
+
+    Args:
+        baseline (dict): Stored results
+        current (dict): New results
+        threshold (float, optional): Allowed relative slowdown (0.10 = 10%)
+        memory_threshold (float, optional): Allowed relative memory growth
+
+    Returns:
+        list: ``Comparison`` entries sorted by key, then metric
+    """
+    comparisons = []
+    old_results, new_results = baseline["results"], current["results"]
+    for key in sorted(old_results.keys() & new_results.keys()):
+        old, new = old_results[key], new_results[key]
+        metrics = [("best", threshold)]
+        if "peak_bytes" in old and "peak_bytes" in new:
+            metrics.append(("peak_bytes", memory_threshold))
+        for metric, limit in metrics:
+            before, after = old[metric], new[metric]
+            ratio = after / before if before else (1.0 if not after else math.inf)
+            comparisons.append(Comparison(key, metric, before, after, ratio, ratio > 1 + limit))
+    return comparisons
@@ -0,0 +1,191 @@
+"""
+Benchmark suite for the ecommerce, shapes and animal hot paths.
+
+Usage (from the repository root):
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run --scales 1k 10k 100k --output results.json
+    python -m benchmarks.suite run ecommerce --scales 1m --no-memory
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.10
+
+``compare`` prints every benchmark/scale pair found in both files and exits
+with status 1 if any of them got slower (or used more memory) than the
+thresholds allow, so it can gate a CI job against a stored baseline.
+"""
+import argparse
+import sys
+
+from exercises.ecommerce.validation import PaymentValidator
+from inheritance import Bird, Cat, Dog
+
+from .generators import make_animals, make_cart, make_payments, make_products, make_shapes
+from .harness import BENCHMARKS, SCALES, benchmark, compare, read_results, run_benchmarks, write_results
+
+
+# Ecommerce
+
+
+@benchmark("ecommerce.cart_total")
+def cart_total(count, seed):
+    return make_cart(count, seed).total
+
+
+@benchmark("ecommerce.apply_discount")
+def apply_discount(count, seed):
+    products = make_products(count, seed)
+
+    def run():
+        # 0% keeps prices stable across repeats (repeated real discounts
+        # would drive them into slow subnormal floats)
+        for product in products:
+            product.apply_discount(0.0)
+    return run
+
+
+@benchmark("ecommerce.process_payment")
+def process_payment(count, seed):
+    payments = make_payments(count, seed)
+
+    def run():
+        return sum(method.process_payment(amount) for method, amount in payments)
+    return run
+
+
+@benchmark("ecommerce.validate_payments")
+def validate_payments(count, seed):
+    payments = make_payments(count, seed)
+    return lambda: PaymentValidator().validate(payments)
+
+
+# Shapes
+
+
+@benchmark("shapes.area")
+def shape_area(count, seed):
+    shapes = make_shapes(count, seed)
+    return lambda: sum(shape.area() for shape in shapes)
+
+
+@benchmark("shapes.perimeter")
+def shape_perimeter(count, seed):
+    shapes = make_shapes(count, seed)
+    return lambda: sum(shape.perimeter() for shape in shapes)
+
+
+# Animals
+
+
+@benchmark("animals.eat")
+def animal_eat(count, seed):
+    animals = make_animals(count, seed)
+
+    def run():
+        for animal in animals:
+            animal.eat("food")
+    return run
+
+
+@benchmark("animals.make_sound")
+def animal_make_sound(count, seed):
+    animals = make_animals(count, seed)
+
+    def run():
+        for animal in animals:
+            animal.make_sound()
+    return run
+
+
+@benchmark("animals.actions")
+def animal_actions(count, seed):
+    animals = make_animals(count, seed)
+
+    def run():
+        # One round of each kind's own actions, ending in the same state
+        for animal in animals:
+            if isinstance(animal, Dog):
+                animal.fetch("ball")
+            elif isinstance(animal, Cat):
+                animal.climb_tree()
+            elif isinstance(animal, Bird):
+                animal.fly(50)
+                animal.land()
+            animal.sleep()
+            animal.wake_up()
+    return run
+
+
+def _print_result(result):
+    memory = f"{result['peak_bytes'] / 1024:>10,.1f}" if "peak_bytes" in result else f"{'-':>10}"
+    print(
+        f"{result['benchmark']:<28} {result['scale']:>5} {result['best'] * 1e3:>10.3f} "
+        f"{result['median'] * 1e3:>10.3f} {result['per_item_ns']:>10.1f} {memory}"
+    )
+
+
+def _run(args):
+    unknown = [scale for scale in args.scales if scale not in SCALES]
+    if unknown:
+        raise SystemExit(f"Unknown scale(s): {', '.join(unknown)}; choose from {', '.join(SCALES)}")
+    print(f"{'benchmark':<28} {'scale':>5} {'best ms':>10} {'median ms':>10} {'ns/item':>10} {'peak KiB':>10}")
+    document = run_benchmarks(
+        args.names, args.scales, repeat=args.repeat, min_time=args.min_time,
+        memory=not args.no_memory, seed=args.seed, progress=_print_result,
+    )
+    if args.output:
+        write_results(document, args.output)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+def _compare(args):
+    comparisons = compare(
+        read_results(args.baseline), read_results(args.current),
+        threshold=args.threshold, memory_threshold=args.memory_threshold,
+    )
+    if not comparisons:
+        print("No benchmarks in common")
+        return 0
+    print(f"{'benchmark':<36} {'metric':>10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for item in comparisons:
+        flag = "  REGRESSION" if item.regressed else ""
+        print(
+            f"{item.key:<36} {item.metric:>10} {item.baseline:>12.6g} {item.current:>12.6g} "
+            f"{item.ratio - 1:>+8.1%}{flag}"
+        )
+    regressions = sum(item.regressed for item in comparisons)
+    print(f"{regressions} regression(s) in {len(comparisons)} comparisons")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the registered benchmarks")
+
+    run = commands.add_parser("run", help="run benchmarks")
+    run.add_argument("names", nargs="*", help="benchmark names or prefixes (default: all)")
+    run.add_argument("--scales", nargs="+", default=["1k", "10k"], help=f"any of {', '.join(SCALES)}")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak measurement")
+    run.add_argument("--output", help="write results as JSON to this file")
+
+    check = commands.add_parser("compare", help="compare results against a baseline")
+    check.add_argument("baseline")
+    check.add_argument("current")
+    check.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    check.add_argument("--memory-threshold", type=float, default=0.25)
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name in sorted(BENCHMARKS):
+            print(name)
+        return 0
+    if args.command == "run":
+        return _run(args)
+    return _compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Runnable lesson examples: ``animals`` and ``payments``.
+
+The subpackages are imported on first attribute access (PEP 562).
+"""
+from lazy_imports import make_lazy
+
+# Public name -> module it lives in, relative to this package
+_EXPORTS = {
+    "animals": ".animals",
+    "payments": ".payments",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,16 @@
+"""
+Animal inheritance example.
+
+The classes are imported on first attribute access (PEP 562).
+"""
+from lazy_imports import make_lazy
+
+# Public name -> module it lives in, relative to this package
+_EXPORTS = {
+    "Animal": ".animal",
+    "Dog": ".dog",
+    "Cat": ".cat",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
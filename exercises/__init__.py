@@ -0,0 +1,16 @@
+"""
+Exercise packages for the lesson: ``ecommerce`` and ``shapes``.
+
+The subpackages are imported on first attribute access (PEP 562), so
+``import exercises`` loads nothing else.
+"""
+from lazy_imports import make_lazy
+
+# Public name -> module it lives in, relative to this package
+_EXPORTS = {
+    "ecommerce": ".ecommerce",
+    "shapes": ".shapes",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,28 @@
+"""
+E-commerce exercise: products, shopping cart and payment methods, plus
+payment validation, the payment ledger, currency conversion and metrics.
+
+The classes are imported on first attribute access (PEP 562):
+``from exercises.ecommerce import Book`` only loads ``product`` and ``book``.
+"""
+from lazy_imports import make_lazy
+
+# Public name -> module it lives in, relative to this package
+_EXPORTS = {
+    "Product": ".product",
+    "Book": ".book",
+    "Electronics": ".electronics",
+    "Clothing": ".clothing",
+    "ShoppingCart": ".cart",
+    "Payment": ".payment",
+    "CreditCardPayment": ".credit_card",
+    "PayPalPayment": ".paypal",
+    "PaymentValidator": ".validation",
+    "PaymentLedger": ".ledger",
+    "RateTable": ".currency",
+    "CatalogPrices": ".currency",
+    "MetricsRegistry": ".instrumentation",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -8,7 +8,7 @@ class Book(Product):
     Books may have specific discount rules applied to them.
     """
     
-    def __init__(self, name: str, price: float, author: str, isbn: str):
+    def __init__(self, name: str, price: float, author: str, isbn: str, currency: str = None):
         """
         Initialize a Book with name, price, author, and ISBN.
         
@@ -17,9 +17,11 @@ class Book(Product):
             price (float): The price of the book
             author (str): The author of the book
             isbn (str): The ISBN (International Standard Book Number)
+            currency (str, optional): ISO 4217 code of ``price``; defaults
+                to ``Product.currency``
         """
         # Call parent constructor to initialize name and price
-        super().__init__(name, price)
+        super().__init__(name, price, currency)
         
         # Store book-specific attributes
         self.author = author
@@ -1,8 +1,57 @@
 """
 Shopping cart implementation for the e-commerce system.
+
+Carts can be merged (e.g. a guest cart into the stored cart of the user who
+just logged in) and diffed for syncing between nodes. Both operations key
+lines by product identity - ISBN for books, ``sku`` for products that have
+one, otherwise the object itself - and run in linear time.
 """
 
 
+def _sum(ours: int, theirs: int) -> int:
+    return ours + theirs
+
+
+def _keep(ours: int, theirs: int) -> int:
+    return ours
+
+
+def _replace(ours: int, theirs: int) -> int:
+    return theirs
+
+
+# Conflict rules for ShoppingCart.merge: (our qty, their qty) -> merged qty
+MERGE_RULES = {
+    "sum": _sum,
+    "max": max,
+    "keep": _keep,
+    "replace": _replace,
+}
+
+
+def line_key(product) -> str:
+    """
+    Return the key that identifies a product's cart line.
+
+    Books are keyed by ISBN and products with a ``sku`` attribute by SKU;
+    both keys are stable across processes. Any other product is keyed by
+    object identity, which is only meaningful inside one process.
+
+    Args:
+        product: A Product instance
+
+    Returns:
+        str: "isbn:<isbn>", "sku:<sku>" or "id:<id>"
+    """
+    isbn = getattr(product, "isbn", None)
+    if isbn:
+        return f"isbn:{isbn}"
+    sku = getattr(product, "sku", None)
+    if sku:
+        return f"sku:{sku}"
+    return f"id:{id(product)}"
+
+
 class ShoppingCart:
     """
     Shopping cart that holds products and quantities.
@@ -55,3 +104,137 @@ class ShoppingCart:
             total_cost += product.price * quantity
         
         return total_cost
+    
+    def total_in(self, currency: str, rates) -> float:
+        """
+        Calculate the cart total in a given currency.
+        
+        Lines are summed per product currency first, so each currency is
+        converted once rather than once per line. The total is recomputed on
+        every call, so it always reflects the current ``items`` and prices.
+        
+        Args:
+            currency (str): The currency of the result, e.g. "EUR"
+            rates: A ``currency.RateTable``
+        
+        Returns:
+            float: The total converted to ``currency``
+        
+        Raises:
+            ValueError: If a currency has no exchange rate
+        """
+        subtotals = {}
+        for product, quantity in self.items:
+            code = product.currency
+            subtotals[code] = subtotals.get(code, 0.0) + product.price * quantity
+        return sum((rates.convert(amount, code, currency) for code, amount in subtotals.items()), 0.0)
+    
+    def lines(self) -> dict:
+        """
+        Return the cart's lines keyed by ``line_key``.
+        
+        Lines for the same product are combined into one entry.
+        
+        Returns:
+            dict: key -> (product, total quantity), in order of first appearance
+        """
+        lines = {}
+        for product, quantity in self.items:
+            key = line_key(product)
+            entry = lines.get(key)
+            lines[key] = (product, quantity) if entry is None else (entry[0], entry[1] + quantity)
+        return lines
+    
+    def _set_lines(self, lines):
+        """Replace the cart contents with (product, quantity) pairs."""
+        self.items = list(lines)
+    
+    def merge(self, other, rule="sum"):
+        """
+        Merge another cart into this one.
+        
+        Lines are matched by ``line_key``; repeated lines for one product are
+        combined first, so the merged cart has one line per product. Our lines
+        keep their order and products missing here are appended in the other
+        cart's order. Runs in O(len(self.items) + len(other.items)).
+        
+        Args:
+            other (ShoppingCart): The cart to merge in (left unchanged)
+            rule (str or callable, optional): Quantity for a product in both
+                carts: "sum" (default), "max", "keep" (ours) or "replace"
+                (theirs), or a function ``rule(ours, theirs) -> quantity``
+        
+        Raises:
+            ValueError: If ``rule`` is not a known rule name
+        
+        Example:
+            user_cart.merge(guest_cart, rule="max")
+        """
+        if callable(rule):
+            combine = rule
+        elif rule in MERGE_RULES:
+            combine = MERGE_RULES[rule]
+        else:
+            raise ValueError(f"Unknown merge rule {rule!r}; choose from {', '.join(MERGE_RULES)}")
+        merged = self.lines()
+        for key, (product, quantity) in other.lines().items():
+            ours = merged.get(key)
+            if ours is None or rule == "replace":
+                merged[key] = (product, quantity)
+            else:
+                merged[key] = (ours[0], combine(ours[1], quantity))
+        self._set_lines(line for line in merged.values() if line[1] > 0)
+    
+    def diff(self, other) -> list:
+        """
+        Describe how to turn this cart into another one.
+        
+        The diff is a compact list of ``(key, quantity)`` pairs: the new
+        total quantity for every product whose quantity differs, with 0 for
+        products that were removed. Keys are ``line_key`` strings, so diffs of
+        carts holding ISBN/SKU-keyed products can be sent to another node (as
+        JSON, for example).
+        
+        Args:
+            other (ShoppingCart): The target cart
+        
+        Returns:
+            list: (key, quantity) changes; empty if the carts hold the same
+                quantities
+        """
+        ours, theirs = self.lines(), other.lines()
+        changes = [
+            (key, quantity) for key, (_, quantity) in theirs.items()
+            if key not in ours or ours[key][1] != quantity
+        ]
+        changes.extend((key, 0) for key in ours if key not in theirs)
+        return changes
+    
+    def apply_diff(self, changes, products=None):
+        """
+        Apply a diff produced by ``diff``.
+        
+        Args:
+            changes: (key, quantity) pairs
+            products (dict, optional): key -> product for products not yet in
+                this cart, e.g. ``other.lines()`` or a catalog keyed by
+                ``line_key``; a mapping to (product, quantity) pairs is also
+                accepted
+        
+        Raises:
+            KeyError: If a change adds a product that ``products`` lacks
+        """
+        lines = self.lines()
+        for key, quantity in changes:
+            if quantity <= 0:
+                lines.pop(key, None)
+            elif key in lines:
+                lines[key] = (lines[key][0], quantity)
+            else:
+                if products is None or key not in products:
+                    raise KeyError(f"No product for cart line {key!r}")
+                product = products[key]
+                if isinstance(product, tuple):
+                    product = product[0]
+                lines[key] = (product, quantity)
+        self._set_lines(lines.values())
@@ -8,7 +8,7 @@ class Clothing(Product):
     Clothing may have seasonal or clearance discounts applied.
     """
     
-    def __init__(self, name: str, price: float, size: str):
+    def __init__(self, name: str, price: float, size: str, currency: str = None):
         """
         Initialize a Clothing item with name, price, and size.
         
@@ -16,9 +16,11 @@ class Clothing(Product):
             name (str): The name/description of the clothing item
             price (float): The price of the clothing item
             size (str): The size (e.g., 'S', 'M', 'L', 'XL', or numerical sizes)
+            currency (str, optional): ISO 4217 code of ``price``; defaults
+                to ``Product.currency``
         """
         # Call parent constructor to initialize name and price
-        super().__init__(name, price)
+        super().__init__(name, price, currency)
         
         # Store clothing-specific attribute
         self.size = size
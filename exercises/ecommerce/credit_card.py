@@ -8,19 +8,22 @@ class CreditCardPayment(Payment):
     Processes payments using a credit card, identified by the last 4 digits.
     """
     
-    def __init__(self, last4: str):
+    def __init__(self, last4: str, account_id: str = None):
         """
         Initialize a credit card payment method.
         
         Args:
             last4 (str): The last 4 digits of the credit card number
                         (e.g., "1234" for card ending in 1234)
+            account_id (str, optional): Identifier of the card account
+                        (e.g., a gateway token); unlike ``last4`` it is unique
         
         Note:
             In a real system, you would store encrypted card details and use
             a payment gateway. This is a simplified implementation for learning.
         """
         self.last4 = last4
+        self.account_id = account_id
     
     def process_payment(self, amount: float) -> bool:
         """
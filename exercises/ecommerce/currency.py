@@ -0,0 +1,188 @@
+"""
+Multi-currency prices, carts and catalogs.
+
+Every product has a ``currency`` (``Product.currency``, "USD" unless a
+subclass says otherwise or the product is created with ``currency=...``).
+A ``RateTable`` holds exchange rates against one base currency and converts
+between any two currencies.
+
+Conversions are cheap to repeat:
+
+- A ``RateTable`` has an ``epoch`` that increases whenever its rates change.
+  Cross rates (e.g. EUR -> GBP through the base) are computed once per epoch.
+- ``ShoppingCart.total_in`` sums each currency's lines first and converts
+  once per currency, not once per line. Cart totals are not cached: the
+  cart's ``items`` list and product prices can change in place, and
+  checking them costs as much as the one pass that computes the total.
+- ``CatalogPrices`` keeps a catalog's prices as a float column and converts
+  the whole column at once. Converted columns are cached and reused until
+  the rates' epoch changes or ``refresh`` is called after prices change.
+
+Example:
+    rates = RateTable("USD", {"EUR": 0.92, "GBP": 0.79})
+    cart.total_in("EUR", rates)
+    catalog = CatalogPrices(products)
+    catalog.prices_in("GBP", rates)  # array('d'), cached until rates change
+"""
+import array
+
+
+class RateTable:
+    """Exchange rates against a base currency, with cached cross rates."""
+
+    def __init__(self, base: str = "USD", rates=None):
+        """
+        Create a rate table.
+
+        Args:
+            base (str, optional): The base currency (rate 1.0)
+            rates (dict, optional): currency -> units of that currency per
+                one unit of ``base``, e.g. ``{"EUR": 0.92}``
+        """
+        self.base = base
+        self.epoch = 0
+        self._rates = {base: 1.0}
+        self._cross = {}
+        if rates:
+            self.update(rates)
+
+    def update(self, rates: dict):
+        """
+        Set several rates at once (one epoch change).
+
+        Args:
+            rates (dict): currency -> units per one unit of the base currency
+
+        Raises:
+            ValueError: If a rate is not positive or changes the base rate
+        """
+        for currency, rate in rates.items():
+            if not rate > 0:
+                raise ValueError(f"Rate for {currency} must be positive")
+            if currency == self.base and rate != 1.0:
+                raise ValueError(f"The base currency {currency} always has rate 1.0")
+        self._rates.update(rates)
+        self._cross.clear()
+        self.epoch += 1
+
+    def set_rate(self, currency: str, rate: float):
+        """Set one rate; see ``update``."""
+        self.update({currency: rate})
+
+    @property
+    def currencies(self) -> list:
+        """Sorted list of the currencies with a rate."""
+        return sorted(self._rates)
+
+    def rate(self, source: str, target: str) -> float:
+        """
+        Return the factor that converts amounts from ``source`` to ``target``.
+
+        Raises:
+            ValueError: If either currency has no rate
+        """
+        key = (source, target)
+        factor = self._cross.get(key)
+        if factor is None:
+            for currency in key:
+                if currency not in self._rates:
+                    raise ValueError(f"No exchange rate for {currency}")
+            factor = self._cross[key] = self._rates[target] / self._rates[source]
+        return factor
+
+    def convert(self, amount: float, source: str, target: str) -> float:
+        """
+        Convert one amount from ``source`` to ``target``.
+
+        Raises:
+            ValueError: If either currency has no rate (even when they match)
+        """
+        return amount * self.rate(source, target)
+
+    def convert_column(self, amounts, source: str, target: str) -> array.array:
+        """
+        Convert a column of amounts in one pass.
+
+        Args:
+            amounts: Iterable of floats (e.g. an ``array('d')``)
+            source (str): Currency of ``amounts``
+            target (str): Currency to convert to
+
+        Returns:
+            array.array: New ``'d'`` array of converted amounts
+
+        Raises:
+            ValueError: If either currency has no rate (even when they match)
+        """
+        factor = self.rate(source, target)
+        if source == target:
+            return array.array("d", amounts)
+        return array.array("d", map(factor.__mul__, amounts))
+
+
+class CatalogPrices:
+    """
+    Price column for a catalog, convertible to any currency.
+
+    Prices are read from the products when the catalog is built and on
+    ``refresh``; call ``refresh`` after changing prices in place (for example
+    with ``apply_discount``).
+    """
+
+    def __init__(self, products):
+        """
+        Build the price column.
+
+        Args:
+            products: Iterable of Product instances
+        """
+        self.products = list(products)
+        self.refresh()
+
+    def refresh(self):
+        """Re-read every price and drop the converted columns."""
+        self.prices = array.array("d", [product.price for product in self.products])
+        # currency -> row indices, so each currency is converted with one rate
+        self.groups = {}
+        for index, product in enumerate(self.products):
+            self.groups.setdefault(product.currency, []).append(index)
+        self._converted = {}
+
+    def __len__(self):
+        return len(self.products)
+
+    def prices_in(self, currency: str, rates: RateTable) -> array.array:
+        """
+        Return every price converted to ``currency``, in catalog order.
+
+        The column is cached and returned again (the same array) until the
+        rate table's epoch changes or ``refresh`` is called. Treat it as
+        read-only.
+
+        Args:
+            currency (str): Target currency
+            rates (RateTable): Exchange rates
+
+        Returns:
+            array.array: ``'d'`` array with one price per product
+
+        Raises:
+            ValueError: If a currency has no rate
+        """
+        cached = self._converted.get(currency)
+        if cached is not None and cached[0] is rates and cached[1] == rates.epoch:
+            return cached[2]
+        if len(self.groups) <= 1:
+            (source,) = self.groups or (currency,)
+            column = rates.convert_column(self.prices, source, currency)
+        else:
+            column = array.array("d", self.prices)
+            prices = self.prices
+            for source, indices in self.groups.items():
+                if source == currency:
+                    continue
+                factor = rates.rate(source, currency)
+                for index in indices:
+                    column[index] = prices[index] * factor
+        self._converted[currency] = (rates, rates.epoch, column)
+        return column
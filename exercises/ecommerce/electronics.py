@@ -8,7 +8,7 @@ class Electronics(Product):
     Electronics may have specific discount rules based on warranty coverage.
     """
     
-    def __init__(self, name: str, price: float, warranty_years: int = 1):
+    def __init__(self, name: str, price: float, warranty_years: int = 1, currency: str = None):
         """
         Initialize an Electronics product with name, price, and warranty.
         
@@ -16,9 +16,11 @@ class Electronics(Product):
             name (str): The name of the electronic device
             price (float): The price of the device
             warranty_years (int, optional): Warranty period in years (defaults to 1)
+            currency (str, optional): ISO 4217 code of ``price``; defaults
+                to ``Product.currency``
         """
         # Call parent constructor to initialize name and price
-        super().__init__(name, price)
+        super().__init__(name, price, currency)
         
         # Store electronics-specific attribute
         self.warranty_years = warranty_years
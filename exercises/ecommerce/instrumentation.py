@@ -0,0 +1,428 @@
+"""
+Hot-path instrumentation for the e-commerce classes.
+
+Counters and HDR-style latency histograms that can be attached to methods
+such as ``process_payment``, ``ShoppingCart.add``/``total`` and
+``apply_discount``, either with a decorator or by patching classes through a
+registry.
+
+Design notes:
+
+- Disabled means free: ``attach`` swaps a timing wrapper into the class and
+  ``detach`` puts the original method back, so detached methods run with no
+  overhead at all. Decorated functions check one attribute when the registry
+  is disabled.
+- No locks on the hot path: every thread writes to its own shard of a
+  metric (a ``threading.local`` slot). Shards are only combined when a
+  snapshot is taken; a lock is taken once per thread, when its shard is
+  created.
+- Histograms use log-linear buckets (like HdrHistogram): values below
+  ``2**precision_bits`` nanoseconds are exact, larger values keep
+  ``precision_bits`` significant bits (under 1% relative error for the
+  default of 7).
+- Snapshots export in the Prometheus text format, to a file (written
+  atomically, suitable for a textfile collector) or to a socket.
+
+Example:
+    registry = MetricsRegistry()
+    instrument_ecommerce(registry)
+    cart.total()
+    registry.write_file("metrics.prom")
+    registry.detach_all()
+"""
+import functools
+import os
+import socket
+import threading
+import time
+from collections import namedtuple
+
+from .book import Book
+from .cart import ShoppingCart
+from .clothing import Clothing
+from .credit_card import CreditCardPayment
+from .electronics import Electronics
+from .paypal import PayPalPayment
+
+DEFAULT_PRECISION_BITS = 7
+# Bucket boundaries (seconds) used when exporting histograms
+DEFAULT_EXPORT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+HistogramSnapshot = namedtuple("HistogramSnapshot", "counts count sum_ns")
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class _Sharded:
+    """Base for metrics with one shard per thread."""
+
+    def __init__(self, name: str, help_text: str, labels):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(sorted(labels.items())) if isinstance(labels, dict) else tuple(labels)
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def _all_shards(self) -> list:
+        with self._lock:
+            return list(self._shards)
+
+
+class Counter(_Sharded):
+    """A monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_shard(self):
+        return [0]
+
+    def inc(self, amount: int = 1):
+        """
+        Increase the counter.
+
+        Args:
+            amount (int, optional): Amount to add (defaults to 1)
+        """
+        self._shard()[0] += amount
+
+    def value(self) -> int:
+        """Return the total over all threads."""
+        return sum(shard[0] for shard in self._all_shards())
+
+    def samples(self):
+        """Yield (suffix, labels, value) Prometheus samples."""
+        yield "", self.labels, self.value()
+
+
+class Histogram(_Sharded):
+    """A latency histogram with log-linear (HDR-style) buckets in nanoseconds."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels=(), precision_bits: int = DEFAULT_PRECISION_BITS,
+                 export_buckets=DEFAULT_EXPORT_BUCKETS):
+        """
+        Create an empty histogram.
+
+        Args:
+            name (str): Metric name
+            help_text (str): Description for the export
+            labels (optional): Dict or sequence of (name, value) label pairs
+            precision_bits (int, optional): Significant bits kept per value
+            export_buckets (optional): Increasing ``le`` boundaries in seconds
+                for the Prometheus export
+        """
+        super().__init__(name, help_text, labels)
+        if precision_bits < 2:
+            raise ValueError("precision_bits must be at least 2")
+        self.precision_bits = precision_bits
+        self.export_buckets = tuple(export_buckets)
+
+    def _new_shard(self):
+        return [{}, 0, 0]  # bucket counts, count, sum of nanoseconds
+
+    def bucket_index(self, value_ns: int) -> int:
+        """Return the bucket index for a value in nanoseconds."""
+        bits = self.precision_bits
+        if value_ns < 1 << bits:
+            return max(0, value_ns)
+        shift = value_ns.bit_length() - bits
+        return (shift << (bits - 1)) + (value_ns >> shift)
+
+    def bucket_bounds(self, index: int) -> tuple:
+        """Return the [low, high) nanosecond range of a bucket."""
+        bits = self.precision_bits
+        if index < 1 << bits:
+            return index, index + 1
+        shift = (index >> (bits - 1)) - 1
+        mantissa = index - (shift << (bits - 1))
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def record_ns(self, value_ns: int):
+        """
+        Record one latency.
+
+        Args:
+            value_ns (int): Latency in nanoseconds
+        """
+        shard = getattr(self._local, "shard", None) or self._shard()
+        counts = shard[0]
+        index = self.bucket_index(value_ns)
+        counts[index] = counts.get(index, 0) + 1
+        shard[1] += 1
+        shard[2] += value_ns
+
+    def record(self, seconds: float):
+        """Record one latency given in seconds."""
+        self.record_ns(int(seconds * 1e9))
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge the per-thread shards into one snapshot."""
+        counts = {}
+        total = sum_ns = 0
+        for shard in self._all_shards():
+            for index, count in list(shard[0].items()):
+                counts[index] = counts.get(index, 0) + count
+            total += shard[1]
+            sum_ns += shard[2]
+        return HistogramSnapshot(counts, total, sum_ns)
+
+    def percentile(self, fraction: float, snapshot: HistogramSnapshot = None) -> float:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            fraction (float): Between 0 and 1, e.g. 0.99
+            snapshot (HistogramSnapshot, optional): Snapshot to use
+
+        Returns:
+            float: Latency in seconds (middle of the matching bucket); 0.0
+                when nothing was recorded
+        """
+        snapshot = snapshot or self.snapshot()
+        if not snapshot.count:
+            return 0.0
+        rank = max(1, round(fraction * snapshot.count))
+        seen = 0
+        for index in sorted(snapshot.counts):
+            seen += snapshot.counts[index]
+            if seen >= rank:
+                low, high = self.bucket_bounds(index)
+                return (low + high - 1) / 2 / 1e9
+
+    def samples(self):
+        """Yield (suffix, labels, value) Prometheus samples."""
+        snapshot = self.snapshot()
+        edges = [round(bound * 1e9) for bound in self.export_buckets]
+        cumulative = [0] * len(edges)
+        for index, count in snapshot.counts.items():
+            low, high = self.bucket_bounds(index)
+            middle = (low + high - 1) // 2
+            for position, edge in enumerate(edges):
+                if middle <= edge:
+                    cumulative[position] += count
+                    break
+        running = 0
+        for bound, count in zip(self.export_buckets, cumulative):
+            running += count
+            yield "_bucket", self.labels + (("le", repr(bound)),), running
+        yield "_bucket", self.labels + (("le", "+Inf"),), snapshot.count
+        yield "_sum", self.labels, snapshot.sum_ns / 1e9
+        yield "_count", self.labels, snapshot.count
+
+
+class MetricsRegistry:
+    """Owns metrics, attaches them to methods and exports snapshots."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Create an empty registry.
+
+        Args:
+            enabled (bool, optional): Whether decorated functions record
+        """
+        self.enabled = enabled
+        self._metrics = {}  # (name, labels) -> metric
+        self._attached = {}  # (class, method name) -> (original, was own attribute)
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labels, **options):
+        labels = tuple(sorted(labels.items())) if isinstance(labels, dict) else tuple(labels)
+        key = (name, labels)
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls(name, help_text, labels, **options)
+                    self._metrics[key] = metric
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name!r} is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help_text: str = "", labels=()) -> Counter:
+        """Return the counter with this name and labels, creating it if needed."""
+        return self._get(Counter, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", labels=(), **options) -> Histogram:
+        """Return the histogram with this name and labels, creating it if needed."""
+        return self._get(Histogram, name, help_text, labels, **options)
+
+    def metrics(self) -> list:
+        """Return every registered metric."""
+        with self._lock:
+            return list(self._metrics.values())
+
+    def _wrap(self, function, name, labels, check_enabled):
+        calls = self.counter(f"{name}_calls_total", f"Calls to {name}", labels)
+        errors = self.counter(f"{name}_errors_total", f"Calls to {name} that raised", labels)
+        latency = self.histogram(f"{name}_seconds", f"Latency of {name}", labels)
+        clock = time.perf_counter_ns
+        registry = self
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if check_enabled and not registry.enabled:
+                return function(*args, **kwargs)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                latency.record_ns(clock() - start)
+                calls.inc()
+
+        return wrapper
+
+    def instrumented(self, name: str, labels=()):
+        """
+        Decorator counting calls and recording the latency of a function.
+
+        When the registry is disabled the wrapper only checks
+        ``registry.enabled`` and calls through.
+
+        Args:
+            name (str): Metric name prefix, e.g. "checkout"
+            labels (optional): Dict or sequence of (name, value) label pairs
+
+        Returns:
+            callable: The decorator
+        """
+        def decorate(function):
+            return self._wrap(function, name, labels, check_enabled=True)
+        return decorate
+
+    def attach(self, cls, method: str, name: str = None):
+        """
+        Instrument a method of a class in place.
+
+        Metrics are labelled with ``class=<cls.__name__>``; the default name
+        is ``<module>_<method>`` with the last module component, e.g.
+        ``cart_total``.
+
+        Args:
+            cls (type): Class whose method is replaced
+            method (str): Method name
+            name (str, optional): Metric name prefix
+        """
+        key = (cls, method)
+        if key in self._attached:
+            return
+        original = getattr(cls, method)
+        own = method in cls.__dict__
+        name = name or f"{cls.__module__.rsplit('.', 1)[-1]}_{method}"
+        wrapper = self._wrap(original, name, {"class": cls.__name__}, check_enabled=False)
+        setattr(cls, method, wrapper)
+        self._attached[key] = (original, own)
+
+    def detach(self, cls, method: str):
+        """Restore a method instrumented with ``attach``."""
+        original, own = self._attached.pop((cls, method))
+        if own:
+            setattr(cls, method, original)
+        else:
+            delattr(cls, method)
+
+    def detach_all(self):
+        """Restore every attached method."""
+        for cls, method in list(self._attached):
+            self.detach(cls, method)
+
+    def export_text(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text
+        """
+        lines = []
+        described = set()
+        for metric in sorted(self.metrics(), key=lambda m: (m.name, m.labels)):
+            if metric.name not in described:
+                described.add(metric.name)
+                if metric.help:
+                    lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_file(self, path):
+        """
+        Write a snapshot to a file atomically (write to a temporary file, then rename).
+
+        Args:
+            path: Destination path, e.g. a node exporter textfile directory
+        """
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.export_text())
+        os.replace(temporary, path)
+
+    def send(self, address, timeout: float = 5.0):
+        """
+        Send a snapshot over a stream socket.
+
+        Args:
+            address: (host, port) for TCP, or a path string for a Unix socket
+            timeout (float, optional): Connection timeout in seconds
+        """
+        data = self.export_text().encode("utf-8")
+        if isinstance(address, (str, os.PathLike)):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(timeout)
+            try:
+                connection.connect(os.fspath(address))
+            except BaseException:
+                connection.close()
+                raise
+        else:
+            connection = socket.create_connection(address, timeout=timeout)
+        with connection:
+            connection.sendall(data)
+
+
+def instrument_ecommerce(registry: MetricsRegistry) -> MetricsRegistry:
+    """
+    Attach the registry to the e-commerce hot paths.
+
+    Instruments ``ShoppingCart.add``/``total``, ``apply_discount`` on every
+    product class and ``process_payment`` on every payment class. Call
+    ``registry.detach_all()`` to remove the instrumentation.
+
+    Args:
+        registry (MetricsRegistry): Where the metrics are recorded
+
+    Returns:
+        MetricsRegistry: The same registry
+    """
+    registry.attach(ShoppingCart, "add")
+    registry.attach(ShoppingCart, "total")
+    for cls in (Book, Electronics, Clothing):
+        registry.attach(cls, "apply_discount", "product_apply_discount")
+    for cls in (CreditCardPayment, PayPalPayment):
+        registry.attach(cls, "process_payment", "payment_process_payment")
+    return registry
@@ -0,0 +1,406 @@
+"""
+Append-only, crash-safe ledger of payment outcomes.
+
+Every ``process_payment`` result can be appended as a record to a directory
+of segment files. Records are never rewritten; a new segment is started when
+the current one reaches ``segment_bytes``.
+
+Durability without an fsync per payment: writers append under a lock and
+then wait for their record to become durable. The first waiter becomes the
+leader and calls ``fsync`` once for every record written so far, outside
+the lock, while later writers keep appending; when it finishes, every
+writer whose record was covered returns. Under concurrency one fsync
+commits a whole group of payments (group commit).
+
+Recovery: opening a ledger scans every segment, verifies each record's
+length and CRC-32 and rebuilds the in-memory index (transaction id ->
+segment and offset). A torn or corrupt record at the end of the newest
+segment - what a crash in the middle of a write leaves behind - is cut off;
+corruption anywhere else raises ``ValueError``. A segment is always fsynced
+before the next one is created, so older segments cannot have torn tails.
+
+Segment layout (little-endian):
+
+    header     magic b"PLDG", uint16 version, uint16 reserved,
+               uint64 segment number
+    records    uint32 payload length, uint32 CRC-32 of the payload, payload
+
+Payload: float64 amount, uint64 timestamp (ns since the epoch), uint8
+success flag, one pad byte, three uint16 lengths, then the UTF-8 transaction
+id, method and account.
+
+Example:
+    with PaymentLedger("ledger") as ledger:
+        ledger.record(CreditCardPayment("1234"), 25.0, "txn-1")
+        ledger.lookup("txn-1").success  # True
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+MAGIC = b"PLDG"
+VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sHHQ")
+RECORD_HEADER = struct.Struct("<II")
+ENTRY_FORMAT = struct.Struct("<dQ?xHHH")
+SEGMENT_SUFFIX = ".ledger"
+DEFAULT_SEGMENT_BYTES = 64 << 20
+MAX_TEXT_BYTES = 0xFFFF
+
+LedgerEntry = namedtuple("LedgerEntry", "txn_id amount success method account timestamp_ns")
+LedgerStats = namedtuple("LedgerStats", "records segments fsyncs")
+
+
+def encode_entry(entry: LedgerEntry) -> bytes:
+    """Return the full record (header and payload) for an entry."""
+    texts = [value.encode("utf-8") for value in (entry.txn_id, entry.method, entry.account)]
+    if any(len(text) > MAX_TEXT_BYTES for text in texts):
+        raise ValueError(f"Ledger text fields are limited to {MAX_TEXT_BYTES} bytes")
+    payload = ENTRY_FORMAT.pack(
+        entry.amount, entry.timestamp_ns, entry.success, *(len(text) for text in texts)
+    ) + b"".join(texts)
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_entry(payload: bytes) -> LedgerEntry:
+    """Decode a record payload written by ``encode_entry``."""
+    amount, timestamp_ns, success, *lengths = ENTRY_FORMAT.unpack_from(payload)
+    texts = []
+    offset = ENTRY_FORMAT.size
+    for length in lengths:
+        texts.append(payload[offset:offset + length].decode("utf-8"))
+        offset += length
+    if offset != len(payload):
+        raise ValueError("Ledger record has trailing bytes")
+    txn_id, method, account = texts
+    return LedgerEntry(txn_id, amount, success, method, account, timestamp_ns)
+
+
+def describe_method(method) -> tuple:
+    """Return (method name, account) for a payment method instance."""
+    if hasattr(method, "last4"):
+        return "card", method.last4
+    if hasattr(method, "email"):
+        return "paypal", method.email
+    return type(method).__name__, ""
+
+
+def _scan_segment(data: bytes) -> tuple:
+    """
+    Read the valid records of a segment.
+
+    Scanning stops at the first torn or corrupt record.
+
+    Returns:
+        tuple: ([(offset, LedgerEntry), ...], offset where valid data ends)
+    """
+    records = []
+    offset = SEGMENT_HEADER.size
+    end = len(data)
+    while offset + RECORD_HEADER.size <= end:
+        length, checksum = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        payload = data[start:start + length]
+        if length < ENTRY_FORMAT.size or len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        try:
+            entry = decode_entry(payload)
+        except (ValueError, UnicodeDecodeError):
+            break
+        records.append((offset, entry))
+        offset = start + length
+    return records, offset
+
+
+class PaymentLedger:
+    """
+    Append-only ledger of payment outcomes with group commit.
+
+    Safe to use from several threads; ``append`` and ``record`` return once
+    the record is durable (when ``durable`` is true).
+    """
+
+    def __init__(self, directory, segment_bytes: int = DEFAULT_SEGMENT_BYTES, durable: bool = True,
+                 group_commit: bool = True, commit_delay: float = 0.0):
+        """
+        Open (or create) a ledger and recover its index.
+
+        Args:
+            directory: Directory holding the segment files (created if needed)
+            segment_bytes (int, optional): Size at which a new segment starts
+            durable (bool, optional): Wait for fsync before returning from
+                ``append``; when false records reach the OS but may be lost
+                in a power failure
+            group_commit (bool, optional): Share fsyncs between concurrent
+                writers; when false every append does its own fsync
+            commit_delay (float, optional): Seconds a commit leader waits
+                before its fsync so more writers can join the group
+
+        Raises:
+            ValueError: If a segment other than the newest one is corrupt
+        """
+        self.directory = os.fspath(directory)
+        self.segment_bytes = segment_bytes
+        self.durable = durable
+        self.group_commit = group_commit
+        self.commit_delay = commit_delay
+        self._index = {}  # txn_id -> (segment number, offset)
+        self._readers = {}  # segment number -> read-only file descriptor
+        self._cond = threading.Condition()
+        self._written = 0  # records written to the OS
+        self._synced = 0  # records known to be on disk
+        self._syncing = False
+        self._fsyncs = 0
+        self._fd = None
+        os.makedirs(self.directory, exist_ok=True)
+        self._segments = self._recover()
+        if self._segments:
+            self._open_segment(self._segments[-1])
+        else:
+            self._create_segment(1)
+
+    # Segment files
+
+    def _path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{number:08d}{SEGMENT_SUFFIX}")
+
+    @property
+    def segments(self) -> list:
+        """Paths of the segment files, oldest first."""
+        return [self._path(number) for number in self._segments]
+
+    def _recover(self) -> list:
+        numbers = sorted(
+            int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit()
+        )
+        for position, number in enumerate(numbers):
+            newest = position == len(numbers) - 1
+            path = self._path(number)
+            with open(path, "rb") as handle:
+                data = handle.read()
+            if len(data) < SEGMENT_HEADER.size:
+                if not newest:
+                    raise ValueError(f"{path} is truncated")
+                # Crashed while creating the segment: start it again
+                self._write_header(path, number)
+                continue
+            magic, version, _, stored = SEGMENT_HEADER.unpack_from(data)
+            if magic != MAGIC or stored != number:
+                raise ValueError(f"{path} is not a ledger segment")
+            if version != VERSION:
+                raise ValueError(f"Unsupported ledger segment version {version}")
+            records, valid_end = _scan_segment(data)
+            for offset, entry in records:
+                self._index[entry.txn_id] = (number, offset)
+            if valid_end < len(data):
+                if not newest:
+                    raise ValueError(f"{path} is corrupt at offset {valid_end}")
+                with open(path, "r+b") as handle:
+                    handle.truncate(valid_end)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        return numbers
+
+    def _write_header(self, path: str, number: int):
+        with open(path, "wb") as handle:
+            handle.write(SEGMENT_HEADER.pack(MAGIC, VERSION, 0, number))
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._sync_directory()
+
+    def _sync_directory(self):
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _open_segment(self, number: int):
+        self._fd = os.open(self._path(number), os.O_WRONLY | os.O_APPEND)
+        self._size = os.fstat(self._fd).st_size
+        self._number = number
+
+    def _create_segment(self, number: int):
+        self._write_header(self._path(number), number)
+        self._segments.append(number)
+        self._open_segment(number)
+
+    def _rotate(self):
+        """
+        Start a new segment; called with the lock held and no fsync running.
+
+        The outgoing segment is always fsynced first, even when ``durable``
+        is false, so only the newest segment can ever have a torn tail.
+        """
+        os.fsync(self._fd)
+        self._fsyncs += 1
+        self._synced = self._written
+        self._cond.notify_all()
+        os.close(self._fd)
+        self._create_segment(self._number + 1)
+
+    # Writing
+
+    def append(self, txn_id: str, amount: float, success: bool, method: str = "", account: str = "",
+               timestamp_ns: int = None) -> LedgerEntry:
+        """
+        Append a payment outcome.
+
+        Args:
+            txn_id (str): Unique transaction id
+            amount (float): The amount charged
+            success (bool): Result of ``process_payment``
+            method (str, optional): Payment method name, e.g. "card"
+            account (str, optional): Card last4 or PayPal email
+            timestamp_ns (int, optional): Defaults to ``time.time_ns()``
+
+        Returns:
+            LedgerEntry: The entry written
+
+        Raises:
+            ValueError: If ``txn_id`` is already in the ledger
+        """
+        entry = LedgerEntry(
+            txn_id, float(amount), bool(success), method, account,
+            time.time_ns() if timestamp_ns is None else timestamp_ns,
+        )
+        record = encode_entry(entry)
+        with self._cond:
+            while True:
+                if self._fd is None:
+                    raise ValueError("Ledger is closed")
+                if txn_id in self._index:
+                    raise ValueError(f"Transaction {txn_id!r} is already recorded")
+                if self._size + len(record) <= self.segment_bytes or self._size <= SEGMENT_HEADER.size:
+                    break
+                if not self._syncing:
+                    self._rotate()
+                    break
+                # A leader is fsyncing the current segment outside the lock;
+                # wait, then check everything again (another writer may have
+                # rotated or recorded this transaction meanwhile)
+                self._cond.wait()
+            offset = self._size
+            os.write(self._fd, record)
+            self._size += len(record)
+            self._index[txn_id] = (self._number, offset)
+            self._written += 1
+            sequence = self._written
+            if self.durable:
+                self._wait_durable(sequence)
+        return entry
+
+    def _wait_durable(self, sequence: int):
+        """Block until record ``sequence`` is on disk; called with the lock held."""
+        if not self.group_commit:
+            os.fsync(self._fd)
+            self._fsyncs += 1
+            self._synced = self._written
+            return
+        while self._synced < sequence:
+            if self._syncing:
+                self._cond.wait()
+                continue
+            # Become the leader: fsync everything written so far
+            self._syncing = True
+            target = self._written
+            fd = self._fd
+            self._cond.release()
+            try:
+                if self.commit_delay:
+                    time.sleep(self.commit_delay)
+                    target = self._written  # followers that joined meanwhile
+                os.fsync(fd)
+            finally:
+                self._cond.acquire()
+                self._syncing = False
+                self._cond.notify_all()
+            self._synced = max(self._synced, target)
+            self._fsyncs += 1
+
+    def record(self, method, amount: float, txn_id: str) -> bool:
+        """
+        Process a payment and append its outcome.
+
+        Args:
+            method: A Payment instance (CreditCardPayment, PayPalPayment, ...)
+            amount (float): The amount to charge
+            txn_id (str): Unique transaction id
+
+        Returns:
+            bool: The result of ``method.process_payment(amount)``
+        """
+        success = method.process_payment(amount)
+        name, account = describe_method(method)
+        self.append(txn_id, amount, success, name, account)
+        return success
+
+    # Reading
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, txn_id):
+        return txn_id in self._index
+
+    def _reader(self, number: int) -> int:
+        fd = self._readers.get(number)
+        if fd is None:
+            fd = self._readers[number] = os.open(self._path(number), os.O_RDONLY)
+        return fd
+
+    def lookup(self, txn_id: str):
+        """
+        Return the entry for a transaction id, or None if it is not recorded.
+
+        Reads the one record from disk through the index.
+        """
+        location = self._index.get(txn_id)
+        if location is None:
+            return None
+        number, offset = location
+        fd = self._reader(number)
+        length, _ = RECORD_HEADER.unpack(os.pread(fd, RECORD_HEADER.size, offset))
+        return decode_entry(os.pread(fd, length, offset + RECORD_HEADER.size))
+
+    def __iter__(self):
+        """Yield every entry, oldest first."""
+        for number in list(self._segments):
+            with open(self._path(number), "rb") as handle:
+                data = handle.read()
+            for _, entry in _scan_segment(data)[0]:
+                yield entry
+
+    def stats(self) -> LedgerStats:
+        """Return the number of records, segments and fsyncs so far."""
+        return LedgerStats(len(self._index), len(self._segments), self._fsyncs)
+
+    # Lifetime
+
+    def close(self):
+        """Flush outstanding records and close every file."""
+        with self._cond:
+            if self._fd is None:
+                return
+            while self._syncing:
+                self._cond.wait()
+            if self.durable and self._synced < self._written:
+                os.fsync(self._fd)
+                self._fsyncs += 1
+                self._synced = self._written
+            os.close(self._fd)
+            self._fd = None
+        for fd in self._readers.values():
+            os.close(fd)
+        self._readers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
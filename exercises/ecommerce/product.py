@@ -8,16 +8,23 @@ class Product(ABC):
     must have. Subclasses must implement the apply_discount method.
     """
     
-    def __init__(self, name: str, price: float):
+    # ISO 4217 code of ``price``; override on a subclass or pass ``currency``
+    currency = "USD"
+    
+    def __init__(self, name: str, price: float, currency: str = None):
         """
         Initialize a Product with name and price.
         
         Args:
             name (str): The name of the product
             price (float): The base price of the product (must be non-negative)
+            currency (str, optional): ISO 4217 code of ``price``; defaults to
+                the class's ``currency``
         """
         self.name = name
         self.price = price
+        if currency is not None:
+            self.currency = currency
     
     @abstractmethod
     def apply_discount(self, percent: float) -> None:
@@ -0,0 +1,232 @@
+"""
+Bulk pre-authorization checks for pending payments.
+
+``PaymentValidator.validate`` takes a batch of ``(payment method, amount)``
+pairs and decides, before any ``process_payment`` call, which of them may
+reach the gateway. Checks run one column at a time over the whole batch
+rather than one payment at a time:
+
+1. amounts: must be above ``min_amount`` and at most ``max_amount``
+2. formats: PayPal emails and card ``last4`` values are matched against
+   precompiled patterns (``EMAIL_PATTERN``, ``LAST4_PATTERN``)
+3. velocity: per account (see ``account_key``), at most
+   ``max_per_account`` payments and ``max_amount_per_account`` in total are
+   accepted until ``reset_velocity`` is called (e.g. once per minute)
+
+Every rejected payment gets the reason code of the first check it failed.
+Only payments that passed every check count towards the velocity limits.
+
+Example:
+    validator = PaymentValidator(max_amount=5000.0, max_per_account=3)
+    report = validator.validate(pending)
+    results = process_accepted(pending, report)
+    print(format_report(report))
+"""
+import re
+import time
+from collections import Counter, namedtuple
+
+from .credit_card import CreditCardPayment
+from .paypal import PayPalPayment
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+")
+LAST4_PATTERN = re.compile(r"[0-9]{4}")
+
+# Reason codes
+INVALID_AMOUNT = "invalid_amount"
+AMOUNT_OVER_LIMIT = "amount_over_limit"
+INVALID_EMAIL = "invalid_email"
+INVALID_LAST4 = "invalid_last4"
+UNSUPPORTED_METHOD = "unsupported_method"
+VELOCITY_COUNT = "velocity_count"
+VELOCITY_AMOUNT = "velocity_amount"
+REASONS = (
+    INVALID_AMOUNT, AMOUNT_OVER_LIMIT, INVALID_EMAIL, INVALID_LAST4,
+    UNSUPPORTED_METHOD, VELOCITY_COUNT, VELOCITY_AMOUNT,
+)
+
+# reasons: one code per payment (None if accepted); accepted: indices of the
+# accepted payments; rejected: reason -> count; per_second: payments per second
+ValidationReport = namedtuple("ValidationReport", "reasons accepted rejected seconds per_second")
+
+
+def account_key(method) -> tuple:
+    """
+    Return the key that velocity limits are counted under.
+
+    Cards are keyed by ``account_id`` when they have one, otherwise by the
+    payment method object itself - never by ``last4`` alone, which only has
+    10,000 values and would make unrelated cards share one budget. PayPal
+    accounts are keyed by their (case-insensitive) email.
+
+    So two ``CreditCardPayment`` objects without an ``account_id`` never
+    share a velocity budget, even for the same card; only reusing the same
+    object does. Set ``account_id`` (or pass a custom ``key`` to
+    ``PaymentValidator``) when one card is represented by several objects.
+
+    Args:
+        method: A payment method instance
+
+    Returns:
+        tuple: A hashable key
+    """
+    if isinstance(method, CreditCardPayment):
+        account_id = getattr(method, "account_id", None)
+        return ("card", method if account_id is None else account_id)
+    if isinstance(method, PayPalPayment):
+        return ("paypal", method.email.lower())
+    return ("other", method)
+
+
+def _account_columns(methods) -> tuple:
+    """Split methods into (card indices, last4s, PayPal indices, emails, other indices)."""
+    cards, last4s, paypal, emails, other = [], [], [], [], []
+    for index, method in enumerate(methods):
+        if isinstance(method, CreditCardPayment):
+            cards.append(index)
+            last4s.append(method.last4)
+        elif isinstance(method, PayPalPayment):
+            paypal.append(index)
+            emails.append(method.email)
+        else:
+            other.append(index)
+    return cards, last4s, paypal, emails, other
+
+
+class PaymentValidator:
+    """Column-wise validation of payment batches with per-account velocity."""
+
+    def __init__(self, min_amount: float = 0.0, max_amount: float = 10_000.0, max_per_account: int = None,
+                 max_amount_per_account: float = None, registry=None, key=account_key):
+        """
+        Configure the checks.
+
+        Args:
+            min_amount (float, optional): Amounts must be greater than this
+                (0.0, as in ``process_payment``)
+            max_amount (float, optional): Largest amount accepted
+            max_per_account (int, optional): Payments accepted per account
+                until ``reset_velocity``; None for no limit
+            max_amount_per_account (float, optional): Total amount accepted
+                per account until ``reset_velocity``; None for no limit
+            registry (optional): An ``instrumentation.MetricsRegistry``;
+                when given, ``payment_validation_total`` counters (labelled
+                by result) are incremented for every batch
+            key (callable, optional): ``key(method)`` -> hashable account
+                key for the velocity limits; defaults to ``account_key``
+        """
+        self.min_amount = min_amount
+        self.max_amount = max_amount
+        self.max_per_account = max_per_account
+        self.max_amount_per_account = max_amount_per_account
+        self.registry = registry
+        self.key = key
+        self._counts = {}  # account -> payments accepted
+        self._totals = {}  # account -> amount accepted
+
+    def reset_velocity(self):
+        """Forget the per-account counts and totals (start a new window)."""
+        self._counts.clear()
+        self._totals.clear()
+
+    def validate(self, payments) -> ValidationReport:
+        """
+        Validate a batch of payments.
+
+        Args:
+            payments: Iterable of (payment method, amount) pairs
+
+        Returns:
+            ValidationReport: Per-payment reason codes, accepted indices,
+                rejection counts and throughput
+        """
+        start = time.perf_counter()
+        payments = list(payments)
+        methods = [method for method, _ in payments]
+        amounts = [amount for _, amount in payments]
+
+        # 1. Amounts, over the whole column
+        low, high = self.min_amount, self.max_amount
+        reasons = [
+            INVALID_AMOUNT if not amount > low else AMOUNT_OVER_LIMIT if amount > high else None
+            for amount in amounts
+        ]
+
+        # 2. Formats, one column per method type
+        cards, last4s, paypal, emails, other = _account_columns(methods)
+        for indices, values, pattern, reason in (
+            (cards, last4s, LAST4_PATTERN, INVALID_LAST4),
+            (paypal, emails, EMAIL_PATTERN, INVALID_EMAIL),
+        ):
+            for index, match in zip(indices, map(pattern.fullmatch, values)):
+                if match is None and reasons[index] is None:
+                    reasons[index] = reason
+        for index in other:
+            if reasons[index] is None:
+                reasons[index] = UNSUPPORTED_METHOD
+
+        # 3. Velocity, in batch order, for payments that passed so far
+        key = self.key
+        accepted = []
+        counts, totals = self._counts, self._totals
+        max_count, max_total = self.max_per_account, self.max_amount_per_account
+        for index, reason in enumerate(reasons):
+            if reason is not None:
+                continue
+            account, amount = key(methods[index]), amounts[index]
+            count = counts.get(account, 0)
+            total = totals.get(account, 0.0)
+            if max_count is not None and count >= max_count:
+                reasons[index] = VELOCITY_COUNT
+            elif max_total is not None and total + amount > max_total:
+                reasons[index] = VELOCITY_AMOUNT
+            else:
+                counts[account] = count + 1
+                totals[account] = total + amount
+                accepted.append(index)
+
+        rejected = Counter(reason for reason in reasons if reason is not None)
+        seconds = time.perf_counter() - start
+        if self.registry is not None:
+            self._record_metrics(len(accepted), rejected)
+        per_second = len(reasons) / seconds if seconds > 0 else 0.0
+        return ValidationReport(reasons, accepted, dict(rejected), seconds, per_second)
+
+    def _record_metrics(self, accepted: int, rejected: Counter):
+        help_text = "Payments checked by the bulk validator"
+        self.registry.counter("payment_validation_total", help_text, {"result": "accepted"}).inc(accepted)
+        for reason, count in rejected.items():
+            self.registry.counter("payment_validation_total", help_text, {"result": reason}).inc(count)
+
+
+def process_accepted(payments, report: ValidationReport) -> list:
+    """
+    Call ``process_payment`` for the accepted payments only.
+
+    Args:
+        payments: The batch passed to ``PaymentValidator.validate`` (as a
+            sequence, since payments are looked up by position)
+        report (ValidationReport): Its validation report
+
+    Returns:
+        list: ``process_payment`` results by batch position; None for
+            rejected payments, which never reach the gateway
+    """
+    results = [None] * len(payments)
+    for index in report.accepted:
+        method, amount = payments[index]
+        results[index] = method.process_payment(amount)
+    return results
+
+
+def format_report(report: ValidationReport) -> str:
+    """Render a report as a short text summary."""
+    total = len(report.reasons)
+    lines = [
+        f"{total:,} payments in {report.seconds * 1e3:.2f} ms ({report.per_second:,.0f}/s): "
+        f"{len(report.accepted):,} accepted, {total - len(report.accepted):,} rejected"
+    ]
+    for reason in REASONS:
+        if reason in report.rejected:
+            lines.append(f"  {reason:<20} {report.rejected[reason]:>10,}")
+    return "\n".join(lines)
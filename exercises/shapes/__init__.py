@@ -0,0 +1,25 @@
+"""
+Shapes exercise: the ``Shape`` hierarchy and the bulk shape tools.
+
+The names below are imported on first attribute access (PEP 562), so a
+worker that only needs ``Circle`` never loads the packing or mesh code.
+"""
+from lazy_imports import make_lazy
+
+# Public name -> module it lives in, relative to this package
+_EXPORTS = {
+    "Shape": ".shape",
+    "Circle": ".circle",
+    "Rectangle": ".rectangle",
+    "Triangle": ".triangle",
+    "ShapeColumns": ".columnar",
+    "ColumnarShapeFile": ".columnar",
+    "ShapeFactory": ".factory",
+    "MeshReader": ".mesh",
+    "ParallelAggregator": ".parallel",
+    "RectanglePacker": ".packing",
+    "estimate_union_area": ".coverage",
+}
+
+__all__ = sorted(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
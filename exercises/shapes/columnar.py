@@ -0,0 +1,466 @@
+"""
+Columnar storage for shape collections.
+
+Instead of one Python object per shape, a ``ShapeColumns`` keeps one float
+column per constructor argument for each kind of shape (e.g. all circle radii
+side by side). Area and perimeter can then be computed a whole column at a
+time, and the columns can be written to (and memory-mapped back from) a
+compact binary file.
+
+The column kernels only pay off on data that is already columnar and where
+input order does not matter (totals, per-kind results). Grouping a mixed
+list of shape objects into columns and scattering the results back costs
+more than calling ``area()`` on each object, so there is no bulk dispatcher
+for object lists.
+
+File layout (all values little-endian):
+
+    magic      4 bytes   b"SHPC"
+    version    uint16
+    kinds      uint16    number of kind entries that follow
+    entries    kinds * (16-byte kind name, uint64 row count, uint64 offset)
+    columns    float64 data; each kind's columns are stored one after another
+               starting at its offset, every column ``count`` values long
+
+Triangles without ``side_a``/``side_b`` store NaN in those columns.
+"""
+import array
+import math
+import mmap
+import operator
+import struct
+import sys
+
+from .circle import Circle
+from .rectangle import Rectangle
+from .triangle import Triangle
+
+MAGIC = b"SHPC"
+VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHH")
+ENTRY_FORMAT = struct.Struct("<16sQQ")
+
+# Columns per kind, in the same order as the class constructor arguments
+KIND_COLUMNS = {
+    "circle": ("radius",),
+    "rectangle": ("width", "height"),
+    "triangle": ("base", "height", "side_a", "side_b"),
+}
+KIND_CLASSES = {
+    "circle": Circle,
+    "rectangle": Rectangle,
+    "triangle": Triangle,
+}
+CLASS_KINDS = {cls: kind for kind, cls in KIND_CLASSES.items()}
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def kind_of(shape) -> str:
+    """
+    Return the column kind name for a shape instance.
+
+    Args:
+        shape: A Circle, Rectangle or Triangle (or a subclass of one)
+
+    Returns:
+        str: One of the keys of ``KIND_COLUMNS``
+
+    Raises:
+        TypeError: If the shape is not one of the supported classes
+    """
+    kind = CLASS_KINDS.get(type(shape))
+    if kind is not None:
+        return kind
+    for cls, kind in CLASS_KINDS.items():
+        if isinstance(shape, cls):
+            return kind
+    raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+
+
+def _none_to_nan(value):
+    return math.nan if value is None else value
+
+
+def _nan_to_none(value):
+    return None if math.isnan(value) else value
+
+
+# Column kernels: each takes a dict of columns and returns a list of results.
+# map()/zip() over the columns keeps the per-row loop inside C where possible.
+
+def circle_areas(columns) -> list:
+    pi = math.pi
+    return [pi * r * r for r in columns["radius"]]
+
+
+def circle_perimeters(columns) -> list:
+    tau = 2 * math.pi
+    return [tau * r for r in columns["radius"]]
+
+
+def rectangle_areas(columns) -> list:
+    return list(map(operator.mul, columns["width"], columns["height"]))
+
+
+def rectangle_perimeters(columns) -> list:
+    return [2 * (w + h) for w, h in zip(columns["width"], columns["height"])]
+
+
+def triangle_areas(columns) -> list:
+    return [0.5 * b * h for b, h in zip(columns["base"], columns["height"])]
+
+
+def triangle_perimeters(columns) -> list:
+    # NaN sides propagate, so rows without all three sides come out as NaN
+    return [b + a + c for b, a, c in zip(columns["base"], columns["side_a"], columns["side_b"])]
+
+
+AREA_KERNELS = {
+    "circle": circle_areas,
+    "rectangle": rectangle_areas,
+    "triangle": triangle_areas,
+}
+PERIMETER_KERNELS = {
+    "circle": circle_perimeters,
+    "rectangle": rectangle_perimeters,
+    "triangle": triangle_perimeters,
+}
+
+
+class ShapeColumns:
+    """
+    A collection of shapes stored as typed float columns per kind.
+
+    Columns may be ``array.array('d')`` objects (when built in memory) or
+    read-only ``memoryview`` slices (when mapped from a file); the kernels
+    only need them to be iterable sequences of floats.
+    """
+
+    def __init__(self, columns: dict = None):
+        """
+        Initialize from a mapping of kind -> {column name -> sequence}.
+
+        Args:
+            columns (dict, optional): Existing columns; missing kinds start empty
+
+        Raises:
+            ValueError: If a kind is unknown or its columns differ in length
+        """
+        self.columns = {}
+        for kind, names in KIND_COLUMNS.items():
+            given = (columns or {}).get(kind)
+            if given is None:
+                self.columns[kind] = {name: array.array("d") for name in names}
+                continue
+            lengths = {len(given[name]) for name in names}
+            if len(lengths) > 1:
+                raise ValueError(f"Columns for {kind} have different lengths")
+            self.columns[kind] = {name: given[name] for name in names}
+        unknown = set(columns or {}) - set(KIND_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown shape kinds: {sorted(unknown)}")
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """
+        Build columns from an iterable of shape objects.
+
+        Args:
+            shapes: Iterable of Circle, Rectangle and Triangle instances
+
+        Returns:
+            ShapeColumns: The shapes split into per-kind columns
+        """
+        result = cls()
+        for shape in shapes:
+            kind = kind_of(shape)
+            for name, column in result.columns[kind].items():
+                column.append(_none_to_nan(getattr(shape, name)))
+        return result
+
+    def kinds(self) -> list:
+        """Return the kinds that have at least one row."""
+        return [kind for kind in KIND_COLUMNS if self.count(kind)]
+
+    def count(self, kind: str) -> int:
+        """
+        Return the number of rows stored for a kind.
+
+        Args:
+            kind (str): Shape kind name
+
+        Returns:
+            int: Row count
+        """
+        first = KIND_COLUMNS[kind][0]
+        return len(self.columns[kind][first])
+
+    def __len__(self) -> int:
+        return sum(self.count(kind) for kind in KIND_COLUMNS)
+
+    def column(self, kind: str, name: str):
+        """Return one column (a sequence of floats)."""
+        return self.columns[kind][name]
+
+    def select(self, kind: str = None, start: int = 0, stop: int = None):
+        """
+        Return a view restricted to one kind and/or a row range.
+
+        Slicing a memoryview column does not copy, so selecting from a mapped
+        file stays zero-copy.
+
+        Args:
+            kind (str, optional): Keep only this kind
+            start (int, optional): First row (per kind)
+            stop (int, optional): One past the last row (per kind)
+
+        Returns:
+            ShapeColumns: The selected rows
+        """
+        kinds = KIND_COLUMNS if kind is None else (kind,)
+        selected = {}
+        for name in kinds:
+            selected[name] = {
+                col: values[start:stop]
+                for col, values in self.columns[name].items()
+            }
+        return ShapeColumns(selected)
+
+    def areas(self, kind: str) -> list:
+        """
+        Calculate the area of every row of one kind.
+
+        Args:
+            kind (str): Shape kind name
+
+        Returns:
+            list: Areas in row order
+        """
+        return AREA_KERNELS[kind](self.columns[kind])
+
+    def perimeters(self, kind: str) -> list:
+        """
+        Calculate the perimeter of every row of one kind.
+
+        Triangles without all three sides yield NaN rather than raising.
+
+        Args:
+            kind (str): Shape kind name
+
+        Returns:
+            list: Perimeters in row order
+        """
+        return PERIMETER_KERNELS[kind](self.columns[kind])
+
+    def total_area(self) -> float:
+        """
+        Calculate the combined area of every shape.
+
+        Returns:
+            float: Sum of all areas
+        """
+        return math.fsum(math.fsum(self.areas(kind)) for kind in self.kinds())
+
+    def total_perimeter(self) -> float:
+        """
+        Calculate the combined perimeter of every shape.
+
+        Returns:
+            float: Sum of all perimeters
+
+        Raises:
+            NotImplementedError: If any triangle is missing side lengths,
+                matching ``Triangle.perimeter()``
+        """
+        total = 0.0
+        for kind in self.kinds():
+            subtotal = math.fsum(self.perimeters(kind))
+            if math.isnan(subtotal):
+                raise NotImplementedError(
+                    "Cannot calculate perimeter without all three side lengths"
+                )
+            total += subtotal
+        return total
+
+    def to_shapes(self, kind: str) -> list:
+        """
+        Rebuild shape objects for one kind.
+
+        Args:
+            kind (str): Shape kind name
+
+        Returns:
+            list: New shape instances in row order
+        """
+        cls = KIND_CLASSES[kind]
+        columns = [self.columns[kind][name] for name in KIND_COLUMNS[kind]]
+        if kind == "triangle":
+            return [
+                cls(base, height, _nan_to_none(a), _nan_to_none(b))
+                for base, height, a, b in zip(*columns)
+            ]
+        return [cls(*row) for row in zip(*columns)]
+
+
+def write_columns(path, columns: ShapeColumns):
+    """
+    Write shape columns to a columnar binary file.
+
+    Args:
+        path: Destination file path
+        columns (ShapeColumns): The data to write
+    """
+    kinds = list(KIND_COLUMNS)
+    offset = HEADER_FORMAT.size + ENTRY_FORMAT.size * len(kinds)
+    with open(path, "wb") as handle:
+        handle.write(HEADER_FORMAT.pack(MAGIC, VERSION, len(kinds)))
+        for kind in kinds:
+            count = columns.count(kind)
+            handle.write(ENTRY_FORMAT.pack(kind.encode("ascii"), count, offset))
+            offset += count * 8 * len(KIND_COLUMNS[kind])
+        for kind in kinds:
+            for name in KIND_COLUMNS[kind]:
+                values = columns.column(kind, name)
+                if not isinstance(values, array.array):
+                    values = array.array("d", values)
+                if not _NATIVE_LITTLE_ENDIAN:
+                    values = array.array("d", values)
+                    values.byteswap()
+                values.tofile(handle)
+
+
+def write_shapes(path, shapes):
+    """
+    Write shape objects to a columnar binary file.
+
+    Args:
+        path: Destination file path
+        shapes: Iterable of Circle, Rectangle and Triangle instances
+    """
+    write_columns(path, ShapeColumns.from_shapes(shapes))
+
+
+class ColumnarShapeFile:
+    """
+    Memory-mapped reader for columnar shape files.
+
+    Columns are exposed as read-only ``memoryview`` objects over the mapping,
+    so nothing is copied until a kernel actually iterates the values.
+
+    Example:
+        with ColumnarShapeFile("shapes.shpc") as data:
+            data.read("circle", 0, 1000).total_area()
+    """
+
+    def __init__(self, path):
+        """
+        Open and map a columnar shape file.
+
+        Args:
+            path: Path to a file written by ``write_columns``
+
+        Raises:
+            ValueError: If the file is not a valid columnar shape file
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a columnar shape file")
+        self._view = memoryview(self._map)
+        try:
+            self.counts, self._offsets = self._read_header()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _read_header(self):
+        magic, version, kinds = HEADER_FORMAT.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a columnar shape file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported columnar shape file version {version}")
+
+        counts, offsets = {}, {}
+        position = HEADER_FORMAT.size
+        for _ in range(kinds):
+            name, count, offset = ENTRY_FORMAT.unpack_from(self._map, position)
+            position += ENTRY_FORMAT.size
+            kind = name.rstrip(b"\0").decode("ascii")
+            if kind not in KIND_COLUMNS:
+                raise ValueError(f"Unknown shape kind {kind!r} in {self.path}")
+            end = offset + count * 8 * len(KIND_COLUMNS[kind])
+            if end > len(self._map):
+                raise ValueError(f"{self.path} is truncated")
+            counts[kind] = count
+            offsets[kind] = offset
+        return counts, offsets
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Release the mapping.
+
+        If column views handed out by ``column``/``read`` are still alive the
+        mapping stays open until they are garbage collected.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def column(self, kind: str, name: str, start: int = 0, stop: int = None):
+        """
+        Return a zero-copy view of one column.
+
+        Args:
+            kind (str): Shape kind name
+            name (str): Column name (see ``KIND_COLUMNS``)
+            start (int, optional): First row
+            stop (int, optional): One past the last row
+
+        Returns:
+            memoryview or array.array: Float64 values for the row range
+                (an array copy only on big-endian hosts)
+        """
+        count = self.counts.get(kind, 0)
+        start, stop, _ = slice(start, stop).indices(count)
+        stop = max(start, stop)
+        index = KIND_COLUMNS[kind].index(name)
+        begin = self._offsets.get(kind, 0) + (index * count + start) * 8
+        raw = self._view[begin:begin + (stop - start) * 8]
+        if _NATIVE_LITTLE_ENDIAN:
+            return raw.cast("d")
+        values = array.array("d", raw.tobytes())
+        values.byteswap()
+        return values
+
+    def read(self, kind: str = None, start: int = 0, stop: int = None) -> ShapeColumns:
+        """
+        Return selected rows as ``ShapeColumns`` backed by the mapping.
+
+        Args:
+            kind (str, optional): Only read this kind
+            start (int, optional): First row (per kind)
+            stop (int, optional): One past the last row (per kind)
+
+        Returns:
+            ShapeColumns: Column views for the selection
+        """
+        kinds = KIND_COLUMNS if kind is None else (kind,)
+        return ShapeColumns({
+            name: {col: self.column(name, col, start, stop) for col in KIND_COLUMNS[name]}
+            for name in kinds
+        })
@@ -0,0 +1,219 @@
+"""
+Monte Carlo estimation of the area covered by overlapping shapes.
+
+Summing ``Shape.area()`` counts overlapping regions more than once. The
+estimator here samples random points inside the bounding box of all shapes
+and counts how many land inside at least one shape. Shapes are bucketed into
+a uniform grid first, so each point is only tested against the few shapes
+that share its grid cell.
+
+Sampling runs in batches; after each round the standard error of the
+estimate is checked and sampling stops as soon as the requested precision
+is reached.
+"""
+import math
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .columnar import kind_of
+
+Placement = namedtuple("Placement", "shape x y")
+Placement.__doc__ = """
+A shape positioned in the plane.
+
+- Circle: (x, y) is the centre
+- Rectangle: (x, y) is the lower-left corner
+- Triangle: the base runs from (x, y) to (x + base, y) and the apex sits
+  ``height`` above the middle of the base
+"""
+
+CoverageEstimate = namedtuple("CoverageEstimate", "area std_error samples converged")
+
+CIRCLE, RECTANGLE, TRIANGLE = 0, 1, 2
+
+# Each worker process receives its own copy of the grid at start-up
+_WORKER_GRID = None
+
+
+def _record(placement):
+    """Convert a placement into a plain tuple plus its bounding box."""
+    shape, x, y = placement
+    kind = kind_of(shape)
+    if kind == "circle":
+        r = shape.radius
+        return (CIRCLE, x, y, r * r), (x - r, y - r, x + r, y + r)
+    if kind == "rectangle":
+        return (RECTANGLE, x, y, x + shape.width, y + shape.height), (
+            x, y, x + shape.width, y + shape.height)
+    half = shape.base / 2
+    return (TRIANGLE, x + half, y, half, shape.height), (
+        x, y, x + shape.base, y + shape.height)
+
+
+def _contains(record, px, py):
+    kind = record[0]
+    if kind == CIRCLE:
+        dx = px - record[1]
+        dy = py - record[2]
+        return dx * dx + dy * dy <= record[3]
+    if kind == RECTANGLE:
+        return record[1] <= px <= record[3] and record[2] <= py <= record[4]
+    _, mid_x, base_y, half, height = record
+    if height <= 0:
+        return False
+    level = (py - base_y) / height
+    if not 0.0 <= level <= 1.0:
+        return False
+    # The triangle narrows linearly from the base to the apex
+    return abs(px - mid_x) <= half * (1.0 - level)
+
+
+class _Grid:
+    """Uniform grid mapping cells to the shapes whose bounding box touches them."""
+
+    def __init__(self, records, boxes, cells_per_shape=1.0):
+        self.min_x = min(box[0] for box in boxes)
+        self.min_y = min(box[1] for box in boxes)
+        self.max_x = max(box[2] for box in boxes)
+        self.max_y = max(box[3] for box in boxes)
+        width = max(self.max_x - self.min_x, 1e-12)
+        height = max(self.max_y - self.min_y, 1e-12)
+
+        # Roughly one cell per shape, keeping cells close to square
+        cells = max(1, int(len(records) * cells_per_shape))
+        self.cell = math.sqrt(width * height / cells)
+        self.cols = max(1, math.ceil(width / self.cell))
+        self.rows = max(1, math.ceil(height / self.cell))
+
+        buckets = {}
+        for record, (x0, y0, x1, y1) in zip(records, boxes):
+            c0, r0 = self._cell_of(x0, y0)
+            c1, r1 = self._cell_of(x1, y1)
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    buckets.setdefault(row * self.cols + col, []).append(record)
+        self.buckets = buckets
+
+    @property
+    def area(self) -> float:
+        return (self.max_x - self.min_x) * (self.max_y - self.min_y)
+
+    def _cell_of(self, x, y):
+        col = min(self.cols - 1, max(0, int((x - self.min_x) / self.cell)))
+        row = min(self.rows - 1, max(0, int((y - self.min_y) / self.cell)))
+        return col, row
+
+    def sample(self, count, seed) -> int:
+        """Return how many of ``count`` random points hit any shape."""
+        rng = random.Random(seed)
+        uniform = rng.uniform
+        buckets = self.buckets
+        cell, cols = self.cell, self.cols
+        min_x, min_y, max_x, max_y = self.min_x, self.min_y, self.max_x, self.max_y
+        last_col, last_row = self.cols - 1, self.rows - 1
+        hits = 0
+        for _ in range(count):
+            px = uniform(min_x, max_x)
+            py = uniform(min_y, max_y)
+            col = min(last_col, int((px - min_x) / cell))
+            row = min(last_row, int((py - min_y) / cell))
+            for record in buckets.get(row * cols + col, ()):
+                if _contains(record, px, py):
+                    hits += 1
+                    break
+        return hits
+
+
+def _init_worker(grid):
+    global _WORKER_GRID
+    _WORKER_GRID = grid
+
+
+def _sample_task(count, seed):
+    return _WORKER_GRID.sample(count, seed)
+
+
+def _batch_seed(seed, batch):
+    return seed * 1_000_003 + batch
+
+
+def estimate_union_area(
+    placements,
+    abs_tolerance: float = 0.0,
+    rel_tolerance: float = 0.01,
+    confidence_z: float = 1.96,
+    batch_size: int = 20000,
+    max_samples: int = 10_000_000,
+    seed: int = 0,
+    workers: int = 1,
+) -> CoverageEstimate:
+    """
+    Estimate the area covered by the union of positioned shapes.
+
+    Sampling stops once ``confidence_z * std_error`` is within
+    ``max(abs_tolerance, rel_tolerance * estimate)`` or after ``max_samples``
+    points. Batches use seeds derived from ``seed`` and their batch number,
+    so the result is reproducible for a given seed and worker count.
+
+    Args:
+        placements: Iterable of Placement(shape, x, y)
+        abs_tolerance (float, optional): Acceptable absolute error
+        rel_tolerance (float, optional): Acceptable error relative to the estimate
+        confidence_z (float, optional): z-score for the error bound (1.96 ~ 95%)
+        batch_size (int, optional): Points per batch
+        max_samples (int, optional): Hard limit on points sampled
+        seed (int, optional): Base random seed
+        workers (int, optional): Processes to sample with (None for CPU count)
+
+    Returns:
+        CoverageEstimate: area, std_error, samples and whether the precision
+            target was reached
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    pairs = [_record(placement) for placement in placements]
+    if not pairs:
+        return CoverageEstimate(0.0, 0.0, 0, True)
+    grid = _Grid([record for record, _ in pairs], [box for _, box in pairs])
+    box_area = grid.area
+    if box_area == 0.0:
+        return CoverageEstimate(0.0, 0.0, 0, True)
+
+    workers = workers or os.cpu_count() or 1
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(grid,))
+
+    hits = samples = batch = 0
+    area = std_error = 0.0
+    try:
+        while samples < max_samples:
+            # One round is one batch per worker
+            round_sizes = []
+            for _ in range(workers):
+                size = min(batch_size, max_samples - samples - sum(round_sizes))
+                if size <= 0:
+                    break
+                round_sizes.append(size)
+            seeds = [_batch_seed(seed, batch + i) for i in range(len(round_sizes))]
+            batch += len(round_sizes)
+            if pool is None:
+                hits += sum(grid.sample(n, s) for n, s in zip(round_sizes, seeds))
+            else:
+                hits += sum(pool.map(_sample_task, round_sizes, seeds))
+            samples += sum(round_sizes)
+
+            fraction = hits / samples
+            area = box_area * fraction
+            std_error = box_area * math.sqrt(fraction * (1.0 - fraction) / samples)
+            target = max(abs_tolerance, rel_tolerance * area)
+            # A lone all-miss or all-hit batch has zero variance; insist on a
+            # second batch before trusting it
+            if batch > 1 and confidence_z * std_error <= target:
+                return CoverageEstimate(area, std_error, samples, True)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return CoverageEstimate(area, std_error, samples, False)
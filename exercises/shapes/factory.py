@@ -0,0 +1,282 @@
+"""
+Batch shape factory.
+
+Decodes batches of records (dicts, tuples or JSON lines) into shape objects
+or into a ``ShapeColumns`` in a single pass. Kind dispatch is a dictionary
+lookup prepared at registration time, and validation runs over whole
+columns after decoding instead of inside every constructor call.
+
+Record formats:
+
+- dict: ``{"kind": "circle", "radius": 2.0}``
+- tuple/list: ``("rectangle", 3.0, 4.0)`` with values in field order
+- JSON line: a dict record encoded as one line of JSON
+"""
+import array
+import json
+import math
+
+from .circle import Circle
+from .columnar import KIND_COLUMNS, ShapeColumns
+from .rectangle import Rectangle
+from .triangle import Triangle
+
+
+def triangle_inequality(columns) -> list:
+    """
+    Return rows whose three sides cannot form a triangle.
+
+    Rows without ``side_a``/``side_b`` (NaN) are not checked.
+
+    Args:
+        columns (dict): Triangle columns
+
+    Returns:
+        list: Offending row numbers
+    """
+    bad = []
+    rows = zip(columns["base"], columns["side_a"], columns["side_b"])
+    for row, (base, a, b) in enumerate(rows):
+        if a != a or b != b:  # NaN: sides not given
+            continue
+        if a + b <= base or a + base <= b or b + base <= a:
+            bad.append(row)
+    return bad
+
+
+class _Kind:
+    """Precomputed decoding information for one registered kind."""
+
+    __slots__ = ("name", "cls", "fields", "required", "check", "fast")
+
+    def __init__(self, name, cls, fields, required, check, fast):
+        self.name = name
+        self.cls = cls
+        self.fields = fields
+        self.required = required
+        self.check = check
+        self.fast = fast
+
+
+class ShapeFactory:
+    """
+    Registry mapping kind names to shape classes.
+
+    Example:
+        factory = default_factory()
+        factory.decode([{"kind": "circle", "radius": 1.0}, ("rectangle", 2, 3)])
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._kinds = {}
+
+    def register(self, kind: str, cls, fields, required: int = None, check=None, fast: bool = False):
+        """
+        Register a shape class under a kind name.
+
+        Args:
+            kind (str): Name used in the records' ``kind`` field
+            cls: The class to build
+            fields: Constructor argument names, in order
+            required (int, optional): How many leading fields are mandatory
+                (defaults to all); the rest default to None
+            check (callable, optional): Extra validation taking the kind's
+                columns and returning a list of bad row numbers
+            fast (bool, optional): Build objects by filling ``__dict__``
+                instead of calling ``__init__``. Only safe for classes whose
+                ``__init__`` just stores its arguments.
+        """
+        fields = tuple(fields)
+        required = len(fields) if required is None else required
+        self._kinds[kind] = _Kind(kind, cls, fields, required, check, fast)
+
+    def kinds(self) -> list:
+        """Return the registered kind names."""
+        return list(self._kinds)
+
+    def _decode_columns(self, records):
+        """
+        Split records into per-kind float columns.
+
+        Returns:
+            tuple: (columns by kind, [(kind, row) per record in input order])
+        """
+        kinds = self._kinds
+        columns = {
+            name: tuple(array.array("d") for _ in spec.fields)
+            for name, spec in kinds.items()
+        }
+        order = []
+        nan = math.nan
+        for index, record in enumerate(records):
+            if isinstance(record, dict):
+                name = record.get("kind")
+                spec = kinds.get(name)
+                if spec is None:
+                    raise ValueError(f"Record {index}: unknown shape kind {name!r}")
+                try:
+                    values = [record[field] for field in spec.fields[:spec.required]]
+                except KeyError as missing:
+                    raise ValueError(f"Record {index}: missing field {missing}") from None
+                for field in spec.fields[spec.required:]:
+                    value = record.get(field)
+                    values.append(nan if value is None else value)
+            else:
+                name = record[0]
+                spec = kinds.get(name)
+                if spec is None:
+                    raise ValueError(f"Record {index}: unknown shape kind {name!r}")
+                values = list(record[1:])
+                if not spec.required <= len(values) <= len(spec.fields):
+                    raise ValueError(
+                        f"Record {index}: {name} expects {spec.required} to "
+                        f"{len(spec.fields)} values, got {len(values)}"
+                    )
+                values += [nan] * (len(spec.fields) - len(values))
+                values = [nan if value is None else value for value in values]
+
+            target = columns[name]
+            try:
+                for column, value in zip(target, values):
+                    column.append(value)
+            except TypeError:
+                raise ValueError(f"Record {index}: non-numeric value in {values!r}") from None
+            order.append((name, len(target[0]) - 1))
+        return columns, order
+
+    def _invalid_rows(self, columns):
+        """Return {kind: set(bad rows)} using column-wise checks."""
+        invalid = {}
+        for name, spec in self._kinds.items():
+            cols = columns[name]
+            bad = set()
+            for position, column in enumerate(cols):
+                optional = position >= spec.required
+                # NaN fails "> 0", so optional columns skip NaN explicitly
+                if optional:
+                    bad.update(i for i, v in enumerate(column) if v <= 0)
+                else:
+                    bad.update(i for i, v in enumerate(column) if not v > 0)
+            if spec.check is not None:
+                bad.update(spec.check(dict(zip(spec.fields, cols))))
+            if bad:
+                invalid[name] = bad
+        return invalid
+
+    def decode(self, records, output: str = "objects", errors: str = "raise"):
+        """
+        Decode a batch of records.
+
+        Args:
+            records: Iterable of dict or tuple records
+            output (str, optional): "objects" for a list of shapes in input
+                order, "columns" for a ``ShapeColumns``
+            errors (str, optional): "raise" to reject the batch on the first
+                invalid record, "skip" to drop invalid records
+
+        Returns:
+            list or ShapeColumns: The decoded shapes
+
+        Raises:
+            ValueError: On malformed records, or invalid dimensions when
+                ``errors="raise"``
+        """
+        if output not in ("objects", "columns"):
+            raise ValueError(f"Unknown output {output!r}")
+        if errors not in ("raise", "skip"):
+            raise ValueError(f"Unknown errors mode {errors!r}")
+
+        columns, order = self._decode_columns(records)
+        invalid = self._invalid_rows(columns)
+        if invalid and errors == "raise":
+            first = min(
+                index for index, (name, row) in enumerate(order)
+                if row in invalid.get(name, ())
+            )
+            raise ValueError(
+                f"Record {first}: invalid {order[first][0]} dimensions "
+                f"({sum(len(rows) for rows in invalid.values())} invalid records in batch)"
+            )
+
+        if output == "columns":
+            return self._to_columns(columns, invalid)
+        return self._to_objects(columns, order, invalid)
+
+    def decode_json_lines(self, lines, output: str = "objects", errors: str = "raise"):
+        """
+        Decode JSON-lines text (one dict record per non-blank line).
+
+        Args:
+            lines: Iterable of str lines, e.g. an open file
+            output (str, optional): See ``decode``
+            errors (str, optional): See ``decode``
+
+        Returns:
+            list or ShapeColumns: The decoded shapes
+        """
+        loads = json.loads
+        return self.decode(
+            (loads(line) for line in lines if line.strip()), output=output, errors=errors
+        )
+
+    def _to_columns(self, columns, invalid):
+        unsupported = [
+            name for name in self._kinds
+            if name not in KIND_COLUMNS and len(columns[name][0])
+        ]
+        if unsupported:
+            raise ValueError(f"Kinds {unsupported} have no columnar layout")
+        selected = {}
+        for name in KIND_COLUMNS:
+            if name not in self._kinds:
+                continue
+            spec = self._kinds[name]
+            cols = columns[name]
+            bad = invalid.get(name)
+            if bad:
+                cols = [
+                    array.array("d", (v for i, v in enumerate(col) if i not in bad))
+                    for col in cols
+                ]
+            selected[name] = dict(zip(spec.fields, cols))
+        return ShapeColumns(selected)
+
+    def _to_objects(self, columns, order, invalid):
+        builders = {}
+        for name, spec in self._kinds.items():
+            rows = list(zip(*columns[name]))
+            builders[name] = (spec, rows)
+
+        shapes = []
+        append = shapes.append
+        new = object.__new__
+        for name, row in order:
+            if row in invalid.get(name, ()):
+                continue
+            spec, rows = builders[name]
+            values = [None if v != v else v for v in rows[row]]
+            if spec.fast:
+                shape = new(spec.cls)
+                shape.__dict__.update(zip(spec.fields, values))
+            else:
+                shape = spec.cls(*values)
+            append(shape)
+        return shapes
+
+
+def default_factory() -> ShapeFactory:
+    """
+    Return a factory with Circle, Rectangle and Triangle registered.
+
+    Returns:
+        ShapeFactory: Ready-to-use factory
+    """
+    factory = ShapeFactory()
+    factory.register("circle", Circle, ("radius",), fast=True)
+    factory.register("rectangle", Rectangle, ("width", "height"), fast=True)
+    factory.register(
+        "triangle", Triangle, ("base", "height", "side_a", "side_b"),
+        required=2, check=triangle_inequality, fast=True,
+    )
+    return factory
@@ -0,0 +1,218 @@
+"""
+Streaming surface-area calculations for binary triangle meshes.
+
+A binary STL file stores an 80-byte header, a little-endian uint32 facet
+count and then one 50-byte record per facet (normal vector, three vertices
+and a uint16 attribute word). Large meshes can hold hundreds of millions of
+facets, so instead of building one ``Triangle`` object per facet this module
+memory-maps the file and walks it in fixed-size chunks.
+"""
+import math
+import mmap
+import struct
+
+HEADER_SIZE = 80
+COUNT_FORMAT = struct.Struct("<I")
+FACET_FORMAT = struct.Struct("<12fH")
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def facet_metrics(ax, ay, az, bx, by, bz, cx, cy, cz):
+    """
+    Return the base, height and two remaining sides of a 3D facet.
+
+    The edge A->B is used as the base; the height is the distance from C to
+    that edge. Together these plug straight into ``Triangle``'s formulas:
+    area = 0.5 * base * height and perimeter = base + side_a + side_b.
+
+    Returns:
+        tuple: (base, height, side_a, side_b)
+    """
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - ax, cy - ay, cz - az
+    base = math.sqrt(ux * ux + uy * uy + uz * uz)
+    side_a = math.sqrt(vx * vx + vy * vy + vz * vz)
+    side_b = math.sqrt((cx - bx) ** 2 + (cy - by) ** 2 + (cz - bz) ** 2)
+
+    # |u x v| is twice the facet area, so height = |u x v| / base
+    nx = uy * vz - uz * vy
+    ny = uz * vx - ux * vz
+    nz = ux * vy - uy * vx
+    cross = math.sqrt(nx * nx + ny * ny + nz * nz)
+    height = cross / base if base else 0.0
+    return base, height, side_a, side_b
+
+
+def write_stl(path, facets, header: bytes = b""):
+    """
+    Write vertex triples to a binary STL file.
+
+    Args:
+        path: Destination file path
+        facets: Iterable of ((ax, ay, az), (bx, by, bz), (cx, cy, cz))
+        header (bytes, optional): Up to 80 bytes of header text
+
+    Returns:
+        int: Number of facets written
+    """
+    count = 0
+    with open(path, "wb") as handle:
+        handle.write(header[:HEADER_SIZE].ljust(HEADER_SIZE, b"\0"))
+        # Reserve the count and patch it once the facets are streamed out
+        handle.write(COUNT_FORMAT.pack(0))
+        pack = FACET_FORMAT.pack
+        for a, b, c in facets:
+            handle.write(pack(0.0, 0.0, 0.0, *a, *b, *c, 0))
+            count += 1
+        handle.seek(HEADER_SIZE)
+        handle.write(COUNT_FORMAT.pack(count))
+    return count
+
+
+class MeshReader:
+    """
+    Memory-mapped reader for binary STL triangle meshes.
+
+    Facets are decoded chunk by chunk straight from the mapping, so only one
+    chunk of vertex data is ever held in Python objects at a time.
+
+    Example:
+        with MeshReader("part.stl") as mesh:
+            mesh.total_area()
+    """
+
+    def __init__(self, path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Open and map a binary STL file.
+
+        Args:
+            path: Path to the mesh file
+            chunk_size (int, optional): Facets decoded per chunk
+
+        Raises:
+            ValueError: If the file is too short for its declared facet count
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.path = path
+        self.chunk_size = chunk_size
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a binary STL file")
+
+        if len(self._map) < HEADER_SIZE + COUNT_FORMAT.size:
+            self.close()
+            raise ValueError(f"{path} is too short to be a binary STL file")
+
+        (self.facet_count,) = COUNT_FORMAT.unpack_from(self._map, HEADER_SIZE)
+        expected = HEADER_SIZE + COUNT_FORMAT.size + self.facet_count * FACET_FORMAT.size
+        if len(self._map) < expected:
+            self.close()
+            raise ValueError(
+                f"{path} declares {self.facet_count} facets but is truncated"
+            )
+
+    def __len__(self) -> int:
+        return self.facet_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the memory map and the underlying file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def iter_chunks(self, start: int = 0, stop: int = None):
+        """
+        Yield facets in chunks as lists of 9-float vertex tuples.
+
+        Args:
+            start (int, optional): First facet index
+            stop (int, optional): One past the last facet index
+
+        Yields:
+            list: Up to ``chunk_size`` tuples (ax, ay, az, ..., cz)
+        """
+        stop = self.facet_count if stop is None else min(stop, self.facet_count)
+        data_start = HEADER_SIZE + COUNT_FORMAT.size
+        size = FACET_FORMAT.size
+        for first in range(start, stop, self.chunk_size):
+            last = min(first + self.chunk_size, stop)
+            # Slicing the map copies just this chunk's bytes out of the file
+            chunk = self._map[data_start + first * size:data_start + last * size]
+            # Skip the normal (first 3 floats) and the attribute word
+            yield [record[3:12] for record in FACET_FORMAT.iter_unpack(chunk)]
+
+    def iter_facet_areas(self, start: int = 0, stop: int = None):
+        """
+        Yield facet areas chunk by chunk.
+
+        Args:
+            start (int, optional): First facet index
+            stop (int, optional): One past the last facet index
+
+        Yields:
+            list: Facet areas for one chunk
+        """
+        for chunk in self.iter_chunks(start, stop):
+            areas = []
+            for vertices in chunk:
+                base, height, _, _ = facet_metrics(*vertices)
+                areas.append(0.5 * base * height)
+            yield areas
+
+    def facet_areas(self, start: int = 0, stop: int = None) -> list:
+        """
+        Return per-facet areas for a range of facets.
+
+        Only use this for ranges that comfortably fit in memory; prefer
+        ``iter_facet_areas`` for whole meshes.
+
+        Args:
+            start (int, optional): First facet index
+            stop (int, optional): One past the last facet index
+
+        Returns:
+            list: Area of each facet in the range
+        """
+        areas = []
+        for chunk_areas in self.iter_facet_areas(start, stop):
+            areas.extend(chunk_areas)
+        return areas
+
+    def total_area(self) -> float:
+        """
+        Calculate the total surface area of the mesh.
+
+        Returns:
+            float: Sum of facet areas (accumulated with ``math.fsum``)
+        """
+        return math.fsum(math.fsum(areas) for areas in self.iter_facet_areas())
+
+    def total_perimeter(self) -> float:
+        """
+        Calculate the sum of all facet perimeters.
+
+        Shared edges are counted once per facet, matching what summing
+        ``Triangle.perimeter()`` over every facet would give.
+
+        Returns:
+            float: Sum of facet perimeters
+        """
+        partials = []
+        for chunk in self.iter_chunks():
+            perimeters = []
+            for vertices in chunk:
+                base, _, side_a, side_b = facet_metrics(*vertices)
+                perimeters.append(base + side_a + side_b)
+            partials.append(math.fsum(perimeters))
+        return math.fsum(partials)
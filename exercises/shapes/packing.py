@@ -0,0 +1,322 @@
+"""
+2D bin packing of Rectangle items onto fixed-size sheets.
+
+Three placement strategies are available:
+
+- ``"skyline"``: bottom-left skyline; the fastest, good for large batches
+- ``"maxrects"``: MaxRects with best-short-side-fit; the densest, but its
+  free-rectangle list grows with every placement
+- ``"guillotine"``: guillotine cuts with best-area-fit, so every layout can
+  be produced by edge-to-edge cuts (useful for sheet materials)
+
+Each strategy packs one sheet; ``RectanglePacker`` opens new sheets when
+the current ones are full.
+"""
+from collections import namedtuple
+
+PackedRect = namedtuple("PackedRect", "index sheet x y width height rotated")
+PackedRect.__doc__ = """
+Where one input rectangle ended up.
+
+``index`` is the position in the input list; ``width``/``height`` are the
+placed dimensions (swapped when ``rotated`` is True).
+"""
+
+PackingResult = namedtuple("PackingResult", "placements sheets utilization unplaced")
+
+
+class _SkylineSheet:
+    """Bottom-left skyline packing for one sheet."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.segments = [[0.0, 0.0, width]]  # [x, y, width] left to right
+
+    def _fit(self, index, w, h):
+        """Return the y a w*h item would rest at starting at a segment."""
+        segments = self.segments
+        x = segments[index][0]
+        if x + w > self.width:
+            return None
+        y = 0.0
+        remaining = w
+        while remaining > 0 and index < len(segments):
+            x_seg, y_seg, w_seg = segments[index]
+            if y_seg > y:
+                y = y_seg
+            if y + h > self.height:
+                return None
+            remaining -= w_seg
+            index += 1
+        return y
+
+    def find(self, w, h, allow_rotation):
+        best = None
+        for index, segment in enumerate(self.segments):
+            for pw, ph, rotated in _orientations(w, h, allow_rotation):
+                y = self._fit(index, pw, ph)
+                if y is None:
+                    continue
+                score = (y + ph, segment[0])
+                if best is None or score < best[0]:
+                    best = (score, index, segment[0], y, pw, ph, rotated)
+        return best
+
+    def place(self, found):
+        _, index, x, y, w, h, _ = found
+        segments = self.segments
+        segments.insert(index, [x, y + h, w])
+
+        # Trim or drop the segments now covered by the new one
+        end = x + w
+        next_index = index + 1
+        while next_index < len(segments):
+            segment = segments[next_index]
+            if segment[0] >= end:
+                break
+            overlap = end - segment[0]
+            if overlap >= segment[2]:
+                del segments[next_index]
+                continue
+            segment[0] += overlap
+            segment[2] -= overlap
+            break
+
+        # Merge neighbours at the same height
+        i = 0
+        while i < len(segments) - 1:
+            if segments[i][1] == segments[i + 1][1]:
+                segments[i][2] += segments[i + 1][2]
+                del segments[i + 1]
+            else:
+                i += 1
+
+
+class _MaxRectsSheet:
+    """MaxRects with best-short-side-fit for one sheet."""
+
+    def __init__(self, width, height):
+        self.free = [(0.0, 0.0, width, height)]
+
+    def find(self, w, h, allow_rotation):
+        best = None
+        for fx, fy, fw, fh in self.free:
+            for pw, ph, rotated in _orientations(w, h, allow_rotation):
+                if pw > fw or ph > fh:
+                    continue
+                left_w, left_h = fw - pw, fh - ph
+                score = (min(left_w, left_h), max(left_w, left_h))
+                if best is None or score < best[0]:
+                    best = (score, fx, fy, pw, ph, rotated)
+        return best
+
+    def place(self, found):
+        _, x, y, w, h, _ = found
+        right, top = x + w, y + h
+        split = []
+        for free in self.free:
+            fx, fy, fw, fh = free
+            if x >= fx + fw or right <= fx or y >= fy + fh or top <= fy:
+                split.append(free)
+                continue
+            # Keep the parts of the free rectangle around the placed item
+            if x > fx:
+                split.append((fx, fy, x - fx, fh))
+            if right < fx + fw:
+                split.append((right, fy, fx + fw - right, fh))
+            if y > fy:
+                split.append((fx, fy, fw, y - fy))
+            if top < fy + fh:
+                split.append((fx, top, fw, fy + fh - top))
+        self.free = _prune(split)
+
+
+class _GuillotineSheet:
+    """Guillotine packing with best-area-fit for one sheet."""
+
+    def __init__(self, width, height):
+        self.free = [(0.0, 0.0, width, height)]
+
+    def find(self, w, h, allow_rotation):
+        best = None
+        for position, (fx, fy, fw, fh) in enumerate(self.free):
+            for pw, ph, rotated in _orientations(w, h, allow_rotation):
+                if pw > fw or ph > fh:
+                    continue
+                score = (fw * fh - pw * ph, min(fw - pw, fh - ph))
+                if best is None or score < best[0]:
+                    best = (score, position, fx, fy, pw, ph, rotated)
+        return best
+
+    def place(self, found):
+        _, position, x, y, w, h, _ = found
+        fx, fy, fw, fh = self.free.pop(position)
+        left_w, left_h = fw - w, fh - h
+        # Cut along the shorter leftover axis so the larger piece stays whole
+        if left_w <= left_h:
+            pieces = [(fx + w, fy, left_w, h), (fx, fy + h, fw, left_h)]
+        else:
+            pieces = [(fx + w, fy, left_w, fh), (fx, fy + h, w, left_h)]
+        self.free.extend(piece for piece in pieces if piece[2] > 0 and piece[3] > 0)
+
+
+SHEET_TYPES = {
+    "skyline": _SkylineSheet,
+    "maxrects": _MaxRectsSheet,
+    "guillotine": _GuillotineSheet,
+}
+
+
+def _orientations(w, h, allow_rotation):
+    yield w, h, False
+    if allow_rotation and w != h:
+        yield h, w, True
+
+
+def _prune(rects):
+    """Drop free rectangles fully contained in another one."""
+    rects = sorted(set(rects), key=lambda r: r[2] * r[3], reverse=True)
+    kept = []
+    for x, y, w, h in rects:
+        contained = False
+        for kx, ky, kw, kh in kept:
+            if kx <= x and ky <= y and x + w <= kx + kw and y + h <= ky + kh:
+                contained = True
+                break
+        if not contained:
+            kept.append((x, y, w, h))
+    return kept
+
+
+class RectanglePacker:
+    """
+    Pack Rectangle instances onto identical sheets.
+
+    Example:
+        packer = RectanglePacker(100, 50, algorithm="maxrects")
+        result = packer.pack([Rectangle(30, 20), Rectangle(60, 10)])
+        result.utilization
+    """
+
+    def __init__(
+        self,
+        sheet_width: float,
+        sheet_height: float,
+        algorithm: str = "skyline",
+        allow_rotation: bool = True,
+        max_open_sheets: int = 4,
+    ):
+        """
+        Configure the packer.
+
+        Args:
+            sheet_width (float): Width of every sheet (must be positive)
+            sheet_height (float): Height of every sheet (must be positive)
+            algorithm (str, optional): "skyline", "maxrects" or "guillotine"
+            allow_rotation (bool, optional): Allow 90-degree rotation of items
+            max_open_sheets (int, optional): How many recent sheets are still
+                tried for new items; older sheets are closed to keep each
+                placement fast
+
+        Raises:
+            ValueError: If the sheet size or algorithm is invalid
+        """
+        if sheet_width <= 0 or sheet_height <= 0:
+            raise ValueError("Sheet dimensions must be positive")
+        if algorithm not in SHEET_TYPES:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; choose from {sorted(SHEET_TYPES)}")
+        if max_open_sheets < 1:
+            raise ValueError("max_open_sheets must be at least 1")
+        self.sheet_width = sheet_width
+        self.sheet_height = sheet_height
+        self.algorithm = algorithm
+        self.allow_rotation = allow_rotation
+        self.max_open_sheets = max_open_sheets
+
+    def _fits_empty_sheet(self, w, h):
+        for pw, ph, _ in _orientations(w, h, self.allow_rotation):
+            if pw <= self.sheet_width and ph <= self.sheet_height:
+                return True
+        return False
+
+    def pack(self, rectangles, sort: bool = True) -> PackingResult:
+        """
+        Pack rectangles onto as few sheets as the strategy manages.
+
+        Args:
+            rectangles: Sequence of Rectangle instances (anything with
+                ``width`` and ``height`` works)
+            sort (bool, optional): Place larger items first, which usually
+                packs much more densely than input order
+
+        Returns:
+            PackingResult: placements in input order, number of sheets used,
+                utilization (placed area / total sheet area) and the indices
+                of items too large for a sheet
+
+        Raises:
+            ValueError: If any rectangle has a non-positive dimension
+        """
+        items = []
+        for index, rect in enumerate(rectangles):
+            if rect.width <= 0 or rect.height <= 0:
+                raise ValueError(f"Rectangle {index} has non-positive dimensions")
+            items.append((index, rect.width, rect.height))
+        if sort:
+            items.sort(key=lambda item: (max(item[1], item[2]), min(item[1], item[2])), reverse=True)
+
+        sheet_type = SHEET_TYPES[self.algorithm]
+        open_sheets = []  # (sheet number, sheet) for recently opened sheets
+        sheet_count = 0
+        placements = []
+        unplaced = []
+        placed_area = 0.0
+
+        for index, w, h in items:
+            if not self._fits_empty_sheet(w, h):
+                unplaced.append(index)
+                continue
+            for number, sheet in open_sheets:
+                found = sheet.find(w, h, self.allow_rotation)
+                if found is not None:
+                    break
+            else:
+                number, sheet = sheet_count, sheet_type(self.sheet_width, self.sheet_height)
+                sheet_count += 1
+                open_sheets.append((number, sheet))
+                if len(open_sheets) > self.max_open_sheets:
+                    open_sheets.pop(0)
+                found = sheet.find(w, h, self.allow_rotation)
+
+            sheet.place(found)
+            x, y, pw, ph, rotated = _position(found)
+            placements.append(PackedRect(index, number, x, y, pw, ph, rotated))
+            placed_area += w * h
+
+        placements.sort(key=lambda placed: placed.index)
+        unplaced.sort()
+        total_area = sheet_count * self.sheet_width * self.sheet_height
+        utilization = placed_area / total_area if total_area else 0.0
+        return PackingResult(placements, sheet_count, utilization, unplaced)
+
+
+def _position(found):
+    # Every strategy's find() result ends with (x, y, width, height, rotated)
+    return found[-5:]
+
+
+def pack_rectangles(rectangles, sheet_width: float, sheet_height: float, **options) -> PackingResult:
+    """
+    Pack rectangles with a one-off ``RectanglePacker``.
+
+    Args:
+        rectangles: Sequence of Rectangle instances
+        sheet_width (float): Width of every sheet
+        sheet_height (float): Height of every sheet
+        **options: Passed to ``RectanglePacker``
+
+    Returns:
+        PackingResult: See ``RectanglePacker.pack``
+    """
+    return RectanglePacker(sheet_width, sheet_height, **options).pack(rectangles)
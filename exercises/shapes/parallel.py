@@ -0,0 +1,226 @@
+"""
+Parallel aggregation over shape columns using shared memory.
+
+The columns of a ``ShapeColumns`` are copied once into
+``multiprocessing.shared_memory`` blocks (one block per kind). Worker
+processes attach to those blocks when the pool starts, so each task only
+sends a ``(kind, start, stop)`` row range across the process boundary -
+shape objects are never pickled.
+"""
+import array
+import bisect
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .columnar import AREA_KERNELS, KIND_COLUMNS, PERIMETER_KERNELS, ShapeColumns
+
+# Views into the shared blocks, populated once per worker process
+_WORKER_BLOCKS = {}
+_WORKER_COLUMNS = {}
+
+# Aim for a few tasks per worker so uneven kinds still balance out
+TASKS_PER_WORKER = 4
+
+
+def _attach(layout):
+    """Pool initializer: map every shared block into this worker."""
+    for kind, (name, count) in layout.items():
+        block = shared_memory.SharedMemory(name=name)
+        _WORKER_BLOCKS[kind] = block
+        _WORKER_COLUMNS[kind] = _column_views(block, kind, count)
+
+
+def _column_views(block, kind, count):
+    values = block.buf.cast("d")
+    return {
+        name: values[index * count:(index + 1) * count]
+        for index, name in enumerate(KIND_COLUMNS[kind])
+    }
+
+
+def _as_doubles(values):
+    # Slice assignment into a shared view needs a matching 'd' buffer
+    if isinstance(values, memoryview) and values.format == "d":
+        return values
+    if isinstance(values, array.array) and values.typecode == "d":
+        return values
+    return array.array("d", values)
+
+
+def _rows(columns, start, stop):
+    return {name: values[start:stop] for name, values in columns.items()}
+
+
+def _area_task(kind, start, stop, columns=None):
+    """Return (sum, min, max, count) of areas for a row range."""
+    columns = _WORKER_COLUMNS[kind] if columns is None else columns
+    areas = AREA_KERNELS[kind](_rows(columns, start, stop))
+    if not areas:
+        return 0.0, math.inf, -math.inf, 0
+    return math.fsum(areas), min(areas), max(areas), len(areas)
+
+
+def _histogram_task(kind, start, stop, edges, columns=None):
+    """Return bin counts of perimeters for a row range."""
+    columns = _WORKER_COLUMNS[kind] if columns is None else columns
+    counts = [0] * (len(edges) - 1)
+    last = len(edges) - 1
+    for value in PERIMETER_KERNELS[kind](_rows(columns, start, stop)):
+        # NaN perimeters (triangles without sides) and out-of-range values
+        # are not counted, like numpy.histogram
+        if not edges[0] <= value <= edges[-1]:
+            continue
+        index = bisect.bisect_right(edges, value) - 1
+        counts[min(index, last - 1)] += 1
+    return counts
+
+
+class ParallelAggregator:
+    """
+    Run aggregations over shape columns in a process pool.
+
+    Example:
+        with ParallelAggregator(columns, workers=4) as agg:
+            agg.total_area()
+            agg.min_max_area()
+    """
+
+    def __init__(self, columns: ShapeColumns, workers: int = None):
+        """
+        Copy the columns into shared memory and start the worker pool.
+
+        Args:
+            columns (ShapeColumns): The shapes to aggregate
+            workers (int, optional): Process count (defaults to the CPU count).
+                With ``workers=1`` everything runs in the calling process.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.counts = {kind: columns.count(kind) for kind in KIND_COLUMNS}
+        self._blocks = {}
+        self._local = {}
+        self._pool = None
+        try:
+            layout = self._share(columns)
+            if self.workers > 1:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_attach, initargs=(layout,)
+                )
+        except BaseException:
+            self.close()
+            raise
+
+    def _share(self, columns):
+        layout = {}
+        for kind, names in KIND_COLUMNS.items():
+            count = self.counts[kind]
+            if not count:
+                continue
+            block = shared_memory.SharedMemory(create=True, size=count * 8 * len(names))
+            self._blocks[kind] = block
+            views = _column_views(block, kind, count)
+            for name in names:
+                views[name][:] = _as_doubles(columns.column(kind, name))
+            self._local[kind] = views
+            layout[kind] = (block.name, count)
+        return layout
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the workers and free the shared memory blocks."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for views in self._local.values():
+            for view in views.values():
+                view.release()
+        self._local.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def _tasks(self):
+        total = sum(self.counts.values())
+        size = max(1, math.ceil(total / (self.workers * TASKS_PER_WORKER)))
+        for kind, count in self.counts.items():
+            for start in range(0, count, size):
+                yield kind, start, min(start + size, count)
+
+    def _run(self, function, *extra):
+        tasks = list(self._tasks())
+        if self._pool is None:
+            return [
+                (task[0], function(*task, *extra, columns=self._local[task[0]]))
+                for task in tasks
+            ]
+        futures = [self._pool.submit(function, *task, *extra) for task in tasks]
+        return [(task[0], future.result()) for task, future in zip(tasks, futures)]
+
+    def total_area(self) -> float:
+        """
+        Calculate the combined area of every shape.
+
+        Returns:
+            float: Sum of all areas
+        """
+        return math.fsum(partial[0] for _, partial in self._run(_area_task))
+
+    def min_max_area(self) -> dict:
+        """
+        Find the smallest and largest area for each kind.
+
+        Returns:
+            dict: kind -> (min_area, max_area) for kinds with at least one row
+        """
+        result = {}
+        for kind, (_, low, high, count) in self._run(_area_task):
+            if not count:
+                continue
+            if kind in result:
+                low = min(low, result[kind][0])
+                high = max(high, result[kind][1])
+            result[kind] = (low, high)
+        return result
+
+    def perimeter_histogram(self, edges) -> list:
+        """
+        Count perimeters falling into each bin.
+
+        Bins are half-open ``[edges[i], edges[i + 1])`` except the last,
+        which also includes its right edge.
+
+        Args:
+            edges: Increasing sequence of at least two bin edges
+
+        Returns:
+            list: One count per bin
+        """
+        edges = list(edges)
+        if len(edges) < 2 or any(a >= b for a, b in zip(edges, edges[1:])):
+            raise ValueError("edges must be an increasing sequence of at least two values")
+        counts = [0] * (len(edges) - 1)
+        for _, partial in self._run(_histogram_task, edges):
+            counts = [a + b for a, b in zip(counts, partial)]
+        return counts
+
+
+def parallel_total_area(columns: ShapeColumns, workers: int = None) -> float:
+    """
+    Sum the area of every shape using a process pool.
+
+    Args:
+        columns (ShapeColumns): The shapes to aggregate
+        workers (int, optional): Process count (defaults to the CPU count)
+
+    Returns:
+        float: Sum of all areas
+    """
+    with ParallelAggregator(columns, workers) as aggregator:
+        return aggregator.total_area()
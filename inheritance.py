@@ -8,6 +8,14 @@ Demonstrates basic inheritance concepts:
 - Polymorphism basics
 """
 
+# Energy rules shared by the classes below (and the simulation modules that
+# reproduce them)
+MAX_ENERGY = 100
+EAT_ENERGY = 20
+FETCH_MIN_ENERGY, FETCH_COST = 20, 15
+CLIMB_MIN_ENERGY, CLIMB_COST = 30, 20
+FLY_MIN_ENERGY, FLY_COST = 25, 20
+
 
 class Animal:
     """
@@ -31,7 +39,7 @@ class Animal:
         self.species = species
         self.age = age
         self.is_sleeping = False
-        self.energy = 100
+        self.energy = MAX_ENERGY
     
     def eat(self, food: str) -> str:
         """
@@ -43,7 +51,7 @@ class Animal:
         Returns:
             str: A message about eating
         """
-        self.energy = min(100, self.energy + 20)  # Cap energy at 100
+        self.energy = min(MAX_ENERGY, self.energy + EAT_ENERGY)  # Cap energy at the maximum
         return f"{self.name} the {self.species} eats {food} and gains energy!"
     
     def sleep(self) -> str:
@@ -57,7 +65,7 @@ class Animal:
             return f"{self.name} is already sleeping!"
         
         self.is_sleeping = True
-        self.energy = 100  # Sleeping restores full energy
+        self.energy = MAX_ENERGY  # Sleeping restores full energy
         return f"{self.name} goes to sleep and feels refreshed!"
     
     def wake_up(self) -> str:
@@ -147,10 +155,10 @@ class Dog(Animal):
         if self.is_sleeping:
             return f"{self.name} is sleeping and can't fetch right now!"
         
-        if self.energy < 20:
+        if self.energy < FETCH_MIN_ENERGY:
             return f"{self.name} is too tired to fetch!"
         
-        self.energy -= 15  # Fetching uses energy
+        self.energy -= FETCH_COST  # Fetching uses energy
         return f"{self.name} runs and fetches the {item}! Good dog!"
     
     def learn_trick(self, trick: str) -> str:
@@ -260,10 +268,10 @@ class Cat(Animal):
         if self.is_sleeping:
             return f"{self.name} is sleeping and can't climb trees right now!"
         
-        if self.energy < 30:
+        if self.energy < CLIMB_MIN_ENERGY:
             return f"{self.name} is too tired to climb!"
         
-        self.energy -= 20
+        self.energy -= CLIMB_COST
         return f"{self.name} gracefully climbs up a tree!"
     
     def knock_over_object(self, object_name: str) -> str:
@@ -338,12 +346,12 @@ class Bird(Animal):
         if self.is_sleeping:
             return f"{self.name} is sleeping and can't fly right now!"
         
-        if self.energy < 25:
+        if self.energy < FLY_MIN_ENERGY:
             return f"{self.name} is too tired to fly!"
         
         self.is_flying = True
         self.altitude = height
-        self.energy -= 20
+        self.energy -= FLY_COST
         
         return f"{self.name} spreads its wings and flies up to {height} feet!"
     
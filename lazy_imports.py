@@ -0,0 +1,45 @@
+"""
+Lazy package exports (PEP 562) shared by the lesson packages.
+
+A package lists its public names and the modules they live in, and lets
+``make_lazy`` build its module-level ``__getattr__`` and ``__dir__``:
+
+    _EXPORTS = {"Book": ".book", "shapes": ".shapes"}
+    __all__ = sorted(_EXPORTS)
+    __getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
+
+A name is imported the first time it is read and then stored in the
+package, so later lookups skip ``__getattr__``. A name that matches its
+module (``"shapes": ".shapes"``) is the module itself; any other name is
+read from its module.
+"""
+import importlib
+import sys
+
+
+def make_lazy(package: str, exports: dict) -> tuple:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package (str): The package's ``__name__``
+        exports (dict): Public name -> module, relative to ``package``
+
+    Returns:
+        tuple: ``(__getattr__, __dir__)`` to assign in the package
+    """
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = importlib.import_module(module, package)
+        if module.lstrip(".") != name:
+            value = getattr(value, name)
+        setattr(sys.modules[package], name, value)  # later lookups skip __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,239 @@
+"""
+Asyncio actor runtime for the animals in ``inheritance.py``.
+
+Each animal becomes an actor with its own mailbox (a deque of pending
+method calls). A small, fixed number of worker tasks serve every actor:
+when a mailbox receives its first message the actor is put on a ready
+queue, and a worker delivers up to ``batch_size`` messages to it before
+yielding to the event loop. There is no task or thread per animal, so a
+single process can host hundreds of thousands of actors.
+
+Example:
+    async def main():
+        system = ActorSystem()
+        rex = system.spawn(Dog("Rex", 3, "Lab"))
+        async with system:
+            system.tell(rex, "fetch", "ball")
+            print(await system.ask(rex, "get_info"))
+
+    asyncio.run(main())
+"""
+import asyncio
+import time
+from collections import deque
+
+
+class ActorSystem:
+    """Host many animal actors on one event loop."""
+
+    def __init__(self, workers: int = 4, batch_size: int = 64, latency_samples: int = 100000):
+        """
+        Configure the runtime.
+
+        Args:
+            workers (int, optional): Number of worker tasks delivering messages
+            batch_size (int, optional): Messages delivered to one actor before
+                moving on to the next ready actor
+            latency_samples (int, optional): How many recent delivery
+                latencies are kept for the metrics
+        """
+        if workers < 1 or batch_size < 1:
+            raise ValueError("workers and batch_size must be at least 1")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.animals = []
+        self._mailboxes = []
+        self._scheduled = bytearray()  # 1 while an actor sits on the ready queue
+        self._ready = deque()
+        self._wakeup = None
+        self._idle = None
+        self._tasks = []
+        self._pending = 0
+        self._latencies = deque(maxlen=latency_samples)
+        self.sent = 0
+        self.processed = 0
+        self.failed = 0
+        self._started_at = None
+
+    def spawn(self, animal) -> int:
+        """
+        Register an animal as an actor.
+
+        Args:
+            animal: Any object whose methods should be called via messages
+
+        Returns:
+            int: Actor id used with ``tell``/``ask``
+        """
+        self.animals.append(animal)
+        self._mailboxes.append(deque())
+        self._scheduled.append(0)
+        return len(self.animals) - 1
+
+    def __len__(self) -> int:
+        return len(self.animals)
+
+    def _enqueue(self, actor: int, method: str, args, future):
+        self._mailboxes[actor].append((method, args, future, time.perf_counter()))
+        self._pending += 1
+        self.sent += 1
+        if not self._scheduled[actor]:
+            self._scheduled[actor] = 1
+            self._ready.append(actor)
+
+    def _notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._idle.clear()
+
+    def tell(self, actor: int, method: str, *args):
+        """
+        Send a fire-and-forget message.
+
+        Args:
+            actor (int): Actor id
+            method (str): Name of the method to call on the animal
+            *args: Method arguments
+        """
+        self._enqueue(actor, method, args, None)
+        self._notify()
+
+    def tell_many(self, messages):
+        """
+        Send a batch of fire-and-forget messages with a single wake-up.
+
+        Args:
+            messages: Iterable of (actor id, method name, args tuple)
+        """
+        enqueue = self._enqueue
+        for actor, method, args in messages:
+            enqueue(actor, method, args, None)
+        self._notify()
+
+    def broadcast(self, method: str, *args, actors=None):
+        """Send the same message to every actor (or to the given ids)."""
+        targets = range(len(self.animals)) if actors is None else actors
+        self.tell_many((actor, method, args) for actor in targets)
+
+    def ask(self, actor: int, method: str, *args) -> asyncio.Future:
+        """
+        Send a message and get a future for the method's return value.
+
+        Args:
+            actor (int): Actor id
+            method (str): Name of the method to call on the animal
+            *args: Method arguments
+
+        Returns:
+            asyncio.Future: Resolves to the return value (or its exception)
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(actor, method, args, future)
+        self._notify()
+        return future
+
+    async def start(self):
+        """Start the worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        if self._pending:
+            self._wakeup.set()
+        else:
+            self._idle.set()
+        self._started_at = time.perf_counter()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def drain(self):
+        """Wait until every queued message has been delivered."""
+        if self._pending:
+            await self._idle.wait()
+
+    async def stop(self):
+        """Deliver the remaining messages, then stop the workers."""
+        await self.drain()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def _worker(self):
+        ready = self._ready
+        mailboxes = self._mailboxes
+        animals = self.animals
+        latencies = self._latencies
+        batch_size = self.batch_size
+        clock = time.perf_counter
+        while True:
+            if not ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            actor = ready.popleft()
+            mailbox = mailboxes[actor]
+            animal = animals[actor]
+            delivered = 0
+            while mailbox and delivered < batch_size:
+                method, args, future, sent_at = mailbox.popleft()
+                delivered += 1
+                try:
+                    result = getattr(animal, method)(*args)
+                except Exception as error:
+                    self.failed += 1
+                    if future is not None and not future.done():
+                        future.set_exception(error)
+                else:
+                    if future is not None and not future.done():
+                        future.set_result(result)
+                latencies.append(clock() - sent_at)
+
+            self.processed += delivered
+            self._pending -= delivered
+            if mailbox:
+                ready.append(actor)
+            else:
+                self._scheduled[actor] = 0
+            if not self._pending:
+                self._idle.set()
+            # Cooperative scheduling: let other workers and producers run
+            await asyncio.sleep(0)
+
+    def metrics(self) -> dict:
+        """
+        Return throughput and latency statistics.
+
+        Returns:
+            dict: actors, sent, processed, failed, pending, elapsed seconds,
+                throughput (messages/s since start) and latency percentiles
+                in seconds over the most recent deliveries
+        """
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return {
+            "actors": len(self.animals),
+            "sent": self.sent,
+            "processed": self.processed,
+            "failed": self.failed,
+            "pending": self._pending,
+            "elapsed": elapsed,
+            "throughput": self.processed / elapsed if elapsed else 0.0,
+            "latency_p50": percentile(0.50),
+            "latency_p95": percentile(0.95),
+            "latency_p99": percentile(0.99),
+            "latency_max": latencies[-1] if latencies else 0.0,
+        }
@@ -0,0 +1,330 @@
+"""
+Structured event mode for the animal actions in ``inheritance.py``.
+
+The ``Animal``/``Dog``/``Cat``/``Bird`` methods build and return an f-string
+on every call, even when the caller ignores it. ``EventRecorder`` offers the
+same actions with the same state changes, but records a compact event
+(event code, animal id, argument) into a fixed-size ``EventLog`` ring buffer
+and returns the event code. Message text is only rendered when the log is
+read, and renders to exactly the string the original method would have
+returned at the time of the event (the animal's name is captured when the
+event is emitted). The energy rules come from the constants in
+``inheritance.py``, so both modes always agree.
+
+The string-returning methods on the classes are unchanged and remain the
+default API.
+
+Example:
+    log = EventLog(capacity=10000)
+    recorder = EventRecorder(log)
+    rex = recorder.register(Dog("Rex", 3, "Lab"))
+    recorder.fetch(rex, "ball")
+    list(log.messages())  # ["Rex runs and fetches the ball! Good dog!"]
+"""
+import array
+from collections import namedtuple
+
+from inheritance import (
+    CLIMB_COST,
+    CLIMB_MIN_ENERGY,
+    EAT_ENERGY,
+    FETCH_COST,
+    FETCH_MIN_ENERGY,
+    FLY_COST,
+    FLY_MIN_ENERGY,
+    MAX_ENERGY,
+    Bird,
+    Cat,
+    Dog,
+)
+
+Event = namedtuple("Event", "code animal arg")
+
+# Event codes, one per distinct message in inheritance.py
+(
+    EAT, SLEEP, ALREADY_SLEEPING, WAKE_UP, ALREADY_AWAKE,
+    SOUND, DOG_SOUND, CAT_SOUND, BIRD_SOUND,
+    FETCH, FETCH_SLEEPING, FETCH_TIRED,
+    LEARN_TRICK, TRICK_KNOWN, PERFORM_TRICK, TRICK_UNKNOWN, TRICK_SLEEPING,
+    PURR, PURR_SLEEPING, CLIMB, CLIMB_SLEEPING, CLIMB_TIRED,
+    KNOCK_OVER, KNOCK_OVER_SLEEPING,
+    FLY, FLY_SLEEPING, FLY_TIRED, LAND, ALREADY_LANDED,
+) = range(29)
+
+# cSpell:ignore Purrrrr
+TEMPLATES = {
+    EAT: "{name} the {species} eats {arg} and gains energy!",
+    SLEEP: "{name} goes to sleep and feels refreshed!",
+    ALREADY_SLEEPING: "{name} is already sleeping!",
+    WAKE_UP: "{name} wakes up!",
+    ALREADY_AWAKE: "{name} is already awake!",
+    SOUND: "{name} makes a generic animal sound!",
+    DOG_SOUND: "{name} barks: Woof! Woof!",
+    CAT_SOUND: "{name} meows: Meow! Meow!",
+    BIRD_SOUND: "{name} chirps: Tweet! Tweet!",
+    FETCH: "{name} runs and fetches the {arg}! Good dog!",
+    FETCH_SLEEPING: "{name} is sleeping and can't fetch right now!",
+    FETCH_TIRED: "{name} is too tired to fetch!",
+    LEARN_TRICK: "{name} learned to {arg}!",
+    TRICK_KNOWN: "{name} already knows how to {arg}!",
+    PERFORM_TRICK: "{name} performs {arg}! What a good dog!",
+    TRICK_UNKNOWN: "{name} doesn't know how to {arg} yet!",
+    TRICK_SLEEPING: "{name} is sleeping and can't perform tricks!",
+    PURR: "{name} purrs contentedly: Purrrrr...",
+    PURR_SLEEPING: "{name} purrs softly while sleeping!",
+    CLIMB: "{name} gracefully climbs up a tree!",
+    CLIMB_SLEEPING: "{name} is sleeping and can't climb trees right now!",
+    CLIMB_TIRED: "{name} is too tired to climb!",
+    KNOCK_OVER: "{name} looks at the {arg}... and knocks it over! Typical cat behavior!",
+    KNOCK_OVER_SLEEPING: "{name} is sleeping peacefully and not causing trouble!",
+    FLY: "{name} spreads its wings and flies up to {arg} feet!",
+    FLY_SLEEPING: "{name} is sleeping and can't fly right now!",
+    FLY_TIRED: "{name} is too tired to fly!",
+    LAND: "{name} gracefully lands on the ground!",
+    ALREADY_LANDED: "{name} is already on the ground!",
+}
+
+
+class EventLog:
+    """
+    Fixed-capacity ring buffer of animal events.
+
+    When the buffer is full the oldest events are overwritten; ``dropped``
+    counts how many were lost that way.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        """
+        Allocate the buffer.
+
+        Args:
+            capacity (int, optional): Maximum number of events kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._codes = array.array("B", bytes(capacity))
+        self._animals = array.array("q", bytes(8 * capacity))
+        self._args = [None] * capacity
+        self._names = [None] * capacity  # animal name when the event was emitted
+        self._written = 0
+        self.animals = []  # animal id -> animal object, used for rendering
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Number of events overwritten because the buffer was full."""
+        return max(0, self._written - self.capacity)
+
+    def emit(self, code: int, animal: int, arg=None):
+        """
+        Append one event.
+
+        Args:
+            code (int): Event code
+            animal (int): Animal id (see ``EventRecorder.register``)
+            arg (optional): The action's argument (food, item, trick, height)
+        """
+        slot = self._written % self.capacity
+        self._codes[slot] = code
+        self._animals[slot] = animal
+        self._args[slot] = arg
+        self._names[slot] = self.animals[animal].name
+        self._written += 1
+
+    def clear(self):
+        """Forget all events (the registered animals are kept)."""
+        self._written = 0
+        self._args = [None] * self.capacity
+        self._names = [None] * self.capacity
+
+    def events(self):
+        """
+        Yield the buffered events from oldest to newest.
+
+        Yields:
+            Event: (code, animal id, arg)
+        """
+        for slot in self._slots():
+            yield Event(self._codes[slot], self._animals[slot], self._args[slot])
+
+    def _slots(self):
+        """Buffer slots of the kept events, oldest first."""
+        count = len(self)
+        capacity = self.capacity
+        return [position % capacity for position in range(self._written - count, self._written)]
+
+    def render(self, event: Event) -> str:
+        """
+        Render one event as the message the original method returns.
+
+        ``Event`` does not carry the name captured at emit time, so this uses
+        the animal's current name; ``messages`` uses the captured one.
+
+        Args:
+            event (Event): An event from this log
+
+        Returns:
+            str: The message text
+        """
+        animal = self.animals[event.animal]
+        return TEMPLATES[event.code].format(name=animal.name, species=animal.species, arg=event.arg)
+
+    def messages(self):
+        """
+        Yield rendered messages from oldest to newest.
+
+        Each message uses the name the animal had when the event was emitted.
+        """
+        animals, codes, args, names = self.animals, self._codes, self._args, self._names
+        for slot in self._slots():
+            yield TEMPLATES[codes[slot]].format(
+                name=names[slot], species=animals[self._animals[slot]].species, arg=args[slot]
+            )
+
+
+class EventRecorder:
+    """
+    Run animal actions in structured event mode.
+
+    Each action applies the same rules and state changes as the method of
+    the same name in ``inheritance.py``, emits one event into the log and
+    returns its event code instead of a message string.
+    """
+
+    def __init__(self, log: EventLog):
+        """
+        Attach the recorder to a log.
+
+        Args:
+            log (EventLog): Where events are written
+        """
+        self.log = log
+
+    def register(self, animal) -> int:
+        """
+        Register an animal for recording.
+
+        Args:
+            animal: An Animal (or subclass) instance
+
+        Returns:
+            int: Animal id used by the action methods
+        """
+        self.log.animals.append(animal)
+        return len(self.log.animals) - 1
+
+    def _emit(self, code, animal_id, arg=None):
+        self.log.emit(code, animal_id, arg)
+        return code
+
+    def eat(self, animal_id: int, food: str) -> int:
+        """Structured ``Animal.eat``; returns the event code."""
+        animal = self.log.animals[animal_id]
+        animal.energy = min(MAX_ENERGY, animal.energy + EAT_ENERGY)
+        return self._emit(EAT, animal_id, food)
+
+    def sleep(self, animal_id: int) -> int:
+        """Structured ``Animal.sleep``; returns the event code."""
+        animal = self.log.animals[animal_id]
+        if animal.is_sleeping:
+            return self._emit(ALREADY_SLEEPING, animal_id)
+        animal.is_sleeping = True
+        animal.energy = MAX_ENERGY
+        return self._emit(SLEEP, animal_id)
+
+    def wake_up(self, animal_id: int) -> int:
+        """Structured ``Animal.wake_up``; returns the event code."""
+        animal = self.log.animals[animal_id]
+        if not animal.is_sleeping:
+            return self._emit(ALREADY_AWAKE, animal_id)
+        animal.is_sleeping = False
+        return self._emit(WAKE_UP, animal_id)
+
+    def make_sound(self, animal_id: int) -> int:
+        """Structured ``make_sound`` for each class; returns the event code."""
+        animal = self.log.animals[animal_id]
+        if isinstance(animal, Dog):
+            code = DOG_SOUND
+        elif isinstance(animal, Cat):
+            code = CAT_SOUND
+        elif isinstance(animal, Bird):
+            code = BIRD_SOUND
+        else:
+            code = SOUND
+        return self._emit(code, animal_id)
+
+    def fetch(self, animal_id: int, item: str) -> int:
+        """Structured ``Dog.fetch``; returns the event code."""
+        dog = self.log.animals[animal_id]
+        if dog.is_sleeping:
+            return self._emit(FETCH_SLEEPING, animal_id)
+        if dog.energy < FETCH_MIN_ENERGY:
+            return self._emit(FETCH_TIRED, animal_id)
+        dog.energy -= FETCH_COST
+        return self._emit(FETCH, animal_id, item)
+
+    def learn_trick(self, animal_id: int, trick: str) -> int:
+        """Structured ``Dog.learn_trick``; returns the event code."""
+        dog = self.log.animals[animal_id]
+        if trick in dog.tricks:
+            return self._emit(TRICK_KNOWN, animal_id, trick)
+        dog.tricks.append(trick)
+        return self._emit(LEARN_TRICK, animal_id, trick)
+
+    def perform_trick(self, animal_id: int, trick: str) -> int:
+        """Structured ``Dog.perform_trick``; returns the event code."""
+        dog = self.log.animals[animal_id]
+        if trick not in dog.tricks:
+            return self._emit(TRICK_UNKNOWN, animal_id, trick)
+        if dog.is_sleeping:
+            return self._emit(TRICK_SLEEPING, animal_id)
+        return self._emit(PERFORM_TRICK, animal_id, trick)
+
+    def purr(self, animal_id: int) -> int:
+        """Structured ``Cat.purr``; returns the event code."""
+        cat = self.log.animals[animal_id]
+        if cat.is_sleeping:
+            return self._emit(PURR_SLEEPING, animal_id)
+        cat.is_purring = True
+        return self._emit(PURR, animal_id)
+
+    def climb_tree(self, animal_id: int) -> int:
+        """Structured ``Cat.climb_tree``; returns the event code."""
+        cat = self.log.animals[animal_id]
+        if cat.is_sleeping:
+            return self._emit(CLIMB_SLEEPING, animal_id)
+        if cat.energy < CLIMB_MIN_ENERGY:
+            return self._emit(CLIMB_TIRED, animal_id)
+        cat.energy -= CLIMB_COST
+        return self._emit(CLIMB, animal_id)
+
+    def knock_over_object(self, animal_id: int, object_name: str) -> int:
+        """Structured ``Cat.knock_over_object``; returns the event code."""
+        cat = self.log.animals[animal_id]
+        if cat.is_sleeping:
+            return self._emit(KNOCK_OVER_SLEEPING, animal_id)
+        return self._emit(KNOCK_OVER, animal_id, object_name)
+
+    def fly(self, animal_id: int, height: int) -> int:
+        """Structured ``Bird.fly``; returns the event code."""
+        bird = self.log.animals[animal_id]
+        if bird.is_sleeping:
+            return self._emit(FLY_SLEEPING, animal_id)
+        if bird.energy < FLY_MIN_ENERGY:
+            return self._emit(FLY_TIRED, animal_id)
+        bird.is_flying = True
+        bird.altitude = height
+        bird.energy -= FLY_COST
+        return self._emit(FLY, animal_id, height)
+
+    def land(self, animal_id: int) -> int:
+        """Structured ``Bird.land``; returns the event code."""
+        bird = self.log.animals[animal_id]
+        if not bird.is_flying:
+            return self._emit(ALREADY_LANDED, animal_id)
+        bird.is_flying = False
+        bird.altitude = 0
+        return self._emit(LAND, animal_id)
@@ -0,0 +1,391 @@
+"""
+Flocking simulation for ``Bird``.
+
+``FlockBird`` is a ``Bird`` with a 3D position and velocity. A ``Flock``
+keeps many of them in parallel ``array`` columns (like ``Population``) and
+advances every bird one step at a time with the classic boids rules:
+
+- separation: steer away from neighbors that are too close
+- alignment: match the average heading of the neighbors
+- cohesion: steer towards the neighbors' centre
+
+Neighbors are found with a uniform grid whose cell size is the neighbor
+radius, so each bird only looks at the 27 cells around it instead of at the
+whole flock. New velocities are computed for every bird from the previous
+step's state and then positions are advanced as whole-column updates.
+
+Flight follows the ``Bird.fly`` rules: sleeping birds and birds with less
+than 25 energy cannot take off, taking off costs 20 energy, and staying in
+the air drains ``energy_per_step`` every step. A bird whose energy drops
+below 25 lands.
+"""
+import array
+import math
+from collections import defaultdict
+from operator import add, mul
+
+from inheritance import FLY_COST, FLY_MIN_ENERGY, MAX_ENERGY, Bird
+
+# Offsets of the 27 grid cells around (and including) a bird's own cell
+NEIGHBOR_CELLS = tuple(
+    (dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+)
+
+
+class FlockBird(Bird):
+    """
+    A bird with a position and velocity in 3D space.
+
+    ``position[2]`` is the height above the ground; it follows ``altitude``
+    when the bird takes off or lands.
+    """
+
+    def __init__(self, name: str, age: int, wing_span: float, position=(0.0, 0.0, 0.0), velocity=(0.0, 0.0, 0.0)):
+        """
+        Initialize a flocking bird.
+
+        Args:
+            name (str): The bird's name
+            age (int): The bird's age in years
+            wing_span (float): The bird's wing span in inches
+            position (tuple, optional): (x, y, z) position in feet
+            velocity (tuple, optional): (vx, vy, vz) velocity in feet per step
+        """
+        super().__init__(name, age, wing_span)
+        self.position = list(position)
+        self.velocity = list(velocity)
+
+    def fly(self, height: int) -> str:
+        """
+        Take off to a height; same rules and message as ``Bird.fly``.
+
+        Args:
+            height (int): How high to fly in feet
+
+        Returns:
+            str: Message about flying
+        """
+        message = super().fly(height)
+        if self.is_flying:
+            self.position[2] = float(self.altitude)
+        return message
+
+    def land(self) -> str:
+        """
+        Land and stop moving; same message as ``Bird.land``.
+
+        Returns:
+            str: Message about landing
+        """
+        message = super().land()
+        self.position[2] = 0.0
+        self.velocity = [0.0, 0.0, 0.0]
+        return message
+
+
+class Flock:
+    """
+    Many flocking birds stored as columns.
+
+    Example:
+        flock = Flock.from_birds(birds, radius=10.0)
+        flock.take_off(50)
+        for _ in range(100):
+            flock.step()
+        flock.to_birds()
+    """
+
+    def __init__(
+        self,
+        radius: float = 10.0,
+        separation_radius: float = 3.0,
+        separation: float = 0.05,
+        alignment: float = 0.05,
+        cohesion: float = 0.01,
+        max_speed: float = 4.0,
+        max_neighbors: int = 32,
+        energy_per_step: int = 1,
+    ):
+        """
+        Create an empty flock.
+
+        Args:
+            radius (float, optional): Neighbor radius, also the grid cell size
+            separation_radius (float, optional): Distance below which birds
+                push each other apart
+            separation (float, optional): Weight of the separation rule
+            alignment (float, optional): Weight of the alignment rule
+            cohesion (float, optional): Weight of the cohesion rule
+            max_speed (float, optional): Speed limit in feet per step
+            max_neighbors (int, optional): Neighbors considered per bird,
+                which bounds the work per step in dense flocks
+            energy_per_step (int, optional): Energy a flying bird spends per step
+        """
+        if radius <= 0 or max_speed <= 0:
+            raise ValueError("radius and max_speed must be positive")
+        self.radius = radius
+        self.separation_radius = separation_radius
+        self.weights = (separation, alignment, cohesion)
+        self.max_speed = max_speed
+        self.max_neighbors = max_neighbors
+        self.energy_per_step = energy_per_step
+        self.steps = 0
+
+        self.names = []
+        self.ages = array.array("i")
+        self.wing_spans = array.array("d")
+        self.energy = array.array("i")
+        self.is_sleeping = bytearray()
+        self.is_flying = bytearray()
+        self.altitude = array.array("i")
+        self.x, self.y, self.z = array.array("d"), array.array("d"), array.array("d")
+        self.vx, self.vy, self.vz = array.array("d"), array.array("d"), array.array("d")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_bird(self, name: str, age: int, wing_span: float, position=(0.0, 0.0, 0.0), velocity=(0.0, 0.0, 0.0)) -> int:
+        """Add a grounded bird with the same initial state as ``FlockBird(...)``."""
+        self.names.append(name)
+        self.ages.append(age)
+        self.wing_spans.append(wing_span)
+        self.energy.append(MAX_ENERGY)
+        self.is_sleeping.append(False)
+        self.is_flying.append(False)
+        self.altitude.append(0)
+        for column, value in zip((self.x, self.y, self.z), position):
+            column.append(value)
+        for column, value in zip((self.vx, self.vy, self.vz), velocity):
+            column.append(value)
+        return len(self.names) - 1
+
+    def add(self, bird) -> int:
+        """
+        Copy a bird's current state into the flock.
+
+        Plain ``Bird`` objects start at the origin (at their altitude) with
+        no velocity.
+
+        Args:
+            bird (Bird): A Bird or FlockBird instance
+
+        Returns:
+            int: Index of the new entry
+        """
+        position = getattr(bird, "position", (0.0, 0.0, float(bird.altitude)))
+        velocity = getattr(bird, "velocity", (0.0, 0.0, 0.0))
+        index = self.add_bird(bird.name, bird.age, bird.wing_span, position, velocity)
+        self.energy[index] = bird.energy
+        self.is_sleeping[index] = bird.is_sleeping
+        self.is_flying[index] = bird.is_flying
+        self.altitude[index] = bird.altitude
+        return index
+
+    @classmethod
+    def from_birds(cls, birds, **options):
+        """
+        Build a flock from bird objects.
+
+        Args:
+            birds: Iterable of Bird instances
+            **options: Passed to ``Flock``
+
+        Returns:
+            Flock: A flock holding a copy of their state
+        """
+        flock = cls(**options)
+        for bird in birds:
+            flock.add(bird)
+        return flock
+
+    def to_bird(self, index: int) -> FlockBird:
+        """Build a ``FlockBird`` from one entry."""
+        bird = FlockBird(
+            self.names[index], self.ages[index], self.wing_spans[index],
+            (self.x[index], self.y[index], self.z[index]),
+            (self.vx[index], self.vy[index], self.vz[index]),
+        )
+        bird.energy = self.energy[index]
+        bird.is_sleeping = bool(self.is_sleeping[index])
+        bird.is_flying = bool(self.is_flying[index])
+        bird.altitude = self.altitude[index]
+        return bird
+
+    def to_birds(self) -> list:
+        """Build ``FlockBird`` objects for every entry."""
+        return [self.to_bird(index) for index in range(len(self))]
+
+    def flying(self) -> list:
+        """Return the indices of the birds in the air."""
+        flying = self.is_flying
+        return [i for i in range(len(self)) if flying[i]]
+
+    def take_off(self, height: int, where=None) -> list:
+        """
+        Apply ``Bird.fly`` to many birds.
+
+        Awake birds with at least 25 energy rise to ``height`` and spend 20.
+
+        Args:
+            height (int): Take-off height in feet
+            where (optional): Iterable of candidate indices (defaults to all)
+
+        Returns:
+            list: Indices of the birds that took off
+        """
+        sleeping, energy, flying = self.is_sleeping, self.energy, self.is_flying
+        indices = range(len(self)) if where is None else where
+        done = [i for i in indices if not sleeping[i] and energy[i] >= FLY_MIN_ENERGY]
+        for i in done:
+            flying[i] = True
+            self.altitude[i] = height
+            self.z[i] = float(height)
+            energy[i] -= FLY_COST
+        return done
+
+    def land(self, where=None) -> list:
+        """
+        Apply ``Bird.land`` to many birds; landed birds stop moving.
+
+        Args:
+            where (optional): Iterable of candidate indices (defaults to all)
+
+        Returns:
+            list: Indices of the birds that landed
+        """
+        flying = self.is_flying
+        indices = range(len(self)) if where is None else where
+        done = [i for i in indices if flying[i]]
+        for i in done:
+            flying[i] = False
+            self.altitude[i] = 0
+            self.z[i] = self.vx[i] = self.vy[i] = self.vz[i] = 0.0
+        return done
+
+    def _grid(self, indices):
+        """Bucket bird indices by grid cell."""
+        size = self.radius
+        x, y, z = self.x, self.y, self.z
+        grid = defaultdict(list)
+        for i in indices:
+            grid[(math.floor(x[i] / size), math.floor(y[i] / size), math.floor(z[i] / size))].append(i)
+        return grid
+
+    def _neighbors(self, grid, i):
+        size = self.radius
+        limit = size * size
+        x, y, z = self.x, self.y, self.z
+        px, py, pz = x[i], y[i], z[i]
+        cx, cy, cz = math.floor(px / size), math.floor(py / size), math.floor(pz / size)
+        found = []
+        for dx, dy, dz in NEIGHBOR_CELLS:
+            for j in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                if j == i:
+                    continue
+                distance = (x[j] - px) ** 2 + (y[j] - py) ** 2 + (z[j] - pz) ** 2
+                if distance <= limit:
+                    found.append((distance, j))
+        return found
+
+    def neighbors(self, index: int) -> list:
+        """
+        Return the flying birds within ``radius`` of a bird.
+
+        Args:
+            index (int): Bird index
+
+        Returns:
+            list: Neighbor indices, nearest first
+        """
+        found = self._neighbors(self._grid(self.flying()), index)
+        return [j for _, j in sorted(found)]
+
+    def step(self, dt: float = 1.0) -> list:
+        """
+        Advance the flock by one step.
+
+        Only flying birds move. Velocities are updated from the boids rules,
+        limited to ``max_speed`` and applied to the positions; birds cannot
+        fly below 1 foot. Flying costs ``energy_per_step`` and birds whose
+        energy falls below 25 land.
+
+        Args:
+            dt (float, optional): Time step; positions move by velocity * dt
+
+        Returns:
+            list: Indices of the birds that landed because they were tired
+        """
+        active = self.flying()
+        grid = self._grid(active)
+        x, y, z = self.x, self.y, self.z
+        vx, vy, vz = self.vx, self.vy, self.vz
+        w_separation, w_alignment, w_cohesion = self.weights
+        separation_limit = self.separation_radius ** 2
+        max_speed = self.max_speed
+        max_neighbors = self.max_neighbors
+
+        # Compute every new velocity from the previous step's state first
+        updates = []
+        for i in active:
+            found = self._neighbors(grid, i)
+            nvx, nvy, nvz = vx[i], vy[i], vz[i]
+            if found:
+                if len(found) > max_neighbors:
+                    found.sort()
+                    del found[max_neighbors:]
+                count = len(found)
+                px, py, pz = x[i], y[i], z[i]
+                sx = sy = sz = 0.0
+                ax = ay = az = 0.0
+                mx = my = mz = 0.0
+                for distance, j in found:
+                    ax += vx[j]
+                    ay += vy[j]
+                    az += vz[j]
+                    mx += x[j]
+                    my += y[j]
+                    mz += z[j]
+                    if distance < separation_limit:
+                        weight = 1.0 / (distance or 1e-9)
+                        sx += (px - x[j]) * weight
+                        sy += (py - y[j]) * weight
+                        sz += (pz - z[j]) * weight
+                nvx += w_separation * sx + w_alignment * (ax / count - nvx) + w_cohesion * (mx / count - px)
+                nvy += w_separation * sy + w_alignment * (ay / count - nvy) + w_cohesion * (my / count - py)
+                nvz += w_separation * sz + w_alignment * (az / count - nvz) + w_cohesion * (mz / count - pz)
+            speed = math.sqrt(nvx * nvx + nvy * nvy + nvz * nvz)
+            if speed > max_speed:
+                scale = max_speed / speed
+                nvx, nvy, nvz = nvx * scale, nvy * scale, nvz * scale
+            updates.append((i, nvx, nvy, nvz))
+        for i, nvx, nvy, nvz in updates:
+            vx[i], vy[i], vz[i] = nvx, nvy, nvz
+
+        # Whole-column position update; grounded birds get a zero time step
+        steps = [dt if flying else 0.0 for flying in self.is_flying]
+        x[:] = array.array("d", map(add, x, map(mul, vx, steps)))
+        y[:] = array.array("d", map(add, y, map(mul, vy, steps)))
+        z[:] = array.array("d", map(add, z, map(mul, vz, steps)))
+
+        energy, altitude = self.energy, self.altitude
+        cost = self.energy_per_step
+        tired = []
+        for i in active:
+            if z[i] < 1.0:
+                z[i] = 1.0
+                vz[i] = abs(vz[i])
+            altitude[i] = round(z[i])
+            energy[i] = max(0, energy[i] - cost)
+            if energy[i] < FLY_MIN_ENERGY:
+                tired.append(i)
+        self.land(tired)
+        self.steps += 1
+        return tired
+
+    def centroid(self, where=None) -> tuple:
+        """Return the mean (x, y, z) of the flying birds (or of ``where``)."""
+        indices = self.flying() if where is None else list(where)
+        if not indices:
+            return (0.0, 0.0, 0.0)
+        count = len(indices)
+        return tuple(math.fsum(column[i] for i in indices) / count for column in (self.x, self.y, self.z))
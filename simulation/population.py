@@ -0,0 +1,345 @@
+"""
+Column-based population engine for the animals in ``inheritance.py``.
+
+A ``Population`` keeps the state of many animals in parallel columns (one
+entry per animal) instead of one Python object per animal. Actions such as
+``eat`` or ``fly`` are applied to a selection of animals at once and follow
+exactly the same rules as the corresponding ``Animal``/``Dog``/``Cat``/``Bird``
+methods (energy caps, tiredness thresholds, sleeping checks), but without
+building a message string for every animal.
+
+Every action takes an optional ``where`` argument - an iterable of animal
+indices - and returns the list of indices the action succeeded for.
+"""
+import array
+
+from inheritance import (
+    CLIMB_COST,
+    CLIMB_MIN_ENERGY,
+    EAT_ENERGY,
+    FETCH_COST,
+    FETCH_MIN_ENERGY,
+    FLY_COST,
+    FLY_MIN_ENERGY,
+    MAX_ENERGY,
+    Animal,
+    Bird,
+    Cat,
+    Dog,
+)
+
+# Kind codes stored in the ``kinds`` column
+ANIMAL, DOG, CAT, BIRD = 0, 1, 2, 3
+KIND_CLASSES = {ANIMAL: Animal, DOG: Dog, CAT: Cat, BIRD: Bird}
+CLASS_KINDS = {cls: kind for kind, cls in KIND_CLASSES.items()}
+
+
+def kind_of(animal) -> int:
+    """
+    Return the kind code for an animal instance.
+
+    Args:
+        animal: An Animal (or Dog, Cat, Bird) instance
+
+    Returns:
+        int: One of ANIMAL, DOG, CAT, BIRD
+    """
+    kind = CLASS_KINDS.get(type(animal))
+    if kind is not None:
+        return kind
+    for cls in (Dog, Cat, Bird):
+        if isinstance(animal, cls):
+            return CLASS_KINDS[cls]
+    return ANIMAL
+
+
+class Population:
+    """
+    Many animals stored as columns.
+
+    Columns shared by all animals: ``names``, ``species``, ``ages``,
+    ``kinds``, ``energy``, ``is_sleeping``. Kind-specific columns exist for
+    every animal and hold neutral defaults for the other kinds:
+    ``breeds``, ``is_trained``, ``tricks`` (dogs), ``colors``,
+    ``lives_remaining``, ``is_purring`` (cats), ``wing_spans``,
+    ``is_flying``, ``altitude`` (birds).
+
+    Example:
+        population = Population.from_animals([Dog("Rex", 3, "Lab"), Bird("Tweety", 1, 8.5)])
+        population.fly(50)
+        population.land()
+    """
+
+    def __init__(self):
+        """Create an empty population."""
+        self.names = []
+        self.species = []
+        self.ages = array.array("i")
+        self.kinds = array.array("b")
+        self.energy = array.array("i")
+        self.is_sleeping = bytearray()
+        # Dog columns
+        self.breeds = []
+        self.is_trained = bytearray()
+        self.tricks = []
+        # Cat columns
+        self.colors = []
+        self.lives_remaining = array.array("i")
+        self.is_purring = bytearray()
+        # Bird columns
+        self.wing_spans = array.array("d")
+        self.is_flying = bytearray()
+        self.altitude = array.array("i")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def _append(self, kind, name, species, age):
+        self.names.append(name)
+        self.species.append(species)
+        self.ages.append(age)
+        self.kinds.append(kind)
+        self.energy.append(MAX_ENERGY)
+        self.is_sleeping.append(False)
+        self.breeds.append(None)
+        self.is_trained.append(False)
+        self.tricks.append([])
+        self.colors.append(None)
+        self.lives_remaining.append(0)
+        self.is_purring.append(False)
+        self.wing_spans.append(0.0)
+        self.is_flying.append(False)
+        self.altitude.append(0)
+        return len(self.kinds) - 1
+
+    def add_dog(self, name: str, age: int, breed: str) -> int:
+        """Add a dog with the same initial state as ``Dog(name, age, breed)``."""
+        index = self._append(DOG, name, "Dog", age)
+        self.breeds[index] = breed
+        return index
+
+    def add_cat(self, name: str, age: int, color: str) -> int:
+        """Add a cat with the same initial state as ``Cat(name, age, color)``."""
+        index = self._append(CAT, name, "Cat", age)
+        self.colors[index] = color
+        self.lives_remaining[index] = 9
+        return index
+
+    def add_bird(self, name: str, age: int, wing_span: float) -> int:
+        """Add a bird with the same initial state as ``Bird(name, age, wing_span)``."""
+        index = self._append(BIRD, name, "Bird", age)
+        self.wing_spans[index] = wing_span
+        return index
+
+    def add(self, animal) -> int:
+        """
+        Copy an animal object's current state into the population.
+
+        Args:
+            animal: An Animal, Dog, Cat or Bird instance
+
+        Returns:
+            int: Index of the new entry
+        """
+        kind = kind_of(animal)
+        index = self._append(kind, animal.name, animal.species, animal.age)
+        self.energy[index] = animal.energy
+        self.is_sleeping[index] = animal.is_sleeping
+        if kind == DOG:
+            self.breeds[index] = animal.breed
+            self.is_trained[index] = animal.is_trained
+            self.tricks[index] = list(animal.tricks)
+        elif kind == CAT:
+            self.colors[index] = animal.color
+            self.lives_remaining[index] = animal.lives_remaining
+            self.is_purring[index] = animal.is_purring
+        elif kind == BIRD:
+            self.wing_spans[index] = animal.wing_span
+            self.is_flying[index] = animal.is_flying
+            self.altitude[index] = animal.altitude
+        return index
+
+    @classmethod
+    def from_animals(cls, animals):
+        """
+        Build a population from animal objects.
+
+        Args:
+            animals: Iterable of Animal instances
+
+        Returns:
+            Population: A population holding a copy of their state
+        """
+        population = cls()
+        for animal in animals:
+            population.add(animal)
+        return population
+
+    def to_animal(self, index: int):
+        """
+        Build an animal object from one entry.
+
+        Args:
+            index (int): Animal index
+
+        Returns:
+            Animal: A new Dog, Cat, Bird or Animal with the stored state
+        """
+        kind = self.kinds[index]
+        name, age = self.names[index], self.ages[index]
+        if kind == DOG:
+            animal = Dog(name, age, self.breeds[index])
+            animal.is_trained = bool(self.is_trained[index])
+            animal.tricks = list(self.tricks[index])
+        elif kind == CAT:
+            animal = Cat(name, age, self.colors[index])
+            animal.lives_remaining = self.lives_remaining[index]
+            animal.is_purring = bool(self.is_purring[index])
+        elif kind == BIRD:
+            animal = Bird(name, age, self.wing_spans[index])
+            animal.is_flying = bool(self.is_flying[index])
+            animal.altitude = self.altitude[index]
+        else:
+            animal = Animal(name, self.species[index], age)
+        animal.energy = self.energy[index]
+        animal.is_sleeping = bool(self.is_sleeping[index])
+        return animal
+
+    def to_animals(self) -> list:
+        """Build animal objects for every entry."""
+        return [self.to_animal(index) for index in range(len(self))]
+
+    def select(self, kind: int = None, where=None) -> list:
+        """
+        Return animal indices, optionally restricted to one kind.
+
+        Args:
+            kind (int, optional): Kind code to keep
+            where (optional): Iterable of candidate indices (defaults to all)
+
+        Returns:
+            list: Matching indices
+        """
+        indices = range(len(self)) if where is None else where
+        if kind is None:
+            return list(indices)
+        kinds = self.kinds
+        return [i for i in indices if kinds[i] == kind]
+
+    # Shared Animal actions
+
+    def eat(self, where=None) -> list:
+        """Apply ``Animal.eat``: +20 energy, capped at 100 (works while asleep)."""
+        indices = self.select(where=where)
+        energy = self.energy
+        if where is None:
+            # Whole-column update, in place so existing references stay valid
+            energy[:] = array.array("i", [min(MAX_ENERGY, e + EAT_ENERGY) for e in energy])
+        else:
+            for i in indices:
+                energy[i] = min(MAX_ENERGY, energy[i] + EAT_ENERGY)
+        return indices
+
+    def sleep(self, where=None) -> list:
+        """Apply ``Animal.sleep``: awake animals fall asleep with full energy."""
+        sleeping, energy = self.is_sleeping, self.energy
+        done = [i for i in self.select(where=where) if not sleeping[i]]
+        for i in done:
+            sleeping[i] = True
+            energy[i] = MAX_ENERGY
+        return done
+
+    def wake_up(self, where=None) -> list:
+        """Apply ``Animal.wake_up``: sleeping animals wake."""
+        sleeping = self.is_sleeping
+        done = [i for i in self.select(where=where) if sleeping[i]]
+        for i in done:
+            sleeping[i] = False
+        return done
+
+    # Kind-specific actions
+
+    def fetch(self, where=None) -> list:
+        """Apply ``Dog.fetch``: awake dogs with >= 20 energy spend 15."""
+        sleeping, energy = self.is_sleeping, self.energy
+        done = [
+            i for i in self.select(DOG, where)
+            if not sleeping[i] and energy[i] >= FETCH_MIN_ENERGY
+        ]
+        for i in done:
+            energy[i] -= FETCH_COST
+        return done
+
+    def purr(self, where=None) -> list:
+        """Apply ``Cat.purr``: awake cats start purring."""
+        sleeping, purring = self.is_sleeping, self.is_purring
+        done = [i for i in self.select(CAT, where) if not sleeping[i]]
+        for i in done:
+            purring[i] = True
+        return done
+
+    def climb_tree(self, where=None) -> list:
+        """Apply ``Cat.climb_tree``: awake cats with >= 30 energy spend 20."""
+        sleeping, energy = self.is_sleeping, self.energy
+        done = [
+            i for i in self.select(CAT, where)
+            if not sleeping[i] and energy[i] >= CLIMB_MIN_ENERGY
+        ]
+        for i in done:
+            energy[i] -= CLIMB_COST
+        return done
+
+    def fly(self, height: int, where=None) -> list:
+        """Apply ``Bird.fly``: awake birds with >= 25 energy fly and spend 20."""
+        sleeping, energy = self.is_sleeping, self.energy
+        flying, altitude = self.is_flying, self.altitude
+        done = [
+            i for i in self.select(BIRD, where)
+            if not sleeping[i] and energy[i] >= FLY_MIN_ENERGY
+        ]
+        for i in done:
+            flying[i] = True
+            altitude[i] = height
+            energy[i] -= FLY_COST
+        return done
+
+    def land(self, where=None) -> list:
+        """Apply ``Bird.land``: flying birds return to the ground."""
+        flying, altitude = self.is_flying, self.altitude
+        done = [i for i in self.select(BIRD, where) if flying[i]]
+        for i in done:
+            flying[i] = False
+            altitude[i] = 0
+        return done
+
+    ACTIONS = ("eat", "sleep", "wake_up", "fetch", "purr", "climb_tree", "fly", "land")
+
+    def tick(self, plan) -> dict:
+        """
+        Apply several actions in order, as one simulation step.
+
+        Args:
+            plan: Iterable of (action name, where) or (action name, where, *args),
+                e.g. ``[("fetch", dogs), ("fly", None, 50)]``
+
+        Returns:
+            dict: action name -> indices it succeeded for (later entries for
+                the same action overwrite earlier ones)
+        """
+        results = {}
+        for action, where, *args in plan:
+            if action not in self.ACTIONS:
+                raise ValueError(f"Unknown action {action!r}")
+            if action == "fly":
+                results[action] = self.fly(*args, where=where)
+            else:
+                results[action] = getattr(self, action)(where)
+        return results
+
+    def average_energy(self) -> float:
+        """Return the mean energy (0.0 for an empty population)."""
+        return sum(self.energy) / len(self) if len(self) else 0.0
+
+    def sleeping_count(self) -> int:
+        """Return how many animals are asleep."""
+        return self.is_sleeping.count(1)
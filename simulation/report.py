@@ -0,0 +1,168 @@
+"""
+Streaming census reports for a ``Population``.
+
+Calling ``get_info`` on millions of animal objects builds every multi-line
+string through a chain of ``super().get_info()`` calls and usually collects
+the results in memory before writing them. The writers here render each
+line directly from the population's state columns, a chunk of animals at a
+time, and stream the chunks through a buffered file.
+
+The ``info`` text is identical to what ``get_info`` returns for the same
+animal. (Wing spans are stored as floats, so a bird created with
+``wing_span=8`` reports ``8.0`` - the same as ``Population.to_animal``.)
+
+Formats:
+    text   the ``get_info`` text of each animal followed by a blank line
+    csv    one row per animal with the state fields and the ``info`` text
+    jsonl  one JSON object per line with the same fields as the CSV
+"""
+import csv
+import json
+
+from .population import BIRD, CAT, DOG, Population
+
+FIELDS = (
+    "name", "species", "age", "energy", "is_sleeping", "breed", "tricks",
+    "color", "lives_remaining", "is_purring", "wing_span", "is_flying",
+    "altitude", "info",
+)
+FORMATS = ("text", "csv", "jsonl")
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+def iter_info(population: Population, start: int = 0, stop: int = None):
+    """
+    Yield the ``get_info`` text of each animal from the columns.
+
+    Args:
+        population (Population): The animals
+        start (int, optional): First index
+        stop (int, optional): Index to stop before (defaults to the end)
+
+    Yields:
+        str: Same text as ``get_info`` on the equivalent object
+    """
+    stop = len(population) if stop is None else stop
+    names, species, ages = population.names, population.species, population.ages
+    kinds, energy, sleeping = population.kinds, population.energy, population.is_sleeping
+    for i in range(start, stop):
+        status = "sleeping" if sleeping[i] else "awake"
+        info = f"{names[i]} is a {ages[i]}-year-old {species[i]} ({status}, energy: {energy[i]})"
+        kind = kinds[i]
+        if kind == DOG:
+            tricks = population.tricks[i]
+            trick_info = f"Knows {len(tricks)} tricks: {', '.join(tricks)}" if tricks else "No tricks learned yet"
+            info = f"{info}\nBreed: {population.breeds[i]}\n{trick_info}"
+        elif kind == CAT:
+            purr_status = "purring" if population.is_purring[i] else "not purring"
+            info = f"{info}\nColor: {population.colors[i]}\nLives remaining: {population.lives_remaining[i]}\nCurrently {purr_status}"
+        elif kind == BIRD:
+            flight_status = f"flying at {population.altitude[i]} feet" if population.is_flying[i] else "on the ground"
+            info = f"{info}\nWing span: {population.wing_spans[i]} inches\nCurrently {flight_status}"
+        yield info
+
+
+def iter_records(population: Population, start: int = 0, stop: int = None):
+    """
+    Yield one report record per animal, in ``FIELDS`` order.
+
+    Kind-specific fields are None for animals of other kinds; ``tricks`` is
+    a list.
+
+    Args:
+        population (Population): The animals
+        start (int, optional): First index
+        stop (int, optional): Index to stop before (defaults to the end)
+
+    Yields:
+        tuple: Values for ``FIELDS``
+    """
+    stop = len(population) if stop is None else stop
+    kinds = population.kinds
+    for i, info in zip(range(start, stop), iter_info(population, start, stop)):
+        kind = kinds[i]
+        dog, cat, bird = kind == DOG, kind == CAT, kind == BIRD
+        yield (
+            population.names[i],
+            population.species[i],
+            population.ages[i],
+            population.energy[i],
+            bool(population.is_sleeping[i]),
+            population.breeds[i] if dog else None,
+            list(population.tricks[i]) if dog else None,
+            population.colors[i] if cat else None,
+            population.lives_remaining[i] if cat else None,
+            bool(population.is_purring[i]) if cat else None,
+            population.wing_spans[i] if bird else None,
+            bool(population.is_flying[i]) if bird else None,
+            population.altitude[i] if bird else None,
+            info,
+        )
+
+
+def _write_text(population, handle, chunk_size):
+    for start in range(0, len(population), chunk_size):
+        chunk = iter_info(population, start, min(start + chunk_size, len(population)))
+        handle.write("".join(f"{info}\n\n" for info in chunk))
+
+
+def _write_csv(population, handle, chunk_size):
+    writer = csv.writer(handle, lineterminator="\n")
+    writer.writerow(FIELDS)
+    tricks_field = FIELDS.index("tricks")
+    for start in range(0, len(population), chunk_size):
+        rows = []
+        for record in iter_records(population, start, min(start + chunk_size, len(population))):
+            if record[tricks_field] is not None:
+                record = list(record)
+                record[tricks_field] = ";".join(record[tricks_field])
+            rows.append(record)
+        writer.writerows(rows)
+
+
+def _write_jsonl(population, handle, chunk_size):
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for start in range(0, len(population), chunk_size):
+        records = iter_records(population, start, min(start + chunk_size, len(population)))
+        handle.write("".join(f"{encode(dict(zip(FIELDS, record)))}\n" for record in records))
+
+
+WRITERS = {"text": _write_text, "csv": _write_csv, "jsonl": _write_jsonl}
+
+
+def write_report(
+    population,
+    destination,
+    format: str = "text",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Stream a census report.
+
+    Args:
+        population: A Population, or an iterable of Animal objects
+        destination: File path, or a text file object opened for writing
+            (CSV output expects it to be opened with ``newline=""``)
+        format (str, optional): "text", "csv" or "jsonl"
+        chunk_size (int, optional): Animals rendered per write
+        buffer_size (int, optional): Write buffer size when opening a path
+
+    Returns:
+        int: Number of animals written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    writer = WRITERS.get(format)
+    if writer is None:
+        raise ValueError(f"Unknown report format {format!r}, expected one of {', '.join(FORMATS)}")
+    if not isinstance(population, Population):
+        population = Population.from_animals(population)
+    if hasattr(destination, "write"):
+        writer(population, destination, chunk_size)
+    else:
+        with open(destination, "w", encoding="utf-8", newline="", buffering=buffer_size) as handle:
+            writer(population, handle, chunk_size)
+    return len(population)
@@ -0,0 +1,299 @@
+"""
+Sharded multi-process simulation of a ``Population``.
+
+The animals are split into contiguous shards and the numeric state every
+action touches (kinds, energy, sleeping/flying flags, altitude) is copied
+once into a ``multiprocessing.shared_memory`` block. Worker processes attach
+to the block when the pool starts, so a tick only sends ``(shard, tick)``
+pairs across the process boundary.
+
+Each tick runs in two phases separated by a barrier:
+
+1. act - every shard applies one action to each of its own animals,
+   following the ``Population`` rules. A barking dog wakes its target; the
+   target ids are written to the shard's outbox in shared memory instead of
+   being applied, grouped by the shard that owns the target. A
+   shards x shards table records where each (source, destination) group
+   starts and how long it is.
+2. deliver - every shard reads only the groups addressed to it, applies
+   those wake-ups to its own animals and reports its energy sum and
+   sleeping count. Delivery costs O(shards + wake-ups received) per shard.
+
+Wake-ups only take effect at the barrier and all randomness comes from a
+hash of (seed, tick, animal index), so a run gives the same result for any
+number of shards and workers.
+"""
+import array
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .population import (
+    BIRD, CAT, CLIMB_COST, CLIMB_MIN_ENERGY, DOG, EAT_ENERGY, FETCH_COST,
+    FETCH_MIN_ENERGY, FLY_COST, FLY_MIN_ENERGY, MAX_ENERGY, Population,
+)
+
+TickStats = namedtuple("TickStats", "tick average_energy sleeping_count woken cross_shard")
+
+# Shared columns in block order: name, typecode, items per animal.
+# The 4-byte columns come first so every section stays aligned.
+SHARED_COLUMNS = (
+    ("energy", "i"),
+    ("altitude", "i"),
+    ("outbox", "i"),
+    ("kinds", "b"),
+    ("is_sleeping", "B"),
+    ("is_flying", "B"),
+)
+
+# Per-tick behaviour of an animal, driven by one uniform draw ``u``
+WAKE_CHANCE = 0.3  # sleeping animals wake up when u < WAKE_CHANCE
+SLEEP_CHANCE = 0.05  # awake animals fall asleep when u < SLEEP_CHANCE
+EAT_CHANCE = 0.25  # ... otherwise eat when u < EAT_CHANCE
+BARK_CHANCE = 0.2  # dogs bark at a random animal when u >= 1 - BARK_CHANCE
+LAND_CHANCE = 0.5  # flying birds land when u >= 1 - LAND_CHANCE
+
+_MASK = (1 << 64) - 1
+_SCALE = 1.0 / (1 << 64)
+
+# Attached block and column views, populated once per worker process
+_WORKER = {}
+
+
+def _hash(seed: int, tick: int, index: int, salt: int = 0) -> int:
+    """Return a 64-bit pseudo-random value for one animal and tick (splitmix64)."""
+    z = (seed * 0x9E3779B97F4A7C15 + tick * 0xBF58476D1CE4E5B9 + index * 0x94D049BB133111EB + salt) & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+
+def _block_size(count: int, shards: int) -> int:
+    return sum(count * array.array(typecode).itemsize for _, typecode in SHARED_COLUMNS) + 8 * shards * shards
+
+
+def _views(block, count: int, shards: int) -> dict:
+    views = {}
+    offset = 0
+    for name, typecode in SHARED_COLUMNS:
+        size = count * array.array(typecode).itemsize
+        views[name] = block.buf[offset:offset + size].cast(typecode)
+        offset += size
+    # (source shard * shards + destination shard) -> group length / start slot
+    cells = 4 * shards * shards
+    views["outbox_counts"] = block.buf[offset:offset + cells].cast("i")
+    views["outbox_offsets"] = block.buf[offset + cells:offset + 2 * cells].cast("i")
+    return views
+
+
+def _attach(name, count, bounds, seed):
+    """Pool initializer: map the shared block into this worker."""
+    block = shared_memory.SharedMemory(name=name)
+    _WORKER["block"] = block
+    _WORKER["state"] = (_views(block, count, len(bounds)), count, bounds, seed)
+
+
+def _act_task(shard, tick, state=None):
+    """Phase 1: apply one action to every animal of a shard."""
+    views, count, bounds, seed = _WORKER["state"] if state is None else state
+    start, stop = bounds[shard]
+    kinds, energy = views["kinds"], views["energy"]
+    sleeping, flying, altitude = views["is_sleeping"], views["is_flying"], views["altitude"]
+    shards = len(bounds)
+    size = bounds[0][1]  # every shard but the last holds exactly ``size`` animals
+    destinations = [[] for _ in range(shards)]
+    for i in range(start, stop):
+        draw = _hash(seed, tick, i)
+        u = draw * _SCALE
+        if sleeping[i]:
+            if u < WAKE_CHANCE:
+                sleeping[i] = 0
+            continue
+        if u < SLEEP_CHANCE:
+            sleeping[i] = 1
+            energy[i] = MAX_ENERGY
+        elif u < EAT_CHANCE:
+            energy[i] = min(MAX_ENERGY, energy[i] + EAT_ENERGY)
+        else:
+            kind = kinds[i]
+            if kind == DOG:
+                if u >= 1 - BARK_CHANCE:
+                    target = _hash(seed, tick, i, 1) % count
+                    destinations[target // size].append(target)
+                elif energy[i] >= FETCH_MIN_ENERGY:
+                    energy[i] -= FETCH_COST
+            elif kind == CAT:
+                if energy[i] >= CLIMB_MIN_ENERGY:
+                    energy[i] -= CLIMB_COST
+            elif kind == BIRD:
+                if flying[i]:
+                    if u >= 1 - LAND_CHANCE:
+                        flying[i] = 0
+                        altitude[i] = 0
+                elif energy[i] >= FLY_MIN_ENERGY:
+                    flying[i] = 1
+                    altitude[i] = 10 + draw % 491
+                    energy[i] -= FLY_COST
+    # The outbox slots of a shard are its own index range; write the
+    # wake-ups there grouped by destination shard
+    outbox, counts, offsets = views["outbox"], views["outbox_counts"], views["outbox_offsets"]
+    position = start
+    row = shard * shards
+    for destination, targets in enumerate(destinations):
+        counts[row + destination] = len(targets)
+        offsets[row + destination] = position
+        if targets:
+            outbox[position:position + len(targets)] = array.array("i", targets)
+            position += len(targets)
+    return position - start
+
+
+def _deliver_task(shard, state=None):
+    """Phase 2: apply wake-ups addressed to a shard and return its statistics."""
+    views, count, bounds, seed = _WORKER["state"] if state is None else state
+    start, stop = bounds[shard]
+    sleeping, outbox = views["is_sleeping"], views["outbox"]
+    counts, offsets = views["outbox_counts"], views["outbox_offsets"]
+    shards = len(bounds)
+    woken = cross_shard = 0
+    for source in range(shards):
+        cell = source * shards + shard
+        received = counts[cell]
+        if not received:
+            continue
+        if source != shard:
+            cross_shard += received
+        offset = offsets[cell]
+        for target in outbox[offset:offset + received]:
+            if sleeping[target]:
+                sleeping[target] = 0
+                woken += 1
+    energy_sum = sum(views["energy"][start:stop])
+    sleeping_count = sum(sleeping[start:stop])
+    return energy_sum, sleeping_count, woken, cross_shard
+
+
+class ShardedSimulation:
+    """
+    Simulate a population across several processes.
+
+    Example:
+        with ShardedSimulation(population, shards=8, workers=8) as simulation:
+            for stats in simulation.run(100):
+                print(stats.average_energy, stats.sleeping_count)
+        # population now holds the final state
+    """
+
+    def __init__(self, population: Population, shards: int = None, workers: int = None, seed: int = 0):
+        """
+        Copy the population state into shared memory and start the workers.
+
+        Args:
+            population (Population): The animals to simulate; its columns are
+                updated by ``sync`` and ``close``
+            shards (int, optional): Number of shards (defaults to ``workers``)
+            workers (int, optional): Process count (defaults to the CPU count).
+                With ``workers=1`` every shard runs in the calling process.
+            seed (int, optional): Seed for the per-animal random draws
+        """
+        self.population = population
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = max(1, min(shards or self.workers, len(population) or 1))
+        self.seed = seed
+        self.tick = 0
+        count = len(population)
+        size = math.ceil(count / self.shards) if count else 0
+        self.bounds = tuple(
+            (min(shard * size, count), min((shard + 1) * size, count)) for shard in range(self.shards)
+        )
+        self._block = None
+        self._views = None
+        self._pool = None
+        try:
+            self._block = shared_memory.SharedMemory(create=True, size=max(1, _block_size(count, self.shards)))
+            self._views = _views(self._block, count, self.shards)
+            for name, _ in SHARED_COLUMNS:
+                if name != "outbox":
+                    self._views[name][:] = getattr(population, name)
+            if self.workers > 1:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_attach,
+                    initargs=(self._block.name, count, self.bounds, seed),
+                )
+        except BaseException:
+            self.close()
+            raise
+        self._state = (self._views, count, self.bounds, seed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _map(self, function, *args):
+        shards = range(self.shards)
+        if self._pool is None:
+            return [function(shard, *args, state=self._state) for shard in shards]
+        futures = [self._pool.submit(function, shard, *args) for shard in shards]
+        # Waiting for every shard is the barrier between the phases
+        return [future.result() for future in futures]
+
+    def step(self) -> TickStats:
+        """
+        Run one tick and return the global statistics after it.
+
+        Returns:
+            TickStats: tick number, average energy, sleeping count, animals
+                woken by barks and barks that crossed a shard boundary
+        """
+        self._map(_act_task, self.tick)
+        partials = self._map(_deliver_task)
+        energy_sum, sleeping_count, woken, cross_shard = (sum(values) for values in zip(*partials))
+        count = len(self.population)
+        stats = TickStats(self.tick, energy_sum / count if count else 0.0, sleeping_count, woken, cross_shard)
+        self.tick += 1
+        return stats
+
+    def run(self, ticks: int) -> list:
+        """
+        Run several ticks.
+
+        Args:
+            ticks (int): Number of ticks
+
+        Returns:
+            list: One ``TickStats`` per tick
+        """
+        return [self.step() for _ in range(ticks)]
+
+    def sync(self) -> Population:
+        """Copy the shared state back into the population's columns."""
+        population = self.population
+        for name, typecode in SHARED_COLUMNS:
+            if name == "outbox":
+                continue
+            values = self._views[name]
+            if typecode == "B":
+                getattr(population, name)[:] = bytes(values)
+            else:
+                getattr(population, name)[:] = array.array(typecode, values)
+        return population
+
+    def close(self):
+        """Sync the population, stop the workers and free the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._views is not None:
+            self.sync()
+            for view in self._views.values():
+                view.release()
+            self._views = None
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
@@ -0,0 +1,247 @@
+"""
+Checkpoint and restore of a whole animal ``Population``.
+
+A snapshot is one binary file. Numeric state (energy, sleeping flags, lives,
+altitude, ...) is written straight from the population's ``array`` and
+``bytearray`` columns in fixed-size chunks, so a multi-GB checkpoint never
+needs a second in-memory copy. Text columns (names, breeds, colors, tricks)
+are stored as one NUL-separated UTF-8 block each.
+
+Restoring memory-maps the file and copies every column back in one
+``frombytes`` call (text columns in one ``decode``/``split``), so no
+per-animal objects are deserialized.
+
+File layout (little- or big-endian as recorded in the header):
+
+    header     magic b"POPS", version, byte-order flag, animal count,
+               number of sections
+    directory  one entry per section: name, kind ("a" array / "s" text),
+               typecode, item size, item count, offset, byte length
+    sections   raw column data, each starting on an 8-byte boundary
+"""
+import array
+import mmap
+import struct
+import sys
+
+from .population import Population
+
+MAGIC = b"POPS"
+VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHBxQI")
+ENTRY_FORMAT = struct.Struct("<24sccHIQQQ")
+SEPARATOR = "\0"
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Numeric columns: attribute name -> typecode ("B" means a bytearray column)
+ARRAY_COLUMNS = (
+    ("ages", "i"),
+    ("kinds", "b"),
+    ("energy", "i"),
+    ("is_sleeping", "B"),
+    ("is_trained", "B"),
+    ("lives_remaining", "i"),
+    ("is_purring", "B"),
+    ("wing_spans", "d"),
+    ("is_flying", "B"),
+    ("altitude", "i"),
+)
+# Text columns; nullable ones get an extra "<name>.null" flag column
+TEXT_COLUMNS = ("names", "species", "breeds", "colors")
+NULLABLE_COLUMNS = ("breeds", "colors")
+
+
+def _pad(handle):
+    position = handle.tell()
+    if position % 8:
+        handle.write(b"\0" * (8 - position % 8))
+
+
+def _write_buffer(handle, values, chunk_size):
+    """Write an array/bytearray in chunks without copying it."""
+    view = memoryview(values)
+    itemsize = view.itemsize
+    try:
+        for start in range(0, len(view), chunk_size):
+            handle.write(view[start:start + chunk_size])
+    finally:
+        view.release()
+    return len(values) * itemsize
+
+
+def _write_text(handle, values, chunk_size):
+    """Write strings as one NUL-separated UTF-8 block, chunk by chunk."""
+    written = 0
+    for start in range(0, len(values), chunk_size):
+        chunk = ["" if value is None else value for value in values[start:start + chunk_size]]
+        text = SEPARATOR.join(chunk)
+        if text.count(SEPARATOR) != len(chunk) - 1:
+            raise ValueError("Text values must not contain NUL characters")
+        if start:
+            text = SEPARATOR + text
+        data = text.encode("utf-8")
+        handle.write(data)
+        written += len(data)
+    return written
+
+
+def save_snapshot(population, path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Write a population snapshot.
+
+    Args:
+        population: A Population, or an iterable of Animal objects
+        path: Destination file path
+        chunk_size (int, optional): Items written per chunk
+
+    Returns:
+        int: Size of the snapshot in bytes
+    """
+    if not isinstance(population, Population):
+        population = Population.from_animals(population)
+
+    sections = []  # (name, kind, typecode, itemsize, count, values)
+    for name, typecode in ARRAY_COLUMNS:
+        values = getattr(population, name)
+        itemsize = 1 if typecode == "B" else values.itemsize
+        sections.append((name, "a", typecode, itemsize, len(values), values))
+    for name in TEXT_COLUMNS:
+        values = getattr(population, name)
+        sections.append((name, "s", "u", 1, len(values), values))
+        if name in NULLABLE_COLUMNS:
+            nulls = bytearray(value is None for value in values)
+            sections.append((name + ".null", "a", "B", 1, len(nulls), nulls))
+    trick_counts = array.array("i", (len(tricks) for tricks in population.tricks))
+    flat_tricks = [trick for tricks in population.tricks for trick in tricks]
+    sections.append(("tricks.count", "a", "i", trick_counts.itemsize, len(trick_counts), trick_counts))
+    sections.append(("tricks", "s", "u", 1, len(flat_tricks), flat_tricks))
+
+    with open(path, "wb") as handle:
+        # Header and directory are rewritten once the section offsets are known
+        handle.write(b"\0" * (HEADER_FORMAT.size + ENTRY_FORMAT.size * len(sections)))
+        entries = []
+        for name, kind, typecode, itemsize, count, values in sections:
+            _pad(handle)
+            offset = handle.tell()
+            if kind == "a":
+                nbytes = _write_buffer(handle, values, chunk_size)
+            else:
+                nbytes = _write_text(handle, values, chunk_size)
+            entries.append(ENTRY_FORMAT.pack(
+                name.encode("ascii"), kind.encode("ascii"), typecode.encode("ascii"),
+                itemsize, 0, count, offset, nbytes,
+            ))
+        size = handle.tell()
+        handle.seek(0)
+        handle.write(HEADER_FORMAT.pack(
+            MAGIC, VERSION, sys.byteorder == "little", len(population), len(sections)
+        ))
+        for entry in entries:
+            handle.write(entry)
+    return size
+
+
+def _read_directory(data, path):
+    magic, version, little, count, section_count = HEADER_FORMAT.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a population snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    sections = {}
+    position = HEADER_FORMAT.size
+    for _ in range(section_count):
+        name, kind, typecode, itemsize, _, items, offset, nbytes = ENTRY_FORMAT.unpack_from(
+            data, position
+        )
+        position += ENTRY_FORMAT.size
+        if offset + nbytes > len(data):
+            raise ValueError(f"{path} is truncated")
+        sections[name.rstrip(b"\0").decode("ascii")] = (
+            kind.decode("ascii"), typecode.decode("ascii"), itemsize, items, offset, nbytes
+        )
+    swap = bool(little) != (sys.byteorder == "little")
+    return count, sections, swap
+
+
+def _load_array(view, section, swap):
+    _, typecode, itemsize, items, offset, nbytes = section
+    raw = view[offset:offset + nbytes]
+    try:
+        if typecode == "B":
+            return bytearray(raw)
+        values = array.array(typecode)
+        if values.itemsize != itemsize:
+            raise ValueError(
+                f"Snapshot column uses {itemsize}-byte '{typecode}' items, "
+                f"this platform uses {values.itemsize}"
+            )
+        values.frombytes(raw)
+        if swap:
+            values.byteswap()
+        return values
+    finally:
+        raw.release()
+
+
+def _load_text(view, section):
+    _, _, _, items, offset, nbytes = section
+    if not items:
+        return []
+    raw = view[offset:offset + nbytes]
+    try:
+        values = str(raw, "utf-8").split(SEPARATOR)
+    finally:
+        raw.release()
+    if len(values) != items:
+        raise ValueError("Text column is corrupt")
+    return values
+
+
+def load_snapshot(path) -> Population:
+    """
+    Restore a population from a snapshot file.
+
+    Args:
+        path: Snapshot file written by ``save_snapshot``
+
+    Returns:
+        Population: The restored population
+
+    Raises:
+        ValueError: If the file is not a valid snapshot
+    """
+    with open(path, "rb") as handle:
+        try:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"{path} is empty, not a population snapshot")
+    with data:
+        if len(data) < HEADER_FORMAT.size:
+            raise ValueError(f"{path} is not a population snapshot")
+        count, sections, swap = _read_directory(data, path)
+        view = memoryview(data)
+        try:
+            population = Population()
+            for name, _ in ARRAY_COLUMNS:
+                setattr(population, name, _load_array(view, sections[name], swap))
+            for name in TEXT_COLUMNS:
+                values = _load_text(view, sections[name])
+                if name in NULLABLE_COLUMNS:
+                    nulls = _load_array(view, sections[name + ".null"], swap)
+                    values = [None if null else value for value, null in zip(values, nulls)]
+                setattr(population, name, values)
+
+            trick_counts = _load_array(view, sections["tricks.count"], swap)
+            flat_tricks = _load_text(view, sections["tricks"])
+            tricks = []
+            position = 0
+            for trick_count in trick_counts:
+                tricks.append(flat_tricks[position:position + trick_count])
+                position += trick_count
+            population.tricks = tricks
+        finally:
+            view.release()
+
+    if len(population) != count:
+        raise ValueError(f"{path} is corrupt: expected {count} animals")
+    return population
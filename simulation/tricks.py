@@ -0,0 +1,223 @@
+"""
+Trick registry for ``Dog`` with bitset storage and an inverted index.
+
+``Dog.tricks`` is a list, so checking whether a dog knows a trick scans the
+list, and finding every dog that knows a trick scans every dog. The registry
+interns each trick name to a small integer id and keeps two kinds of bitset:
+
+- per dog: an integer whose bit ``t`` is set when the dog knows trick ``t``
+  (dogs know a handful of tricks, so these integers stay tiny)
+- per trick: a ``bytearray`` bitmap whose bit ``d`` is set when dog ``d``
+  knows the trick; setting a bit changes one byte in place
+
+Membership is a single bit test. "Dogs knowing all/any of these tricks"
+converts the few bitmaps involved to integers once, combines them with
+AND/OR and decodes the result a byte at a time through a lookup table, so
+queries are linear in the number of dogs.
+"""
+
+# byte value -> positions of its set bits
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+def _bit_indices(bits: int):
+    """Yield the positions of the set bits, lowest first."""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    table = _BYTE_BITS
+    for index, byte in enumerate(data):
+        if byte:
+            base = index * 8
+            for bit in table[byte]:
+                yield base + bit
+
+
+class TrickRegistry:
+    """
+    Index of which registered dogs know which tricks.
+
+    The registry keeps each dog's ``tricks`` list in sync, so ``get_info``
+    and the other ``Dog`` methods keep working on the same objects.
+
+    Example:
+        registry = TrickRegistry()
+        registry.learn_trick(buddy, "sit")
+        registry.dogs_knowing_all(["sit", "roll over"])
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._trick_ids = {}
+        self._trick_names = []
+        self._trick_dogs = []  # trick id -> bytearray bitmap of dog ids
+        self._dog_ids = {}  # id(dog) -> dog id
+        self._dogs = []  # dog id -> Dog (keeps id(dog) stable)
+        self._dog_tricks = []  # dog id -> bitset of trick ids
+
+    def __len__(self) -> int:
+        """Return the number of registered dogs."""
+        return len(self._dogs)
+
+    def intern(self, trick: str) -> int:
+        """
+        Return the id for a trick name, assigning a new one if needed.
+
+        Args:
+            trick (str): Trick name
+
+        Returns:
+            int: Trick id
+        """
+        trick_id = self._trick_ids.get(trick)
+        if trick_id is None:
+            trick_id = len(self._trick_names)
+            self._trick_ids[trick] = trick_id
+            self._trick_names.append(trick)
+            self._trick_dogs.append(bytearray())
+        return trick_id
+
+    def _set_dog_bit(self, trick_id: int, dog_id: int):
+        bitmap = self._trick_dogs[trick_id]
+        index = dog_id >> 3
+        if index >= len(bitmap):
+            # Grow geometrically so registering n dogs stays O(n)
+            bitmap.extend(bytes(max(index + 1, 2 * len(bitmap)) - len(bitmap)))
+        bitmap[index] |= 1 << (dog_id & 7)
+
+    def add_dog(self, dog) -> int:
+        """
+        Register a dog and index the tricks it already knows.
+
+        Registering the same dog twice returns its existing id.
+
+        Args:
+            dog (Dog): The dog to register
+
+        Returns:
+            int: The dog's id in this registry
+        """
+        dog_id = self._dog_ids.get(id(dog))
+        if dog_id is not None:
+            return dog_id
+        dog_id = len(self._dogs)
+        self._dog_ids[id(dog)] = dog_id
+        self._dogs.append(dog)
+        bits = 0
+        for trick in dog.tricks:
+            trick_id = self.intern(trick)
+            bits |= 1 << trick_id
+            self._set_dog_bit(trick_id, dog_id)
+        self._dog_tricks.append(bits)
+        return dog_id
+
+    def knows(self, dog, trick: str) -> bool:
+        """
+        Check whether a dog knows a trick in constant time.
+
+        Args:
+            dog (Dog): A dog; unregistered dogs know no tricks here (they are
+                not registered by this check)
+            trick (str): Trick name
+
+        Returns:
+            bool: True if the dog is registered and knows the trick
+        """
+        trick_id = self._trick_ids.get(trick)
+        dog_id = self._dog_ids.get(id(dog))
+        if trick_id is None or dog_id is None:
+            return False
+        return bool(self._dog_tricks[dog_id] >> trick_id & 1)
+
+    def learn_trick(self, dog, trick: str) -> str:
+        """
+        Teach a dog a trick; same behaviour and message as ``Dog.learn_trick``.
+
+        Args:
+            dog (Dog): A dog (registered on first use)
+            trick (str): The trick to learn
+
+        Returns:
+            str: Message about learning the trick
+        """
+        dog_id = self.add_dog(dog)
+        trick_id = self.intern(trick)
+        if self._dog_tricks[dog_id] >> trick_id & 1:
+            return f"{dog.name} already knows how to {trick}!"
+        self._dog_tricks[dog_id] |= 1 << trick_id
+        self._set_dog_bit(trick_id, dog_id)
+        dog.tricks.append(trick)
+        return f"{dog.name} learned to {trick}!"
+
+    def perform_trick(self, dog, trick: str) -> str:
+        """
+        Make a dog perform a trick; same messages as ``Dog.perform_trick``.
+
+        Args:
+            dog (Dog): A dog (registered on first use)
+            trick (str): The trick to perform
+
+        Returns:
+            str: Message about performing the trick
+        """
+        self.add_dog(dog)
+        if not self.knows(dog, trick):
+            return f"{dog.name} doesn't know how to {trick} yet!"
+        if dog.is_sleeping:
+            return f"{dog.name} is sleeping and can't perform tricks!"
+        return f"{dog.name} performs {trick}! What a good dog!"
+
+    def tricks_of(self, dog) -> list:
+        """Return the trick names a registered dog knows, in trick-id order ([] if unregistered)."""
+        dog_id = self._dog_ids.get(id(dog))
+        if dog_id is None:
+            return []
+        bits = self._dog_tricks[dog_id]
+        return [self._trick_names[trick_id] for trick_id in _bit_indices(bits)]
+
+    def _dogs_bits(self, trick: str) -> int:
+        trick_id = self._trick_ids.get(trick)
+        return 0 if trick_id is None else int.from_bytes(self._trick_dogs[trick_id], "little")
+
+    def _dogs_from_bits(self, bits: int) -> list:
+        dogs = self._dogs
+        return [dogs[dog_id] for dog_id in _bit_indices(bits)]
+
+    def dogs_knowing(self, trick: str) -> list:
+        """Return the registered dogs that know a trick."""
+        return self._dogs_from_bits(self._dogs_bits(trick))
+
+    def dogs_knowing_all(self, tricks) -> list:
+        """
+        Return the registered dogs that know every one of the tricks.
+
+        Args:
+            tricks: Iterable of trick names
+
+        Returns:
+            list: Matching dogs in registration order
+        """
+        bits = None
+        for trick in tricks:
+            trick_bits = self._dogs_bits(trick)
+            bits = trick_bits if bits is None else bits & trick_bits
+            if not bits:
+                return []
+        return [] if bits is None else self._dogs_from_bits(bits)
+
+    def dogs_knowing_any(self, tricks) -> list:
+        """
+        Return the registered dogs that know at least one of the tricks.
+
+        Args:
+            tricks: Iterable of trick names
+
+        Returns:
+            list: Matching dogs in registration order
+        """
+        bits = 0
+        for trick in tricks:
+            bits |= self._dogs_bits(trick)
+        return self._dogs_from_bits(bits)
+
+    def count_knowing(self, trick: str) -> int:
+        """Return how many registered dogs know a trick."""
+        return self._dogs_bits(trick).bit_count()
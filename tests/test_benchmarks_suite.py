@@ -0,0 +1,47 @@
+"""
+Tests for the benchmark harness and its regression gate.
+"""
+from benchmarks.harness import compare, measure, read_results, run_benchmarks, write_results
+from benchmarks.suite import main
+
+
+def document(**timings):
+    return {
+        "meta": {},
+        "results": {key: {"best": best, "peak_bytes": peak} for key, (best, peak) in timings.items()},
+    }
+
+
+class TestHarness:
+    """Test cases for measurement and comparison."""
+
+    def test_measure_reports_per_call_time(self):
+        """Fast callables are repeated until a sample is long enough."""
+        result = measure(lambda: sum(range(100)), repeat=3, min_time=0.001)
+        assert result["number"] > 1
+        assert 0 < result["best"] <= result["median"]
+
+    def test_run_selected_benchmarks(self):
+        """Prefixes select benchmarks; results carry time and memory."""
+        results = run_benchmarks(["shapes"], ["1k"], repeat=2, min_time=0.001)["results"]
+        assert sorted(results) == ["shapes.area@1k", "shapes.perimeter@1k"]
+        for result in results.values():
+            assert result["items"] == 1000 and result["per_item_ns"] > 0 and result["peak_bytes"] >= 0
+
+    def test_compare_flags_regressions(self):
+        """Slowdowns and memory growth beyond the thresholds are flagged."""
+        baseline = document(**{"a@1k": (1.0, 100), "b@1k": (1.0, 100), "old@1k": (1.0, 100)})
+        current = document(**{"a@1k": (1.05, 100), "b@1k": (1.5, 200), "new@1k": (1.0, 100)})
+        flagged = {(c.key, c.metric) for c in compare(baseline, current, threshold=0.1) if c.regressed}
+        assert flagged == {("b@1k", "best"), ("b@1k", "peak_bytes")}
+
+    def test_compare_command_exit_status(self, tmp_path, capsys):
+        """The compare command exits with 1 only when something regressed."""
+        baseline, fast, slow = tmp_path / "base.json", tmp_path / "fast.json", tmp_path / "slow.json"
+        write_results(document(**{"a@1k": (1.0, 100)}), baseline)
+        write_results(document(**{"a@1k": (0.9, 100)}), fast)
+        write_results(document(**{"a@1k": (2.0, 100)}), slow)
+        assert read_results(baseline)["results"]["a@1k"]["best"] == 1.0
+        assert main(["compare", str(baseline), str(fast)]) == 0
+        assert main(["compare", str(baseline), str(slow)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
@@ -4,7 +4,7 @@ Tests ShoppingCart, CreditCardPayment, and PayPalPayment classes.
 """
 # cSpell:ignore ecommerce invalidemail bademail
 import pytest
-from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.cart import ShoppingCart, line_key
 from exercises.ecommerce.book import Book
 from exercises.ecommerce.electronics import Electronics
 from exercises.ecommerce.clothing import Clothing
@@ -92,6 +92,64 @@ class TestShoppingCart:
         assert cart.total() == pytest.approx(440.0)
 
 
+class TestShoppingCartMerge:
+    """Test cases for merging and diffing carts."""
+    
+    def make_carts(self):
+        """Return a user cart, a guest cart and their shared products."""
+        laptop = Electronics("Laptop", 1000.0)
+        shirt = Clothing("Shirt", 20.0, "M")
+        user, guest = ShoppingCart(), ShoppingCart()
+        user.add(Book("Python", 50.0, "Author", "123"), 1)
+        user.add(laptop, 1)
+        user.add(Book("Python", 50.0, "Author", "123"), 1)  # same ISBN, second line
+        guest.add(Book("Python (copy)", 50.0, "Author", "123"), 3)
+        guest.add(shirt, 2)
+        return user, guest, laptop, shirt
+    
+    @pytest.mark.parametrize("rule, books", [("sum", 5), ("max", 3), ("keep", 2), ("replace", 3)])
+    def test_merge_rules(self, rule, books):
+        """Test that lines are keyed by ISBN/identity and combined by rule."""
+        user, guest, laptop, shirt = self.make_carts()
+        user.merge(guest, rule=rule)
+        assert [qty for _, qty in user.items] == [books, 1, 2]
+        assert user.items[1] == (laptop, 1) and user.items[2] == (shirt, 2)
+        book = user.items[0][0]
+        assert book.name == ("Python (copy)" if rule == "replace" else "Python")
+        assert len(guest.items) == 2
+    
+    def test_merge_custom_rule_and_errors(self):
+        """Test callable rules, dropped zero lines and unknown rules."""
+        user, guest, _, _ = self.make_carts()
+        user.merge(guest, rule=lambda ours, theirs: 0)
+        assert [line_key(product) for product, _ in user.items][0] != "isbn:123"
+        with pytest.raises(ValueError):
+            user.merge(guest, rule="average")
+    
+    def test_diff_and_apply(self):
+        """Test that applying a diff reproduces the target quantities."""
+        user, guest, laptop, shirt = self.make_carts()
+        changes = user.diff(guest)
+        assert changes == [("isbn:123", 3), (line_key(shirt), 2), (line_key(laptop), 0)]
+        assert user.diff(user) == []
+        with pytest.raises(KeyError):
+            ShoppingCart().apply_diff(changes)
+        user.apply_diff(changes, guest.lines())
+        assert {key: qty for key, (_, qty) in user.lines().items()} == {
+            key: qty for key, (_, qty) in guest.lines().items()
+        }
+        assert user.total() == pytest.approx(guest.total())
+    
+    def test_merge_is_linear(self):
+        """Test merging large carts (nested loops would take minutes)."""
+        user, guest = ShoppingCart(), ShoppingCart()
+        for n in range(50000):
+            user.add(Book(f"B{n}", 1.0, "A", str(n)), 1)
+            guest.add(Book(f"B{n}", 1.0, "A", str(n + 25000)), 1)
+        user.merge(guest)
+        assert len(user.items) == 75000 and user.total() == pytest.approx(100000.0)
+
+
 class TestCreditCardPayment:
     """Test cases for the CreditCardPayment class."""
     
@@ -0,0 +1,98 @@
+"""
+Tests for exchange rates, cart totals and catalog price columns.
+"""
+import pytest
+
+from exercises.ecommerce.book import Book
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.clothing import Clothing
+from exercises.ecommerce.currency import CatalogPrices, RateTable
+from exercises.ecommerce.electronics import Electronics
+
+
+def make_rates():
+    return RateTable("USD", {"EUR": 0.5, "GBP": 0.25})
+
+
+class TestRateTable:
+    """Test rate lookups, cross rates and epochs."""
+
+    def test_cross_rates(self):
+        """Test conversions through the base currency."""
+        rates = make_rates()
+        assert rates.currencies == ["EUR", "GBP", "USD"]
+        assert rates.convert(10.0, "USD", "EUR") == 5.0
+        assert rates.convert(10.0, "EUR", "GBP") == 5.0
+        assert rates.convert(10.0, "GBP", "GBP") == 10.0
+        assert list(rates.convert_column([2.0, 4.0], "GBP", "USD")) == [8.0, 16.0]
+
+    def test_epoch_and_validation(self):
+        """Test that updates bump the epoch and refresh cross rates."""
+        rates = make_rates()
+        epoch = rates.epoch
+        assert rates.rate("EUR", "GBP") == 0.5
+        rates.set_rate("EUR", 0.125)
+        assert rates.epoch == epoch + 1 and rates.rate("EUR", "GBP") == 2.0
+        with pytest.raises(ValueError):
+            rates.set_rate("EUR", 0)
+        with pytest.raises(ValueError):
+            rates.set_rate("USD", 2.0)
+        with pytest.raises(ValueError):
+            rates.rate("USD", "JPY")
+
+    def test_same_currency_still_validated(self):
+        """Test that unknown codes are rejected even when source == target."""
+        rates = make_rates()
+        with pytest.raises(ValueError):
+            rates.convert(1.0, "JPY", "JPY")
+        with pytest.raises(ValueError):
+            rates.convert_column([1.0], "XXX", "XXX")
+        with pytest.raises(ValueError):
+            CatalogPrices([]).prices_in("JPY", rates)
+
+
+class TestCurrencyTotals:
+    """Test currency-aware carts and catalogs."""
+
+    def test_cart_total_in(self):
+        """Test that mixed-currency carts convert each currency once."""
+        book = Book("Python", 10.0, "Author", "123")
+        shirt = Clothing("Shirt", 4.0, "M", currency="EUR")
+        cart = ShoppingCart()
+        cart.add(book, 2)
+        cart.add(shirt, 3)
+        rates = make_rates()
+        assert book.currency == "USD"
+        assert cart.total_in("USD", rates) == pytest.approx(20.0 + 24.0)
+        assert cart.total_in("EUR", rates) == pytest.approx(10.0 + 12.0)
+        assert ShoppingCart().total_in("GBP", rates) == 0.0
+
+    def test_cart_total_follows_in_place_changes(self):
+        """Test that totals reflect direct edits to items, prices and rates."""
+        book = Book("Python", 10.0, "Author", "123", currency="EUR")
+        cart = ShoppingCart()
+        cart.add(book, 2)
+        rates = make_rates()
+        assert cart.total_in("USD", rates) == pytest.approx(40.0)
+        book.apply_discount(50)
+        assert cart.total_in("USD", rates) == pytest.approx(20.0)
+        rates.set_rate("EUR", 1.0)
+        assert cart.total_in("USD", rates) == pytest.approx(10.0)
+        cart.items.clear()
+        assert cart.total_in("USD", rates) == cart.total() == 0.0
+
+    def test_catalog_columns_cached_per_epoch(self):
+        """Test conversion, caching and invalidation of catalog columns."""
+        products = [Book("B", 8.0, "A", "1"), Electronics("E", 4.0), Clothing("C", 2.0, "S")]
+        products[1] = Electronics("E", 4.0, currency="GBP")
+        catalog = CatalogPrices(products)
+        rates = make_rates()
+        eur = catalog.prices_in("EUR", rates)
+        assert list(eur) == [4.0, 8.0, 1.0] and len(catalog) == 3
+        assert catalog.prices_in("EUR", rates) is eur
+        rates.set_rate("EUR", 1.0)
+        assert list(catalog.prices_in("EUR", rates)) == [8.0, 16.0, 2.0]
+        products[0].apply_discount(50)
+        catalog.refresh()
+        assert catalog.prices_in("USD", rates)[0] == 4.0
+        assert list(CatalogPrices(products[2:]).prices_in("GBP", rates)) == [0.5]
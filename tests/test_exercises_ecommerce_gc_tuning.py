@@ -0,0 +1,45 @@
+"""
+Tests for the garbage-collector tuning hooks.
+"""
+import gc
+
+from exercises.ecommerce.gc_tuning import GCPauseMonitor, gc_tuned
+from exercises.ecommerce.instrumentation import Histogram
+
+
+class TestGCHooks:
+    """Test GC tuning and pause measurement."""
+
+    def test_gc_tuned_restores_settings(self):
+        """Test that thresholds, freeze and enablement are restored."""
+        thresholds, enabled = gc.get_threshold(), gc.isenabled()
+        with gc_tuned(thresholds=(12345, 11, 12), freeze=True, disable=True):
+            assert gc.get_threshold() == (12345, 11, 12)
+            assert gc.get_freeze_count() > 0 and not gc.isenabled()
+        assert gc.get_threshold() == thresholds and gc.isenabled() == enabled
+        assert gc.get_freeze_count() == 0
+
+    def test_gc_tuned_keeps_existing_freeze(self):
+        """Test that objects frozen before the block stay frozen after it."""
+        gc.freeze()
+        try:
+            frozen = gc.get_freeze_count()
+            assert frozen > 0
+            with gc_tuned(freeze=True):
+                assert gc.get_freeze_count() >= frozen
+            assert gc.get_freeze_count() >= frozen
+        finally:
+            gc.unfreeze()
+
+    def test_pause_monitor(self):
+        """Test that collections are timed and recorded in a histogram."""
+        histogram = Histogram("gc_pause_seconds", "GC pauses")
+        with GCPauseMonitor(histogram) as monitor:
+            gc.collect()
+            gc.collect(0)
+        gc.collect()  # not recorded after exit
+        summary = monitor.summary()
+        assert summary.count == 2 and monitor.summary(generation=0).count == 1
+        assert 0 < summary.max_seconds <= summary.total_seconds
+        assert histogram.snapshot().count == 2
+        assert GCPauseMonitor().summary() == (0, 0.0, 0.0, 0.0, 0)
@@ -0,0 +1,145 @@
+"""
+Tests for the e-commerce hot-path instrumentation.
+"""
+import socket
+import threading
+import pytest
+from exercises.ecommerce.book import Book
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.clothing import Clothing
+from exercises.ecommerce.credit_card import CreditCardPayment
+from exercises.ecommerce.instrumentation import Histogram, MetricsRegistry, instrument_ecommerce
+from exercises.ecommerce.paypal import PayPalPayment
+
+
+@pytest.fixture
+def registry():
+    registry = instrument_ecommerce(MetricsRegistry())
+    yield registry
+    registry.detach_all()
+
+
+class TestHistogram:
+    """Test cases for the HDR-style histogram."""
+
+    def test_bucket_precision(self):
+        """Every value falls in a bucket within 1% of it."""
+        histogram = Histogram("h", "", precision_bits=7)
+        previous = -1
+        for value in list(range(300)) + [10 ** k + 7 for k in range(3, 12)]:
+            index = histogram.bucket_index(value)
+            low, high = histogram.bucket_bounds(index)
+            assert low <= value < high
+            assert (high - low) <= max(1, value / 64)
+            assert index >= previous
+            previous = index
+
+    def test_percentiles(self):
+        """Percentiles are estimated from the buckets."""
+        histogram = Histogram("h", "")
+        for value in range(1, 1001):
+            histogram.record_ns(value * 1000)
+        assert histogram.percentile(0.5) == pytest.approx(500e-6, rel=0.01)
+        assert histogram.percentile(0.99) == pytest.approx(990e-6, rel=0.01)
+        assert Histogram("empty", "").percentile(0.5) == 0.0
+
+    def test_threads_write_their_own_shards(self):
+        """Concurrent recording from many threads loses nothing."""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total")
+        histogram = registry.histogram("latency_seconds")
+
+        def work():
+            for _ in range(2000):
+                counter.inc()
+                histogram.record_ns(1500)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.value() == 16000
+        assert histogram.snapshot().count == 16000
+
+
+class TestRegistry:
+    """Test cases for attaching and exporting metrics."""
+
+    def test_attach_counts_hot_paths(self, registry):
+        """Cart, discount and payment calls are counted per class."""
+        cart = ShoppingCart()
+        book = Book("Python", 50.0, "Author", "123")
+        cart.add(book, 2)
+        cart.add(Clothing("Shirt", 20.0, "M"), 3)
+        assert cart.total() == 160.0
+        book.apply_discount(10)
+        assert book.price == 45.0
+        assert CreditCardPayment("1234").process_payment(10.0) is True
+        assert PayPalPayment("bad").process_payment(10.0) is False
+
+        text = registry.export_text()
+        assert 'cart_add_calls_total{class="ShoppingCart"} 2' in text
+        assert 'cart_total_calls_total{class="ShoppingCart"} 1' in text
+        assert 'product_apply_discount_calls_total{class="Book"} 1' in text
+        assert 'payment_process_payment_calls_total{class="PayPalPayment"} 1' in text
+        assert 'payment_process_payment_seconds_bucket{class="CreditCardPayment",le="+Inf"} 1' in text
+        assert "# TYPE cart_total_seconds histogram" in text
+
+    def test_detach_restores_methods(self):
+        """Detaching puts the original methods back."""
+        originals = (ShoppingCart.total, Book.apply_discount, PayPalPayment.process_payment)
+        registry = instrument_ecommerce(MetricsRegistry())
+        assert ShoppingCart.total is not originals[0]
+        registry.detach_all()
+        assert (ShoppingCart.total, Book.apply_discount, PayPalPayment.process_payment) == originals
+
+    def test_decorator_respects_enabled_flag(self):
+        """Disabled decorated functions do not record."""
+        registry = MetricsRegistry(enabled=False)
+
+        @registry.instrumented("checkout")
+        def checkout(value):
+            if value < 0:
+                raise ValueError(value)
+            return value * 2
+
+        assert checkout(2) == 4
+        registry.enabled = True
+        assert checkout(3) == 6
+        with pytest.raises(ValueError):
+            checkout(-1)
+        assert registry.counter("checkout_calls_total").value() == 2
+        assert registry.counter("checkout_errors_total").value() == 1
+
+    def test_kind_conflict(self):
+        """A name cannot be both a counter and a histogram."""
+        registry = MetricsRegistry()
+        registry.counter("x")
+        with pytest.raises(ValueError):
+            registry.histogram("x")
+
+    def test_write_file_and_send(self, registry, tmp_path):
+        """Snapshots go to a file or over a socket."""
+        ShoppingCart().total()
+        path = tmp_path / "metrics.prom"
+        registry.write_file(path)
+        assert path.read_text() == registry.export_text()
+
+        server = socket.create_server(("127.0.0.1", 0))
+        received = []
+
+        def accept():
+            connection, _ = server.accept()
+            with connection:
+                chunks = []
+                while chunk := connection.recv(65536):
+                    chunks.append(chunk)
+                received.append(b"".join(chunks).decode())
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+        registry.send(server.getsockname())
+        thread.join(5)
+        server.close()
+        assert received == [registry.export_text()]
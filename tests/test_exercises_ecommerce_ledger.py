@@ -0,0 +1,102 @@
+"""
+Tests for the append-only payment ledger.
+"""
+import os
+import threading
+
+import pytest
+
+from exercises.ecommerce.credit_card import CreditCardPayment
+from exercises.ecommerce.ledger import PaymentLedger, SEGMENT_HEADER
+from exercises.ecommerce.paypal import PayPalPayment
+
+
+class TestPaymentLedger:
+    """Test appending, lookup, rotation and recovery."""
+
+    def test_record_and_lookup(self, tmp_path):
+        """Test that outcomes are recorded and found by transaction id."""
+        with PaymentLedger(tmp_path) as ledger:
+            assert ledger.record(CreditCardPayment("1234"), 25.0, "t1") is True
+            assert ledger.record(PayPalPayment("bad-email"), 10.0, "t2") is False
+            ledger.append("t3", 5.5, True, "card", "9999", timestamp_ns=42)
+            with pytest.raises(ValueError):
+                ledger.append("t1", 1.0, True)
+            assert len(ledger) == 3 and "t2" in ledger and ledger.lookup("nope") is None
+            entry = ledger.lookup("t1")
+            assert (entry.amount, entry.success, entry.method, entry.account) == (25.0, True, "card", "1234")
+            assert ledger.lookup("t3").timestamp_ns == 42
+            assert [entry.txn_id for entry in ledger] == ["t1", "t2", "t3"]
+        with pytest.raises(ValueError):
+            ledger.append("t4", 1.0, True)
+
+    def test_rotation_and_reopen(self, tmp_path):
+        """Test that segments rotate and the index is rebuilt on open."""
+        with PaymentLedger(tmp_path, segment_bytes=200, durable=False) as ledger:
+            for n in range(20):
+                ledger.append(f"txn-{n}", n, n % 2 == 0, "paypal", f"user{n}@example.com")
+            assert ledger.stats().segments > 1
+        with PaymentLedger(tmp_path) as ledger:
+            assert len(ledger) == 20 and ledger.lookup("txn-7").account == "user7@example.com"
+            ledger.append("txn-20", 1.0, True)
+        assert len(PaymentLedger(tmp_path, durable=False)) == 21
+
+    def test_recovery_truncates_torn_tail(self, tmp_path):
+        """Test that a half-written last record is cut off on open."""
+        with PaymentLedger(tmp_path) as ledger:
+            ledger.append("a", 1.0, True)
+            ledger.append("b", 2.0, True)
+            path = ledger.segments[-1]
+        size = os.path.getsize(path)
+        with open(path, "r+b") as handle:
+            handle.truncate(size - 3)
+        with PaymentLedger(tmp_path) as ledger:
+            assert len(ledger) == 1 and ledger.lookup("b") is None
+            ledger.append("b", 2.0, True)
+            assert ledger.lookup("b").amount == 2.0
+
+    def test_corrupt_old_segment_raises(self, tmp_path):
+        """Test that damage outside the newest segment is reported."""
+        with PaymentLedger(tmp_path, segment_bytes=100, durable=False) as ledger:
+            for n in range(5):
+                ledger.append(f"t{n}", 1.0, True)
+            first = ledger.segments[0]
+        with open(first, "r+b") as handle:
+            handle.seek(SEGMENT_HEADER.size + 10)
+            handle.write(b"\xff")
+        with pytest.raises(ValueError):
+            PaymentLedger(tmp_path)
+
+    def test_group_commit_shares_fsyncs(self, tmp_path):
+        """Test that concurrent writers need fewer fsyncs than records."""
+        ledger = PaymentLedger(tmp_path, commit_delay=0.005)
+
+        def write(worker):
+            for n in range(10):
+                ledger.append(f"{worker}-{n}", 1.0, True)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ledger.close()
+        records, _, fsyncs = ledger.stats()
+        assert records == 80 and fsyncs < records
+
+    def test_rotation_syncs_outgoing_segment(self, tmp_path):
+        """Rotation fsyncs the old segment even when not durable, and rotates once."""
+        ledger = PaymentLedger(tmp_path, segment_bytes=150, durable=False)
+        threads = [
+            threading.Thread(target=ledger.append, args=(f"t{n}", 1.0, True)) for n in range(12)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ledger.close()
+        segments = ledger.stats().segments
+        assert segments > 1 and ledger.stats().fsyncs == segments - 1
+        sizes = [os.path.getsize(path) for path in ledger.segments]
+        assert all(size > SEGMENT_HEADER.size for size in sizes)
+        assert len(PaymentLedger(tmp_path, durable=False)) == 12
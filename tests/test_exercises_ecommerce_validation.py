@@ -0,0 +1,82 @@
+"""
+Tests for bulk payment validation.
+"""
+from exercises.ecommerce.credit_card import CreditCardPayment
+from exercises.ecommerce.instrumentation import MetricsRegistry
+from exercises.ecommerce.paypal import PayPalPayment
+from exercises.ecommerce.validation import (
+    AMOUNT_OVER_LIMIT, INVALID_AMOUNT, INVALID_EMAIL, INVALID_LAST4, UNSUPPORTED_METHOD,
+    VELOCITY_AMOUNT, VELOCITY_COUNT, PaymentValidator, format_report, process_accepted,
+)
+
+
+class CountingCard(CreditCardPayment):
+    """Card that counts gateway calls."""
+
+    calls = 0
+
+    def process_payment(self, amount: float) -> bool:
+        CountingCard.calls += 1
+        return super().process_payment(amount)
+
+
+class TestPaymentValidator:
+    """Test the checks, reason codes and reporting."""
+
+    def test_reason_codes(self):
+        """Test that each check rejects with its own reason code."""
+        payments = [
+            (CreditCardPayment("1234"), 10.0),
+            (CreditCardPayment("12a4"), 10.0),
+            (CreditCardPayment("1234"), -1.0),
+            (PayPalPayment("user@example.com"), 20_000.0),
+            (PayPalPayment("user@"), 5.0),
+            (PayPalPayment("user@example.com"), 5.0),
+            (object(), 5.0),
+        ]
+        report = PaymentValidator(max_amount=10_000.0).validate(payments)
+        assert report.reasons == [
+            None, INVALID_LAST4, INVALID_AMOUNT, AMOUNT_OVER_LIMIT, INVALID_EMAIL, None, UNSUPPORTED_METHOD,
+        ]
+        assert report.accepted == [0, 5]
+        assert report.rejected[INVALID_LAST4] == 1 and sum(report.rejected.values()) == 5
+        assert report.per_second > 0
+        assert "2 accepted, 5 rejected" in format_report(report)
+
+    def test_velocity_limits(self):
+        """Test per-account count and amount limits across batches."""
+        validator = PaymentValidator(max_per_account=2, max_amount_per_account=25.0)
+        card = CreditCardPayment("1111", account_id="acct-1")
+        first = validator.validate([(card, 10.0), (CreditCardPayment("1111", "acct-1"), 10.0), (card, 1.0)])
+        assert first.reasons == [None, None, VELOCITY_COUNT]
+        other = validator.validate([(PayPalPayment("a@b.co"), 20.0), (PayPalPayment("A@b.co"), 6.0)])
+        assert other.reasons == [None, VELOCITY_AMOUNT]
+        validator.reset_velocity()
+        assert validator.validate([(card, 1.0)]).accepted == [0]
+
+    def test_cards_sharing_last4_are_separate_accounts(self):
+        """Test that unrelated cards with the same last4 have their own budgets."""
+        validator = PaymentValidator(max_per_account=1)
+        batch = ((CreditCardPayment("4242"), 5.0) for _ in range(3))
+        report = validator.validate(batch)
+        assert report.accepted == [0, 1, 2] and len(report.reasons) == 3
+        card = CreditCardPayment("4242")
+        assert validator.validate([(card, 5.0), (card, 5.0)]).reasons == [None, VELOCITY_COUNT]
+
+    def test_only_accepted_reach_gateway(self):
+        """Test that rejected payments are never processed."""
+        CountingCard.calls = 0
+        payments = [(CountingCard("1234"), 5.0), (CountingCard("xx"), 5.0), (CountingCard("4321"), 0.0)]
+        report = PaymentValidator().validate(payments)
+        assert process_accepted(payments, report) == [True, None, None]
+        assert CountingCard.calls == 1
+
+    def test_metrics_and_large_batch(self):
+        """Test metric export and a batch of thousands of payments."""
+        registry = MetricsRegistry()
+        payments = [(CreditCardPayment(f"{n % 10000:04d}"), float(n % 500)) for n in range(20000)]
+        report = PaymentValidator(registry=registry).validate(payments)
+        assert len(report.accepted) == 20000 - 40 and report.rejected == {INVALID_AMOUNT: 40}
+        text = registry.export_text()
+        assert 'payment_validation_total{result="accepted"} 19960' in text
+        assert 'payment_validation_total{result="invalid_amount"} 40' in text
@@ -0,0 +1,110 @@
+"""
+Tests for columnar shape storage and the memory-mapped file format.
+"""
+import math
+import pytest
+from exercises.shapes.circle import Circle
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.triangle import Triangle
+from exercises.shapes.columnar import (
+    ColumnarShapeFile,
+    ShapeColumns,
+    kind_of,
+    write_shapes,
+)
+
+
+@pytest.fixture
+def shapes():
+    return [
+        Circle(1.0),
+        Rectangle(3.0, 4.0),
+        Triangle(3.0, 4.0, 4.0, 5.0),
+        Circle(2.0),
+        Rectangle(1.5, 2.0),
+        Triangle(6.0, 2.0, 5.0, 5.0),
+    ]
+
+
+class TestShapeColumns:
+    """Test cases for in-memory columns."""
+
+    def test_from_shapes_counts(self, shapes):
+        """Shapes are split into per-kind columns."""
+        cols = ShapeColumns.from_shapes(shapes)
+        assert len(cols) == 6
+        assert cols.count("circle") == 2
+        assert list(cols.column("rectangle", "width")) == [3.0, 1.5]
+
+    def test_areas_match_objects(self, shapes):
+        """Column kernels agree with Shape.area() per row."""
+        cols = ShapeColumns.from_shapes(shapes)
+        for kind in ("circle", "rectangle", "triangle"):
+            expected = [s.area() for s in shapes if kind_of(s) == kind]
+            assert cols.areas(kind) == pytest.approx(expected)
+
+    def test_totals_match_objects(self, shapes):
+        """Totals agree with summing over the objects."""
+        cols = ShapeColumns.from_shapes(shapes)
+        assert cols.total_area() == pytest.approx(sum(s.area() for s in shapes))
+        assert cols.total_perimeter() == pytest.approx(sum(s.perimeter() for s in shapes))
+
+    def test_triangle_without_sides(self):
+        """Missing triangle sides behave like Triangle.perimeter()."""
+        cols = ShapeColumns.from_shapes([Triangle(3.0, 4.0)])
+        assert math.isnan(cols.perimeters("triangle")[0])
+        with pytest.raises(NotImplementedError):
+            cols.total_perimeter()
+
+    def test_round_trip_to_shapes(self, shapes):
+        """Rows can be rebuilt into shape objects."""
+        cols = ShapeColumns.from_shapes([Triangle(3.0, 4.0), Triangle(1.0, 2.0, 3.0, 4.0)])
+        rebuilt = cols.to_shapes("triangle")
+        assert rebuilt[0].side_a is None
+        assert rebuilt[1].describe() == "Triangle with base 1.0 and height 2.0"
+
+    def test_unsupported_shape(self):
+        """Objects that are not known shapes are rejected."""
+        with pytest.raises(TypeError):
+            ShapeColumns.from_shapes(["not a shape"])
+
+
+class TestColumnarShapeFile:
+    """Test cases for the memory-mapped file format."""
+
+    def test_round_trip(self, tmp_path, shapes):
+        """Written files read back with the same counts and totals."""
+        path = tmp_path / "shapes.shpc"
+        write_shapes(path, shapes)
+        with ColumnarShapeFile(path) as data:
+            assert data.counts == {"circle": 2, "rectangle": 2, "triangle": 2}
+            cols = data.read()
+            assert cols.total_area() == pytest.approx(sum(s.area() for s in shapes))
+            del cols
+
+    def test_columns_are_views(self, tmp_path, shapes):
+        """Columns are zero-copy memoryviews over the file."""
+        path = tmp_path / "shapes.shpc"
+        write_shapes(path, shapes)
+        with ColumnarShapeFile(path) as data:
+            radius = data.column("circle", "radius")
+            assert isinstance(radius, memoryview)
+            assert radius.tolist() == [1.0, 2.0]
+            radius.release()
+
+    def test_select_by_kind_and_range(self, tmp_path):
+        """Reads can be restricted to one kind and a row range."""
+        path = tmp_path / "many.shpc"
+        write_shapes(path, [Rectangle(float(i), 2.0) for i in range(1, 11)])
+        with ColumnarShapeFile(path) as data:
+            cols = data.read("rectangle", 2, 5)
+            assert cols.areas("rectangle") == [6.0, 8.0, 10.0]
+            assert cols.count("circle") == 0
+            del cols
+
+    def test_rejects_other_files(self, tmp_path):
+        """Files without the magic header are rejected."""
+        path = tmp_path / "bogus.shpc"
+        path.write_bytes(b"NOPE" + b"\0" * 60)
+        with pytest.raises(ValueError):
+            ColumnarShapeFile(path)
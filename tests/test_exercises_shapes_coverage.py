@@ -0,0 +1,81 @@
+"""
+Tests for the Monte Carlo union-area estimator.
+"""
+import math
+import pytest
+from exercises.shapes.circle import Circle
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.triangle import Triangle
+from exercises.shapes.coverage import Placement, estimate_union_area
+
+
+class TestEstimateUnionArea:
+    """Test cases for estimate_union_area."""
+
+    def test_empty(self):
+        """No shapes cover no area."""
+        result = estimate_union_area([])
+        assert result.area == 0.0
+        assert result.converged
+
+    def test_disjoint_shapes_match_sum(self):
+        """Without overlap the union equals the sum of areas."""
+        shapes = [
+            Placement(Rectangle(2.0, 2.0), 0.0, 0.0),
+            Placement(Circle(1.0), 5.0, 1.0),
+            Placement(Triangle(2.0, 2.0), 8.0, 0.0),
+        ]
+        expected = sum(p.shape.area() for p in shapes)
+        result = estimate_union_area(shapes, rel_tolerance=0.02, seed=1)
+        assert result.converged
+        assert result.area == pytest.approx(expected, rel=0.06)
+
+    def test_overlap_not_double_counted(self):
+        """Two identical squares cover the area of one."""
+        square = Rectangle(4.0, 4.0)
+        shapes = [Placement(square, 0.0, 0.0), Placement(square, 0.0, 0.0)]
+        result = estimate_union_area(shapes, seed=2)
+        assert result.area == pytest.approx(16.0)
+
+    def test_half_overlapping_squares(self):
+        """Squares overlapping by half cover 1.5 squares."""
+        shapes = [
+            Placement(Rectangle(2.0, 2.0), 0.0, 0.0),
+            Placement(Rectangle(2.0, 2.0), 1.0, 0.0),
+        ]
+        result = estimate_union_area(shapes, rel_tolerance=0.005, seed=3)
+        assert result.area == pytest.approx(6.0, rel=0.02)
+
+    def test_circle_inside_square(self):
+        """A circle fully inside a square adds nothing."""
+        shapes = [
+            Placement(Rectangle(4.0, 4.0), -2.0, -2.0),
+            Placement(Circle(1.5), 0.0, 0.0),
+        ]
+        assert estimate_union_area(shapes, seed=4).area == pytest.approx(16.0)
+
+    def test_sample_cap_reports_not_converged(self):
+        """Hitting max_samples before the target is reported."""
+        shapes = [Placement(Circle(1.0), 0.0, 0.0)]
+        result = estimate_union_area(
+            shapes, rel_tolerance=1e-6, batch_size=1000, max_samples=3000, seed=5
+        )
+        assert not result.converged
+        assert result.samples == 3000
+        assert result.area == pytest.approx(math.pi, rel=0.1)
+
+    def test_reproducible_with_seed(self):
+        """The same seed gives the same estimate."""
+        shapes = [Placement(Circle(1.0), 0.0, 0.0), Placement(Circle(1.0), 1.0, 0.0)]
+        first = estimate_union_area(shapes, seed=6)
+        second = estimate_union_area(shapes, seed=6)
+        assert first == second
+
+    def test_workers_match_serial(self):
+        """Worker processes produce the same estimate as the serial path."""
+        shapes = [Placement(Circle(1.0), 0.0, 0.0), Placement(Rectangle(1.0, 3.0), 0.5, 0.0)]
+        serial = estimate_union_area(shapes, batch_size=2000, max_samples=8000,
+                                     rel_tolerance=0.0, seed=7, workers=1)
+        parallel = estimate_union_area(shapes, batch_size=2000, max_samples=8000,
+                                       rel_tolerance=0.0, seed=7, workers=2)
+        assert serial == parallel
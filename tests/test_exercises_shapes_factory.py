@@ -0,0 +1,118 @@
+"""
+Tests for the batch shape factory.
+"""
+import io
+import json
+import pytest
+from exercises.shapes.circle import Circle
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.triangle import Triangle
+from exercises.shapes.columnar import ShapeColumns
+from exercises.shapes.factory import ShapeFactory, default_factory
+
+
+@pytest.fixture
+def factory():
+    return default_factory()
+
+
+@pytest.fixture
+def records():
+    return [
+        {"kind": "circle", "radius": 2.0},
+        ("rectangle", 3.0, 4.0),
+        {"kind": "triangle", "base": 3.0, "height": 4.0, "side_a": 4.0, "side_b": 5.0},
+        ("triangle", 6.0, 2.0),
+    ]
+
+
+class TestDecodeObjects:
+    """Test cases for decoding into shape objects."""
+
+    def test_types_and_order(self, factory, records):
+        """Shapes come back in input order with the right classes."""
+        shapes = factory.decode(records)
+        assert [type(s) for s in shapes] == [Circle, Rectangle, Triangle, Triangle]
+
+    def test_objects_behave_like_constructed_ones(self, factory, records):
+        """Fast-built objects match objects built with __init__."""
+        shapes = factory.decode(records)
+        expected = [Circle(2.0), Rectangle(3.0, 4.0), Triangle(3.0, 4.0, 4.0, 5.0), Triangle(6.0, 2.0)]
+        for built, reference in zip(shapes, expected):
+            assert built.__dict__ == reference.__dict__
+            assert built.area() == pytest.approx(reference.area())
+        assert shapes[3].side_a is None
+
+    def test_json_lines(self, factory, records):
+        """JSON lines decode like dict records."""
+        text = "\n".join(json.dumps(r) for r in records if isinstance(r, dict)) + "\n\n"
+        shapes = factory.decode_json_lines(io.StringIO(text))
+        assert [s.describe() for s in shapes] == [
+            "Circle with radius 2.0",
+            "Triangle with base 3.0 and height 4.0",
+        ]
+
+
+class TestDecodeColumns:
+    """Test cases for decoding into ShapeColumns."""
+
+    def test_columns_output(self, factory, records):
+        """Column output holds the same data."""
+        cols = factory.decode(records, output="columns")
+        assert isinstance(cols, ShapeColumns)
+        assert cols.count("triangle") == 2
+        assert cols.total_area() == pytest.approx(sum(s.area() for s in factory.decode(records)))
+
+
+class TestValidation:
+    """Test cases for column-wise validation."""
+
+    def test_non_positive_dimension_raises(self, factory):
+        """Zero or negative dimensions are rejected."""
+        with pytest.raises(ValueError, match="Record 1"):
+            factory.decode([("circle", 1.0), ("rectangle", 0.0, 2.0)])
+
+    def test_triangle_inequality(self, factory):
+        """Sides that cannot form a triangle are rejected."""
+        with pytest.raises(ValueError):
+            factory.decode([("triangle", 10.0, 1.0, 2.0, 3.0)])
+
+    def test_skip_invalid(self, factory):
+        """errors='skip' drops invalid records."""
+        records = [("circle", -1.0), ("circle", 1.0), ("triangle", 10.0, 1.0, 2.0, 3.0)]
+        shapes = factory.decode(records, errors="skip")
+        assert len(shapes) == 1 and shapes[0].radius == 1.0
+        cols = factory.decode(records, output="columns", errors="skip")
+        assert len(cols) == 1
+
+    def test_unknown_kind(self, factory):
+        """Unregistered kinds are reported."""
+        with pytest.raises(ValueError, match="unknown shape kind"):
+            factory.decode([{"kind": "hexagon", "side": 1.0}])
+
+    def test_missing_field(self, factory):
+        """Required fields must be present."""
+        with pytest.raises(ValueError, match="missing field"):
+            factory.decode([{"kind": "rectangle", "width": 1.0}])
+
+    def test_wrong_tuple_length(self, factory):
+        """Tuples must carry the right number of values."""
+        with pytest.raises(ValueError):
+            factory.decode([("rectangle", 1.0)])
+
+
+class TestRegistry:
+    """Test cases for registering custom kinds."""
+
+    def test_register_custom_kind(self):
+        """Custom kinds are built through their constructor by default."""
+
+        class Square(Rectangle):
+            def __init__(self, side):
+                super().__init__(side, side)
+
+        factory = ShapeFactory()
+        factory.register("square", Square, ("side",))
+        shapes = factory.decode([("square", 3.0)])
+        assert shapes[0].area() == 9.0
+        assert factory.kinds() == ["square"]
@@ -0,0 +1,93 @@
+"""
+Tests for the memory-mapped triangle mesh reader.
+"""
+import math
+import pytest
+from exercises.shapes.mesh import MeshReader, facet_metrics, write_stl
+from exercises.shapes.triangle import Triangle
+
+
+def cube_facets(size=1.0):
+    """Return the 12 facets of an axis-aligned cube."""
+    s = size
+    corners = [(x, y, z) for x in (0, s) for y in (0, s) for z in (0, s)]
+    faces = [(0, 1, 3, 2), (4, 5, 7, 6), (0, 1, 5, 4),
+             (2, 3, 7, 6), (0, 2, 6, 4), (1, 3, 7, 5)]
+    facets = []
+    for a, b, c, d in faces:
+        facets.append((corners[a], corners[b], corners[c]))
+        facets.append((corners[a], corners[c], corners[d]))
+    return facets
+
+
+@pytest.fixture
+def cube_path(tmp_path):
+    path = tmp_path / "cube.stl"
+    write_stl(path, cube_facets(2.0), header=b"cube")
+    return path
+
+
+class TestFacetMetrics:
+    """Test cases for the per-facet formulas."""
+
+    def test_matches_triangle_formulas(self):
+        """Facet metrics should agree with Triangle area and perimeter."""
+        base, height, side_a, side_b = facet_metrics(0, 0, 0, 4, 0, 0, 0, 3, 0)
+        t = Triangle(base, height, side_a, side_b)
+        assert t.area() == pytest.approx(6.0)
+        assert t.perimeter() == pytest.approx(12.0)
+
+    def test_degenerate_facet(self):
+        """A facet with coincident vertices has zero area."""
+        base, height, _, _ = facet_metrics(1, 1, 1, 1, 1, 1, 2, 2, 2)
+        assert 0.5 * base * height == 0.0
+
+
+class TestMeshReader:
+    """Test cases for MeshReader."""
+
+    def test_facet_count(self, cube_path):
+        """The reader should expose the declared facet count."""
+        with MeshReader(cube_path) as mesh:
+            assert len(mesh) == 12
+
+    def test_total_area(self, cube_path):
+        """A cube of side 2 has surface area 24."""
+        with MeshReader(cube_path) as mesh:
+            assert mesh.total_area() == pytest.approx(24.0)
+
+    def test_total_perimeter(self, cube_path):
+        """Each right-triangle facet has perimeter 2 + 2 + 2 * sqrt(2)."""
+        with MeshReader(cube_path) as mesh:
+            expected = 12 * (4 + 2 * math.sqrt(2))
+            assert mesh.total_perimeter() == pytest.approx(expected, rel=1e-6)
+
+    def test_small_chunks_give_same_result(self, cube_path):
+        """Chunk size must not change the totals."""
+        with MeshReader(cube_path, chunk_size=5) as mesh:
+            chunks = list(mesh.iter_facet_areas())
+            assert [len(c) for c in chunks] == [5, 5, 2]
+            assert mesh.total_area() == pytest.approx(24.0)
+
+    def test_facet_area_range(self, cube_path):
+        """Per-facet areas can be read for a sub-range."""
+        with MeshReader(cube_path, chunk_size=4) as mesh:
+            areas = mesh.facet_areas(3, 9)
+            assert len(areas) == 6
+            assert areas == pytest.approx([2.0] * 6)
+
+    def test_truncated_file_rejected(self, tmp_path):
+        """A file shorter than its declared facet count is rejected."""
+        path = tmp_path / "broken.stl"
+        write_stl(path, cube_facets())
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+        with pytest.raises(ValueError):
+            MeshReader(path)
+
+    def test_empty_file_rejected(self, tmp_path):
+        """An empty file is not a mesh."""
+        path = tmp_path / "empty.stl"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            MeshReader(path)
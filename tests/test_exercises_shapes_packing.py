@@ -0,0 +1,94 @@
+"""
+Tests for the rectangle bin-packing engine.
+"""
+import random
+import pytest
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.packing import RectanglePacker, pack_rectangles
+
+ALGORITHMS = ["skyline", "maxrects", "guillotine"]
+
+
+def assert_valid_layout(result, rectangles, sheet_w, sheet_h):
+    """Every item lies inside its sheet and no two items overlap."""
+    by_sheet = {}
+    for placed in result.placements:
+        rect = rectangles[placed.index]
+        if placed.rotated:
+            assert (placed.width, placed.height) == (rect.height, rect.width)
+        else:
+            assert (placed.width, placed.height) == (rect.width, rect.height)
+        assert 0 <= placed.x and placed.x + placed.width <= sheet_w + 1e-9
+        assert 0 <= placed.y and placed.y + placed.height <= sheet_h + 1e-9
+        by_sheet.setdefault(placed.sheet, []).append(placed)
+    for items in by_sheet.values():
+        for i, a in enumerate(items):
+            for b in items[i + 1:]:
+                separate = (a.x + a.width <= b.x + 1e-9 or b.x + b.width <= a.x + 1e-9
+                            or a.y + a.height <= b.y + 1e-9 or b.y + b.height <= a.y + 1e-9)
+                assert separate, f"{a} overlaps {b}"
+
+
+@pytest.fixture
+def random_rectangles():
+    rng = random.Random(42)
+    return [Rectangle(rng.randint(1, 30), rng.randint(1, 30)) for _ in range(200)]
+
+
+class TestRectanglePacker:
+    """Test cases for RectanglePacker."""
+
+    @pytest.mark.parametrize("algorithm", ALGORITHMS)
+    def test_perfect_fit(self, algorithm):
+        """Four quarter sheets fill one sheet exactly."""
+        rects = [Rectangle(50, 50) for _ in range(4)]
+        result = pack_rectangles(rects, 100, 100, algorithm=algorithm)
+        assert result.sheets == 1
+        assert result.utilization == pytest.approx(1.0)
+        assert_valid_layout(result, rects, 100, 100)
+
+    @pytest.mark.parametrize("algorithm", ALGORITHMS)
+    def test_random_layout_is_valid(self, algorithm, random_rectangles):
+        """Random items are placed without overlaps and in input order."""
+        result = pack_rectangles(random_rectangles, 100, 100, algorithm=algorithm)
+        assert [p.index for p in result.placements] == list(range(len(random_rectangles)))
+        assert not result.unplaced
+        assert_valid_layout(result, random_rectangles, 100, 100)
+        assert 0.5 < result.utilization <= 1.0
+
+    @pytest.mark.parametrize("algorithm", ALGORITHMS)
+    def test_rotation_needed(self, algorithm):
+        """A tall item only fits a wide sheet when rotated."""
+        rects = [Rectangle(10, 100)]
+        result = pack_rectangles(rects, 100, 10, algorithm=algorithm)
+        assert result.placements[0].rotated
+        no_rotation = pack_rectangles(rects, 100, 10, algorithm=algorithm, allow_rotation=False)
+        assert no_rotation.unplaced == [0]
+
+    def test_multiple_sheets(self):
+        """Items that cannot share a sheet open new sheets."""
+        rects = [Rectangle(60, 60) for _ in range(3)]
+        result = pack_rectangles(rects, 100, 100)
+        assert result.sheets == 3
+        assert sorted(p.sheet for p in result.placements) == [0, 1, 2]
+
+    def test_maxrects_is_dense(self, random_rectangles):
+        """MaxRects should need no more sheets than skyline here."""
+        skyline = pack_rectangles(random_rectangles, 100, 100, algorithm="skyline")
+        maxrects = pack_rectangles(random_rectangles, 100, 100, algorithm="maxrects")
+        assert maxrects.sheets <= skyline.sheets
+
+    def test_invalid_arguments(self):
+        """Bad configuration and bad items raise ValueError."""
+        with pytest.raises(ValueError):
+            RectanglePacker(0, 10)
+        with pytest.raises(ValueError):
+            RectanglePacker(10, 10, algorithm="magic")
+        with pytest.raises(ValueError):
+            pack_rectangles([Rectangle(0, 5)], 10, 10)
+
+    def test_empty_input(self):
+        """Packing nothing uses no sheets."""
+        result = pack_rectangles([], 10, 10)
+        assert result.sheets == 0
+        assert result.utilization == 0.0
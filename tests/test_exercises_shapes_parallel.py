@@ -0,0 +1,73 @@
+"""
+Tests for shared-memory parallel aggregation over shape columns.
+"""
+import pytest
+from exercises.shapes.circle import Circle
+from exercises.shapes.rectangle import Rectangle
+from exercises.shapes.triangle import Triangle
+from exercises.shapes.columnar import ShapeColumns
+from exercises.shapes.parallel import ParallelAggregator, parallel_total_area
+
+
+@pytest.fixture(scope="module")
+def shapes():
+    result = []
+    for i in range(1, 301):
+        result.append(Circle(i / 100))
+        result.append(Rectangle(i / 10, 2.0))
+        result.append(Triangle(3.0, i / 50, 4.0, 5.0))
+    return result
+
+
+@pytest.fixture(scope="module")
+def columns(shapes):
+    return ShapeColumns.from_shapes(shapes)
+
+
+class TestParallelAggregator:
+    """Test cases for ParallelAggregator."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_total_area(self, shapes, columns, workers):
+        """Parallel total matches the per-object sum."""
+        expected = sum(s.area() for s in shapes)
+        assert parallel_total_area(columns, workers=workers) == pytest.approx(expected)
+
+    def test_min_max_area(self, shapes, columns):
+        """Min/max per kind match the objects."""
+        with ParallelAggregator(columns, workers=2) as agg:
+            result = agg.min_max_area()
+        circles = [s.area() for s in shapes if isinstance(s, Circle)]
+        assert result["circle"] == pytest.approx((min(circles), max(circles)))
+        assert set(result) == {"circle", "rectangle", "triangle"}
+
+    def test_perimeter_histogram(self, shapes, columns):
+        """Histogram counts match bucketing the objects directly."""
+        edges = [0, 10, 20, 40, 80]
+        with ParallelAggregator(columns, workers=2) as agg:
+            counts = agg.perimeter_histogram(edges)
+        perimeters = [s.perimeter() for s in shapes]
+        expected = [
+            sum(1 for p in perimeters if lo <= p < hi or (hi == edges[-1] and p == hi))
+            for lo, hi in zip(edges, edges[1:])
+        ]
+        assert counts == expected
+
+    def test_same_results_across_worker_counts(self, columns):
+        """Results do not depend on the number of workers."""
+        with ParallelAggregator(columns, workers=1) as serial:
+            expected = serial.perimeter_histogram([0, 5, 50])
+        with ParallelAggregator(columns, workers=3) as parallel:
+            assert parallel.perimeter_histogram([0, 5, 50]) == expected
+
+    def test_empty_columns(self):
+        """Empty collections aggregate to zero."""
+        with ParallelAggregator(ShapeColumns(), workers=1) as agg:
+            assert agg.total_area() == 0.0
+            assert agg.min_max_area() == {}
+
+    def test_invalid_edges(self, columns):
+        """Histogram edges must be increasing."""
+        with ParallelAggregator(columns, workers=1) as agg:
+            with pytest.raises(ValueError):
+                agg.perimeter_histogram([5, 1])
@@ -0,0 +1,68 @@
+"""
+Tests for lazy package imports and the cold import-time budget.
+
+Every measurement runs in a fresh interpreter. Absolute timings depend on
+the machine, so the fixed budget is only checked when the
+IMPORT_BUDGET_MS environment variable is set (e.g. ``IMPORT_BUDGET_MS=25``);
+the default run compares a lazy import with an eager one instead.
+"""
+import os
+import pytest
+from tools.import_time import PACKAGES, measure_import
+
+BUDGET_MS = os.environ.get("IMPORT_BUDGET_MS")
+
+
+class TestLazyImports:
+    """Package imports must not load their submodules up front."""
+
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_package_import_is_lazy(self, package):
+        """Importing a package loads only the package itself (and its parent)."""
+        loaded = measure_import(package).loaded
+        assert package in loaded
+        assert all(package.startswith(module) for module in loaded)
+
+    def test_first_access_loads_only_what_is_needed(self):
+        """Reading one class imports just its modules."""
+        loaded = set(measure_import("exercises.ecommerce", access=["Book"]).loaded)
+        assert loaded == {"exercises", "exercises.ecommerce", "exercises.ecommerce.book", "exercises.ecommerce.product"}
+
+    def test_lazy_names_resolve(self):
+        """Lazy names are the real classes, listed in dir()."""
+        import exercises.shapes as shapes
+        from exercises.shapes.circle import Circle
+
+        assert shapes.Circle is Circle
+        assert "Circle" in dir(shapes)
+        assert "Circle" in vars(shapes)  # cached after the first lookup
+        with pytest.raises(AttributeError):
+            shapes.Hexagon
+
+    def test_every_export_resolves(self):
+        """Each name in __all__ is defined by the module it is mapped to."""
+        import exercises.ecommerce as ecommerce
+        from exercises.ecommerce.validation import PaymentValidator
+
+        assert all(getattr(ecommerce, name).__name__ == name for name in ecommerce.__all__)
+        assert ecommerce.PaymentValidator is PaymentValidator
+
+
+class TestImportBudget:
+    """Cold imports must stay cheap."""
+
+    def test_lazy_import_is_cheaper_than_eager(self):
+        """Importing the package costs less than loading every export."""
+        import exercises.ecommerce as ecommerce
+
+        lazy = min(measure_import("exercises.ecommerce").cumulative_ms for _ in range(3))
+        eager = min(measure_import("exercises.ecommerce", access=ecommerce.__all__).cumulative_ms for _ in range(3))
+        assert lazy < eager, f"lazy import {lazy:.2f} ms, eager {eager:.2f} ms"
+
+    @pytest.mark.skipif(BUDGET_MS is None, reason="set IMPORT_BUDGET_MS to check the absolute budget")
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_cold_import_within_budget(self, package):
+        """The fastest of three cold imports is under the budget."""
+        budget = float(BUDGET_MS)
+        best = min(measure_import(package).cumulative_ms for _ in range(3))
+        assert best <= budget, f"{package} took {best:.2f} ms (budget {budget} ms)"
@@ -0,0 +1,87 @@
+"""
+Tests for the asyncio actor runtime.
+"""
+import asyncio
+import pytest
+from inheritance import Bird, Cat, Dog
+from simulation.actors import ActorSystem
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestActorSystem:
+    """Test cases for ActorSystem."""
+
+    def test_ask_returns_method_result(self):
+        """ask() resolves to the animal method's return value."""
+        async def scenario():
+            system = ActorSystem()
+            rex = system.spawn(Dog("Rex", 3, "Lab"))
+            async with system:
+                return await system.ask(rex, "fetch", "ball")
+
+        assert run(scenario()) == "Rex runs and fetches the ball! Good dog!"
+
+    def test_messages_to_one_actor_keep_order(self):
+        """Messages to the same actor are delivered in send order."""
+        async def scenario():
+            system = ActorSystem(workers=3, batch_size=2)
+            dog = Dog("Rex", 3, "Lab")
+            rex = system.spawn(dog)
+            async with system:
+                for trick in ["sit", "stay", "roll over", "shake", "beg"]:
+                    system.tell(rex, "learn_trick", trick)
+            return dog.tricks
+
+        assert run(scenario()) == ["sit", "stay", "roll over", "shake", "beg"]
+
+    def test_broadcast_to_many_actors(self):
+        """A broadcast reaches every actor exactly once."""
+        async def scenario():
+            system = ActorSystem(workers=4)
+            birds = [Bird(f"B{i}", 1, 5.0) for i in range(2000)]
+            for bird in birds:
+                system.spawn(bird)
+            async with system:
+                system.broadcast("fly", 40)
+            return birds, system.metrics()
+
+        birds, metrics = run(scenario())
+        assert all(b.is_flying and b.energy == 80 for b in birds)
+        assert metrics["processed"] == 2000
+        assert metrics["pending"] == 0
+        assert metrics["throughput"] > 0
+        assert 0 <= metrics["latency_p50"] <= metrics["latency_max"]
+
+    def test_messages_sent_before_start(self):
+        """Messages queued before start() are delivered once started."""
+        async def scenario():
+            system = ActorSystem()
+            cat = Cat("Tom", 2, "Grey")
+            tom = system.spawn(cat)
+            system.tell(tom, "climb_tree")
+            await system.start()
+            await system.stop()
+            return cat.energy
+
+        assert run(scenario()) == 80
+
+    def test_errors_are_reported(self):
+        """Exceptions propagate through ask() and are counted."""
+        async def scenario():
+            system = ActorSystem()
+            rex = system.spawn(Dog("Rex", 3, "Lab"))
+            async with system:
+                system.tell(rex, "no_such_method")
+                with pytest.raises(AttributeError):
+                    await system.ask(rex, "fly", 10)
+            return system.metrics()
+
+        assert run(scenario())["failed"] == 2
+
+    def test_invalid_configuration(self):
+        """Worker and batch counts must be positive."""
+        with pytest.raises(ValueError):
+            ActorSystem(workers=0)
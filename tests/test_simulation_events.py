@@ -0,0 +1,107 @@
+"""
+Tests for the structured event log.
+Rendered messages must match what the inheritance.py methods return.
+"""
+import random
+import pytest
+from inheritance import Animal, Bird, Cat, Dog
+from simulation.events import FETCH, FETCH_TIRED, Event, EventLog, EventRecorder
+
+ACTIONS = {
+    Dog: [("eat", ("kibble",)), ("sleep", ()), ("wake_up", ()), ("make_sound", ()),
+          ("fetch", ("ball",)), ("learn_trick", ("sit",)), ("perform_trick", ("sit",)),
+          ("perform_trick", ("beg",))],
+    Cat: [("eat", ("fish",)), ("sleep", ()), ("wake_up", ()), ("make_sound", ()),
+          ("purr", ()), ("climb_tree", ()), ("knock_over_object", ("vase",))],
+    Bird: [("eat", ("seeds",)), ("sleep", ()), ("wake_up", ()), ("make_sound", ()),
+           ("fly", (50,)), ("land", ())],
+    Animal: [("eat", ("hay",)), ("sleep", ()), ("wake_up", ()), ("make_sound", ())],
+}
+
+
+def make_pair(cls):
+    if cls is Dog:
+        return Dog("Rex", 3, "Lab"), Dog("Rex", 3, "Lab")
+    if cls is Cat:
+        return Cat("Tom", 2, "Grey"), Cat("Tom", 2, "Grey")
+    if cls is Bird:
+        return Bird("Kiwi", 1, 4.0), Bird("Kiwi", 1, 4.0)
+    return Animal("Hammy", "Hamster", 1), Animal("Hammy", "Hamster", 1)
+
+
+class TestEventRecorder:
+    """Structured actions must mirror the string API."""
+
+    @pytest.mark.parametrize("cls", [Dog, Cat, Bird, Animal])
+    def test_random_script_matches_methods(self, cls):
+        """Rendered events equal the method return values, state included."""
+        rng = random.Random(cls.__name__)
+        recorded, reference = make_pair(cls)
+        log = EventLog(capacity=1000)
+        recorder = EventRecorder(log)
+        animal_id = recorder.register(recorded)
+        expected = []
+        for _ in range(300):
+            action, args = rng.choice(ACTIONS[cls])
+            getattr(recorder, action)(animal_id, *args)
+            expected.append(getattr(reference, action)(*args))
+        assert list(log.messages()) == expected
+        assert vars(recorded) == vars(reference)
+
+    def test_returns_event_codes(self):
+        """Actions return compact event codes, not strings."""
+        recorder = EventRecorder(EventLog())
+        rex = recorder.register(Dog("Rex", 3, "Lab"))
+        codes = [recorder.fetch(rex, "stick") for _ in range(7)]
+        assert codes == [FETCH] * 6 + [FETCH_TIRED]
+
+
+class TestEventLog:
+    """Test cases for the ring buffer."""
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """Only the newest events are kept once full."""
+        log = EventLog(capacity=3)
+        recorder = EventRecorder(log)
+        kiwi = recorder.register(Bird("Kiwi", 1, 4.0))
+        for height in (10, 20, 30, 40):
+            recorder.fly(kiwi, height)
+            recorder.land(kiwi)
+        assert len(log) == 3
+        assert log.dropped == 5
+        assert [e.arg for e in log.events()] == [None, 40, None]
+        assert next(log.messages()) == "Kiwi gracefully lands on the ground!"
+
+    def test_events_are_structured(self):
+        """Events carry the code, animal id and argument."""
+        log = EventLog()
+        recorder = EventRecorder(log)
+        recorder.register(Cat("Tom", 2, "Grey"))
+        rex = recorder.register(Dog("Rex", 3, "Lab"))
+        recorder.fetch(rex, "ball")
+        assert list(log.events()) == [Event(FETCH, rex, "ball")]
+
+    def test_messages_use_name_at_emit_time(self):
+        """Renaming an animal does not rewrite its earlier messages."""
+        log = EventLog()
+        recorder = EventRecorder(log)
+        dog = Dog("Rex", 3, "Lab")
+        rex = recorder.register(dog)
+        recorder.make_sound(rex)
+        dog.name = "Max"
+        recorder.make_sound(rex)
+        assert list(log.messages()) == ["Rex barks: Woof! Woof!", "Max barks: Woof! Woof!"]
+
+    def test_clear(self):
+        """clear() empties the buffer."""
+        log = EventLog(capacity=2)
+        recorder = EventRecorder(log)
+        tom = recorder.register(Cat("Tom", 2, "Grey"))
+        recorder.purr(tom)
+        log.clear()
+        assert len(log) == 0 and list(log.messages()) == []
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            EventLog(capacity=0)
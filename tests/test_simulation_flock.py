@@ -0,0 +1,105 @@
+"""
+Tests for the bird flocking simulation.
+Flight rules are checked against the Bird methods in inheritance.py.
+"""
+import math
+import random
+import pytest
+from inheritance import Bird
+from simulation.flock import Flock, FlockBird
+
+
+def make_flock(count=200, seed=1, **options):
+    rng = random.Random(seed)
+    flock = Flock(**options)
+    for n in range(count):
+        flock.add_bird(
+            f"Bird{n}", 1, 8.0,
+            (rng.uniform(0, 60), rng.uniform(0, 60), rng.uniform(20, 60)),
+            (rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1)),
+        )
+    return flock
+
+
+class TestFlockBird:
+    """Test cases for the FlockBird class."""
+
+    def test_fly_and_land_follow_bird_rules(self):
+        """Messages and energy match Bird; position tracks altitude."""
+        flock_bird, bird = FlockBird("Kiwi", 1, 4.0, velocity=(1, 0, 0)), Bird("Kiwi", 1, 4.0)
+        for _ in range(5):
+            assert flock_bird.fly(30) == bird.fly(30)
+        assert flock_bird.energy == bird.energy == 20
+        assert flock_bird.position[2] == 30.0
+        assert flock_bird.land() == bird.land()
+        assert flock_bird.position[2] == 0.0 and flock_bird.velocity == [0.0, 0.0, 0.0]
+
+
+class TestFlock:
+    """Test cases for the Flock simulation."""
+
+    def test_take_off_matches_bird_fly(self):
+        """Column take-off applies Bird.fly to every bird."""
+        birds = [Bird(f"B{n}", 1, 5.0) for n in range(4)]
+        birds[1].sleep()
+        birds[2].energy = 24
+        flock = Flock.from_birds(birds)
+        assert flock.take_off(40) == [0, 3]
+        for bird in birds:
+            bird.fly(40)
+        for bird, copy in zip(birds, flock.to_birds()):
+            assert (copy.energy, copy.is_flying, copy.altitude) == (bird.energy, bird.is_flying, bird.altitude)
+
+    def test_grid_neighbors_match_brute_force(self):
+        """The grid search finds exactly the birds within the radius."""
+        flock = make_flock()
+        flock.take_off(0)
+        for i in range(0, len(flock), 17):
+            expected = sorted(
+                j for j in range(len(flock)) if j != i
+                and math.dist((flock.x[i], flock.y[i], flock.z[i]), (flock.x[j], flock.y[j], flock.z[j])) <= flock.radius
+            )
+            assert sorted(flock.neighbors(i)) == expected
+
+    def test_step_moves_flying_birds_only(self):
+        """Grounded birds keep their place and speed stays limited."""
+        flock = make_flock(max_speed=2.0)
+        flock.take_off(50, where=range(100))
+        grounded = [(flock.x[i], flock.y[i]) for i in range(100, 200)]
+        for _ in range(5):
+            flock.step()
+        assert [(flock.x[i], flock.y[i]) for i in range(100, 200)] == grounded
+        for i in range(100):
+            assert math.hypot(flock.vx[i], flock.vy[i], flock.vz[i]) <= 2.0 + 1e-9
+            assert flock.z[i] >= 1.0 and flock.altitude[i] == round(flock.z[i])
+
+    def test_cohesion_pulls_flock_together(self):
+        """Cohesion shrinks the spread of a loose flock."""
+        flock = make_flock(radius=30.0, separation=0.0, alignment=0.0, cohesion=0.05, energy_per_step=0)
+        flock.take_off(40)
+
+        def spread():
+            cx, cy, cz = flock.centroid()
+            return sum(math.dist((cx, cy, cz), (flock.x[i], flock.y[i], flock.z[i])) for i in range(len(flock)))
+
+        before = spread()
+        for _ in range(20):
+            flock.step()
+        assert spread() < before
+
+    def test_tired_birds_land(self):
+        """Birds land once flying drains their energy below 25."""
+        flock = make_flock(count=10, energy_per_step=5)
+        flock.take_off(30)
+        landed = []
+        for _ in range(20):
+            landed.extend(flock.step())
+        assert sorted(landed) == list(range(10))
+        assert flock.flying() == []
+        assert all(e < 25 for e in flock.energy)
+        assert list(flock.z) == [0.0] * 10
+
+    def test_invalid_options(self):
+        """Radius and speed must be positive."""
+        with pytest.raises(ValueError):
+            Flock(radius=0)
@@ -0,0 +1,123 @@
+"""
+Tests for the column-based animal population engine.
+Every action is checked against the per-object methods in inheritance.py.
+"""
+import random
+import pytest
+from inheritance import Animal, Bird, Cat, Dog
+from simulation.population import BIRD, CAT, DOG, Population
+
+
+def make_animals():
+    return [
+        Dog("Buddy", 3, "Golden Retriever"),
+        Cat("Whiskers", 2, "Orange"),
+        Bird("Tweety", 1, 8.5),
+        Dog("Rex", 5, "Beagle"),
+        Bird("Polly", 4, 12.0),
+        Animal("Generic", "Hamster", 1),
+    ]
+
+
+def state(animal):
+    """Return the comparable state of an animal object."""
+    return {k: v for k, v in vars(animal).items()}
+
+
+def run_object_action(animal, action, args):
+    """Apply an action to an object; return True if its state changed."""
+    method = getattr(animal, action, None)
+    if method is None:
+        return False
+    before = state(animal)
+    method(*args)
+    return state(animal) != before
+
+
+class TestPopulationConstruction:
+    """Test cases for building populations."""
+
+    def test_round_trip(self):
+        """Objects survive a trip through the columns."""
+        animals = make_animals()
+        animals[0].learn_trick("sit")
+        animals[2].fly(30)
+        population = Population.from_animals(animals)
+        assert len(population) == 6
+        assert [state(a) for a in population.to_animals()] == [state(a) for a in animals]
+
+    def test_add_helpers_match_constructors(self):
+        """add_dog/add_cat/add_bird start from constructor defaults."""
+        population = Population()
+        population.add_dog("Rex", 2, "Lab")
+        population.add_cat("Tom", 4, "Grey")
+        population.add_bird("Kiwi", 1, 5.0)
+        expected = [Dog("Rex", 2, "Lab"), Cat("Tom", 4, "Grey"), Bird("Kiwi", 1, 5.0)]
+        assert [state(a) for a in population.to_animals()] == [state(a) for a in expected]
+
+    def test_select_by_kind(self):
+        """select() filters indices by kind."""
+        population = Population.from_animals(make_animals())
+        assert population.select(DOG) == [0, 3]
+        assert population.select(BIRD, where=[0, 2, 4]) == [2, 4]
+        assert population.select(CAT) == [1]
+
+
+class TestPopulationActions:
+    """Actions must follow the same rules as the object methods."""
+
+    def test_fetch_until_tired(self):
+        """Dogs stop fetching once energy drops below 20."""
+        population = Population.from_animals([Dog("Rex", 3, "Lab")])
+        results = [population.fetch() for _ in range(7)]
+        assert [bool(r) for r in results] == [True] * 6 + [False]
+        assert population.energy[0] == 10
+
+    def test_eat_caps_energy(self):
+        """Eating never goes above 100."""
+        population = Population.from_animals([Cat("Tom", 2, "Grey")])
+        population.climb_tree()
+        population.eat()
+        population.eat()
+        assert population.energy[0] == 100
+
+    def test_sleeping_blocks_actions(self):
+        """Sleeping animals cannot fly, fetch or climb."""
+        population = Population.from_animals(make_animals())
+        population.sleep()
+        assert population.fetch() == []
+        assert population.climb_tree() == []
+        assert population.fly(10) == []
+        assert population.sleeping_count() == 6
+        assert population.wake_up(where=[0]) == [0]
+
+    def test_random_actions_match_objects(self):
+        """A random action script gives the same state as the objects."""
+        rng = random.Random(1234)
+        makers = [lambda: Dog("D", 1, "Mutt"), lambda: Cat("C", 1, "Black"), lambda: Bird("B", 1, 3.0)]
+        animals = [rng.choice(makers)() for _ in range(40)]
+        population = Population.from_animals(animals)
+        actions = ["eat", "sleep", "wake_up", "fetch", "purr", "climb_tree", "fly", "land"]
+        for _ in range(300):
+            action = rng.choice(actions)
+            where = rng.sample(range(len(animals)), 10)
+            args = (rng.randint(1, 100),) if action == "fly" else ()
+            succeeded = population.tick([(action, where, *args)])[action]
+            object_args = {"eat": ("seeds",), "fetch": ("ball",)}.get(action, args)
+            changed = [i for i in where if run_object_action(animals[i], action, object_args)]
+            # eat/purr also "succeed" when they leave the state unchanged
+            if action not in ("eat", "purr"):
+                assert sorted(succeeded) == sorted(changed)
+        assert [state(a) for a in population.to_animals()] == [state(a) for a in animals]
+
+    def test_unknown_action(self):
+        """tick() rejects unknown actions."""
+        with pytest.raises(ValueError):
+            Population().tick([("dance", None)])
+
+    def test_statistics(self):
+        """Average energy and sleeping count reflect the columns."""
+        population = Population.from_animals(make_animals())
+        population.fetch()
+        assert population.average_energy() == pytest.approx((600 - 30) / 6)
+        assert Population().average_energy() == 0.0
@@ -0,0 +1,70 @@
+"""
+Tests for the streaming census report writer.
+The info text must match get_info in inheritance.py.
+"""
+import csv
+import io
+import json
+import pytest
+from inheritance import Animal, Bird, Cat, Dog
+from simulation.population import Population
+from simulation.report import FIELDS, iter_info, write_report
+
+
+def make_animals():
+    buddy = Dog("Buddy", 3, "Golden Retriever")
+    buddy.learn_trick("sit")
+    buddy.learn_trick("roll over")
+    whiskers = Cat("Whiskers", 2, "Orange")
+    whiskers.purr()
+    tweety = Bird("Tweety", 1, 8.5)
+    tweety.fly(50)
+    rex = Dog("Rex", 5, "Beagle")
+    rex.sleep()
+    return [buddy, whiskers, tweety, rex, Cat("Tom", 4, "Grey"), Bird("Polly", 4, 12.0), Animal("Generic", "Hamster", 1)]
+
+
+class TestReport:
+    """Test cases for the report writer."""
+
+    def test_info_matches_get_info(self):
+        """Column-rendered text equals get_info for every kind and state."""
+        animals = make_animals()
+        population = Population.from_animals(animals)
+        assert list(iter_info(population)) == [animal.get_info() for animal in animals]
+
+    def test_text_report(self, tmp_path):
+        """The text report holds each get_info block followed by a blank line."""
+        animals = make_animals()
+        path = tmp_path / "census.txt"
+        assert write_report(animals, path, chunk_size=3) == len(animals)
+        expected = "".join(f"{animal.get_info()}\n\n" for animal in animals)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_csv_report(self, tmp_path):
+        """CSV rows carry the state fields and the info text."""
+        animals = make_animals()
+        path = tmp_path / "census.csv"
+        write_report(animals, path, format="csv", chunk_size=2)
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert list(rows[0]) == list(FIELDS)
+        assert [row["info"] for row in rows] == [animal.get_info() for animal in animals]
+        assert rows[0]["tricks"] == "sit;roll over"
+        assert rows[2]["altitude"] == "50" and rows[0]["altitude"] == ""
+
+    def test_jsonl_report_to_file_object(self):
+        """JSONL goes to an open file object, one object per line."""
+        animals = make_animals()
+        handle = io.StringIO()
+        write_report(animals, handle, format="jsonl")
+        records = [json.loads(line) for line in handle.getvalue().splitlines()]
+        assert len(records) == len(animals)
+        assert records[0]["tricks"] == ["sit", "roll over"]
+        assert records[1]["is_purring"] is True and records[1]["breed"] is None
+        assert records[3]["is_sleeping"] is True
+
+    def test_unknown_format(self, tmp_path):
+        """Unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            write_report([], tmp_path / "x", format="xml")
@@ -0,0 +1,120 @@
+"""
+Tests for the discrete-event animal scheduler.
+"""
+import pytest
+from inheritance import Bird, Cat, Dog
+from simulation.scheduler import Scheduler, replay
+
+
+def make_animals():
+    return [Dog("Buddy", 3, "Lab"), Cat("Whiskers", 2, "Orange"), Bird("Tweety", 1, 8.5)]
+
+
+class TestScheduler:
+    """Test cases for Scheduler."""
+
+    def test_events_run_in_time_order(self):
+        """Events execute by time, ties by insertion order."""
+        scheduler = Scheduler(make_animals())
+        scheduler.schedule_at(5.0, 1, "purr")
+        scheduler.schedule_at(1.0, 0, "fetch", "ball")
+        scheduler.schedule_at(1.0, 1, "make_sound")
+        scheduler.run()
+        assert [(e.time, e.animal, e.action) for e in scheduler.log] == [
+            (1.0, 0, "fetch"), (1.0, 1, "make_sound"), (5.0, 1, "purr"),
+        ]
+        assert scheduler.log[0].result == "Buddy runs and fetches the ball! Good dog!"
+
+    def test_energy_effects_come_from_methods(self):
+        """Running fetch events drains the dog like direct calls."""
+        animals = make_animals()
+        scheduler = Scheduler(animals)
+        for i in range(3):
+            scheduler.schedule_at(i * 10.0, 0, "fetch", "stick")
+        scheduler.run()
+        assert animals[0].energy == 55
+
+    def test_busy_animal_defers_events(self):
+        """An event during another action's duration waits for it to finish."""
+        scheduler = Scheduler(make_animals(), durations={"climb_tree": 5.0})
+        scheduler.schedule_at(0.0, 1, "climb_tree")
+        scheduler.schedule_at(1.0, 1, "purr")
+        scheduler.run()
+        assert [(e.time, e.action) for e in scheduler.log] == [(0.0, "climb_tree"), (5.0, "purr")]
+
+    def test_fly_schedules_landing(self):
+        """A bird that takes off lands after its flight duration."""
+        animals = make_animals()
+        scheduler = Scheduler(animals, durations={"fly": 7.0})
+        scheduler.schedule_at(2.0, 2, "fly", 100)
+        scheduler.run(until=8.0)
+        assert animals[2].is_flying
+        scheduler.run()
+        assert scheduler.log[-1] == (9.0, 2, "land", "Tweety gracefully lands on the ground!")
+        assert not animals[2].is_flying
+
+    def test_sleep_schedules_wake_up(self):
+        """Sleeping animals wake up after the sleep duration."""
+        animals = make_animals()
+        scheduler = Scheduler(animals, durations={"sleep": 30.0})
+        scheduler.schedule_at(0.0, 0, "sleep")
+        scheduler.run()
+        assert [e.action for e in scheduler.log] == ["sleep", "wake_up"]
+        assert not animals[0].is_sleeping
+
+    def test_max_events(self):
+        """run() can stop after a number of events."""
+        scheduler = Scheduler(make_animals())
+        for i in range(5):
+            scheduler.schedule_at(float(i), 0, "make_sound")
+        assert scheduler.run(max_events=2) == 2
+        assert len(scheduler) == 3
+
+    def test_schedule_between_runs_keeps_order(self):
+        """An event queued before the open bucket still runs first."""
+        scheduler = Scheduler(make_animals(), bucket_width=10.0)
+        scheduler.schedule_at(5.0, 0, "make_sound")
+        scheduler.schedule_at(25.0, 0, "make_sound")
+        scheduler.run(until=20.0)
+        scheduler.schedule_at(12.0, 1, "purr")
+        scheduler.run()
+        assert [(e.time, e.action) for e in scheduler.log] == [(5.0, "make_sound"), (12.0, "purr"), (25.0, "make_sound")]
+
+    def test_invalid_bucket_width(self):
+        """The bucket width must be positive."""
+        with pytest.raises(ValueError):
+            Scheduler(make_animals(), bucket_width=0.0)
+
+    def test_cannot_schedule_in_the_past(self):
+        """Events before the current time are rejected."""
+        scheduler = Scheduler(make_animals())
+        scheduler.schedule_at(10.0, 0, "make_sound")
+        scheduler.run()
+        with pytest.raises(ValueError):
+            scheduler.schedule_at(5.0, 0, "make_sound")
+
+
+class TestReplay:
+    """Deterministic replay from a seed."""
+
+    def test_same_seed_same_run(self):
+        """Two runs with the same seed are identical."""
+        first = replay(make_animals, seed=7, events=500, horizon=1000.0)
+        second = replay(make_animals, seed=7, events=500, horizon=1000.0)
+        assert first.log == second.log
+        assert [vars(a) for a in first.animals] == [vars(a) for a in second.animals]
+        assert first.processed >= 500
+
+    def test_bucket_width_does_not_change_the_run(self):
+        """Tiny, default and single-bucket queues process the same log."""
+        runs = [
+            replay(make_animals, seed=3, events=2000, horizon=300.0, bucket_width=width)
+            for width in (0.01, 1.0, float("inf"))
+        ]
+        assert runs[0].log == runs[1].log == runs[2].log
+
+    def test_different_seed_differs(self):
+        """A different seed produces a different workload."""
+        first = replay(make_animals, seed=1, events=200, horizon=100.0)
+        second = replay(make_animals, seed=2, events=200, horizon=100.0)
+        assert first.log != second.log
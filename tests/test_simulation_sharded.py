@@ -0,0 +1,92 @@
+"""
+Tests for the sharded multi-process population simulation.
+"""
+import pytest
+from inheritance import Bird, Cat, Dog
+from simulation.population import BIRD, Population
+from simulation.sharded import ShardedSimulation, _act_task
+
+
+def make_population(count=600):
+    animals = []
+    for n in range(count):
+        if n % 3 == 0:
+            animals.append(Dog(f"Dog{n}", 3, "Lab"))
+        elif n % 3 == 1:
+            animals.append(Cat(f"Cat{n}", 2, "Grey"))
+        else:
+            animals.append(Bird(f"Bird{n}", 1, 8.0))
+    return Population.from_animals(animals)
+
+
+def final_state(population):
+    return (
+        list(population.energy), bytes(population.is_sleeping),
+        bytes(population.is_flying), list(population.altitude),
+    )
+
+
+def run(shards, workers, ticks=15, seed=3):
+    population = make_population()
+    with ShardedSimulation(population, shards=shards, workers=workers, seed=seed) as simulation:
+        stats = simulation.run(ticks)
+    return population, stats
+
+
+class TestShardedSimulation:
+    """Test cases for ShardedSimulation."""
+
+    @pytest.mark.parametrize("shards, workers", [(4, 1), (3, 2)])
+    def test_same_result_for_any_shard_count(self, shards, workers):
+        """Sharding and worker processes do not change the outcome."""
+        reference, reference_stats = run(1, 1)
+        population, stats = run(shards, workers)
+        assert final_state(population) == final_state(reference)
+        assert [s[:4] for s in stats] == [s[:4] for s in reference_stats]
+        assert sum(s.cross_shard for s in stats) > 0
+        assert sum(s.cross_shard for s in reference_stats) == 0
+
+    def test_stats_match_population(self):
+        """Per-tick statistics agree with the synced population."""
+        population = make_population()
+        with ShardedSimulation(population, shards=4, workers=1) as simulation:
+            for _ in range(5):
+                stats = simulation.step()
+                simulation.sync()
+                assert stats.average_energy == pytest.approx(population.average_energy())
+                assert stats.sleeping_count == population.sleeping_count()
+        assert stats.tick == 4
+
+    def test_follows_population_rules(self):
+        """Energy stays within bounds and only birds fly."""
+        population, stats = run(2, 1, ticks=30)
+        assert all(0 <= e <= 100 for e in population.energy)
+        assert any(s.woken for s in stats)
+        birds = set(population.select(kind=BIRD))
+        flying = {i for i, f in enumerate(population.is_flying) if f}
+        assert flying and flying <= birds
+        assert all(population.altitude[i] == 0 for i in birds - flying)
+
+    def test_more_shards_than_animals(self):
+        """Shard count is capped by the population size."""
+        population = make_population(count=3)
+        with ShardedSimulation(population, shards=8, workers=1) as simulation:
+            assert simulation.shards == 3
+            simulation.run(2)
+
+    def test_outbox_grouped_by_destination(self):
+        """Each (source, destination) group only holds targets of its destination."""
+        population = make_population()
+        with ShardedSimulation(population, shards=4, workers=1) as simulation:
+            views, _, bounds, _ = simulation._state
+            shards = simulation.shards
+            barks = [_act_task(shard, 0, state=simulation._state) for shard in range(shards)]
+            counts, offsets = views["outbox_counts"], views["outbox_offsets"]
+            for source in range(shards):
+                row = [counts[source * shards + destination] for destination in range(shards)]
+                assert sum(row) == barks[source]
+                for destination, received in enumerate(row):
+                    offset = offsets[source * shards + destination]
+                    start, stop = bounds[destination]
+                    assert all(start <= target < stop for target in views["outbox"][offset:offset + received])
+            assert sum(barks) > 0
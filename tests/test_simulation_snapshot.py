@@ -0,0 +1,88 @@
+"""
+Tests for population snapshots.
+"""
+import pytest
+from inheritance import Animal, Bird, Cat, Dog
+from simulation.population import Population
+from simulation.snapshot import load_snapshot, save_snapshot
+
+
+def make_animals():
+    buddy = Dog("Buddy", 3, "Golden Retriever")
+    buddy.learn_trick("sit")
+    buddy.learn_trick("roll over")
+    buddy.fetch("ball")
+    whiskers = Cat("Whiskers", 2, "Orange")
+    whiskers.purr()
+    whiskers.lives_remaining = 7
+    tweety = Bird("Tweety", 1, 8.5)
+    tweety.fly(120)
+    sleepy = Dog("Zoë", 9, "Mops")
+    sleepy.sleep()
+    return [buddy, whiskers, tweety, sleepy, Animal("Hammy", "Hamster", 1)]
+
+
+def state(animals):
+    return [vars(animal) for animal in animals]
+
+
+class TestSnapshot:
+    """Test cases for save_snapshot/load_snapshot."""
+
+    def test_round_trip_animals(self, tmp_path):
+        """All state survives a snapshot, including tricks and None columns."""
+        animals = make_animals()
+        path = tmp_path / "pop.snap"
+        save_snapshot(animals, path)
+        restored = load_snapshot(path)
+        assert state(restored.to_animals()) == state(animals)
+
+    def test_round_trip_population(self, tmp_path):
+        """A Population can be saved and keeps working after restore."""
+        population = Population.from_animals(make_animals())
+        path = tmp_path / "pop.snap"
+        size = save_snapshot(population, path)
+        assert size == path.stat().st_size
+        restored = load_snapshot(path)
+        assert list(restored.energy) == list(population.energy)
+        restored.fetch()
+        restored.add_cat("New", 1, "White")
+        assert len(restored) == len(population) + 1
+
+    def test_small_chunks(self, tmp_path):
+        """Chunked writing produces the same snapshot content."""
+        population = Population()
+        for i in range(250):
+            population.add_dog(f"Dog {i}", i % 15, "Mutt")
+        population.tricks[3] = ["sit", "stay"]
+        path = tmp_path / "chunked.snap"
+        save_snapshot(population, path, chunk_size=16)
+        restored = load_snapshot(path)
+        assert restored.names == population.names
+        assert restored.tricks == population.tricks
+
+    def test_empty_population(self, tmp_path):
+        """An empty population round-trips."""
+        path = tmp_path / "empty.snap"
+        save_snapshot(Population(), path)
+        assert len(load_snapshot(path)) == 0
+
+    def test_rejects_nul_in_text(self, tmp_path):
+        """Names containing NUL cannot be stored."""
+        with pytest.raises(ValueError):
+            save_snapshot([Dog("Bad\0Name", 1, "Mutt")], tmp_path / "bad.snap")
+
+    def test_rejects_other_files(self, tmp_path):
+        """Non-snapshot files are rejected."""
+        path = tmp_path / "other.snap"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            load_snapshot(path)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """A truncated snapshot is detected."""
+        path = tmp_path / "cut.snap"
+        save_snapshot(make_animals(), path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            load_snapshot(path)
@@ -0,0 +1,102 @@
+"""
+Tests for the bitset trick registry.
+"""
+import time
+
+import pytest
+from inheritance import Dog
+from simulation.tricks import TrickRegistry
+
+
+@pytest.fixture
+def dogs():
+    return [Dog("Buddy", 3, "Lab"), Dog("Rex", 5, "Beagle"), Dog("Fido", 2, "Pug")]
+
+
+class TestTrickRegistry:
+    """Test cases for TrickRegistry."""
+
+    def test_messages_match_dog_methods(self, dogs):
+        """learn/perform return the same text as the Dog methods."""
+        registry = TrickRegistry()
+        twin = Dog("Buddy", 3, "Lab")
+        for trick in ["sit", "sit", "roll over"]:
+            assert registry.learn_trick(dogs[0], trick) == twin.learn_trick(trick)
+        for trick in ["sit", "play dead"]:
+            assert registry.perform_trick(dogs[0], trick) == twin.perform_trick(trick)
+        dogs[0].sleep()
+        twin.sleep()
+        assert registry.perform_trick(dogs[0], "sit") == twin.perform_trick("sit")
+
+    def test_keeps_dog_tricks_in_sync(self, dogs):
+        """The dog's own trick list is updated for get_info."""
+        registry = TrickRegistry()
+        registry.learn_trick(dogs[1], "shake")
+        assert dogs[1].tricks == ["shake"]
+        assert "Knows 1 tricks: shake" in dogs[1].get_info()
+
+    def test_existing_tricks_are_indexed(self, dogs):
+        """Tricks learned before registration are picked up."""
+        dogs[2].learn_trick("beg")
+        registry = TrickRegistry()
+        registry.add_dog(dogs[2])
+        assert registry.knows(dogs[2], "beg")
+        assert registry.learn_trick(dogs[2], "beg") == "Fido already knows how to beg!"
+        assert registry.add_dog(dogs[2]) == 0
+
+    def test_set_queries(self, dogs):
+        """all/any queries combine the inverted index."""
+        registry = TrickRegistry()
+        registry.learn_trick(dogs[0], "sit")
+        registry.learn_trick(dogs[0], "roll over")
+        registry.learn_trick(dogs[1], "sit")
+        registry.learn_trick(dogs[2], "roll over")
+        assert registry.dogs_knowing("sit") == [dogs[0], dogs[1]]
+        assert registry.dogs_knowing_all(["sit", "roll over"]) == [dogs[0]]
+        assert registry.dogs_knowing_any(["sit", "roll over"]) == dogs
+        assert registry.dogs_knowing_all(["sit", "fly"]) == []
+        assert registry.dogs_knowing_all([]) == []
+        assert registry.count_knowing("roll over") == 2
+        assert registry.tricks_of(dogs[0]) == ["sit", "roll over"]
+
+    def test_unknown_trick(self, dogs):
+        """Tricks nobody knows give empty results."""
+        registry = TrickRegistry()
+        assert not registry.knows(dogs[0], "juggle")
+        assert registry.dogs_knowing("juggle") == []
+        assert registry.count_knowing("juggle") == 0
+
+    def test_queries_do_not_register_dogs(self, dogs):
+        """knows/tricks_of on an unknown dog change nothing."""
+        registry = TrickRegistry()
+        registry.learn_trick(dogs[0], "sit")
+        dogs[1].learn_trick("sit")
+        assert not registry.knows(dogs[1], "sit")
+        assert registry.tricks_of(dogs[1]) == []
+        assert len(registry) == 1 and registry.dogs_knowing("sit") == [dogs[0]]
+
+    def test_many_dogs(self):
+        """Queries stay correct across many dogs."""
+        registry = TrickRegistry()
+        pack = [Dog(f"Dog{i}", 1, "Mutt") for i in range(1000)]
+        for i, dog in enumerate(pack):
+            if i % 3 == 0:
+                registry.learn_trick(dog, "sit")
+            if i % 5 == 0:
+                registry.learn_trick(dog, "stay")
+        both = registry.dogs_knowing_all(["sit", "stay"])
+        assert both == [dog for i, dog in enumerate(pack) if i % 15 == 0]
+
+    def test_queries_scale_linearly(self):
+        """8x the dogs costs far less than 64x the time (no quadratic decode)."""
+        timings = []
+        for count in (20000, 160000):
+            registry = TrickRegistry()
+            for i in range(count):
+                dog = Dog(f"Dog{i}", 1, "Mutt")
+                registry.learn_trick(dog, "sit" if i % 2 else "stay")
+            start = time.perf_counter()
+            for _ in range(3):
+                assert len(registry.dogs_knowing("sit")) == count // 2
+            timings.append(time.perf_counter() - start)
+        assert timings[1] < 24 * timings[0]
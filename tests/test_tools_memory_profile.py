@@ -0,0 +1,72 @@
+"""
+Tests for per-class memory accounting and allocation profiling.
+"""
+from exercises.ecommerce.book import Book
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.shapes.circle import Circle
+from inheritance import Dog
+from tools.memory_profile import (
+    AllocationProfile, diff_snapshots, format_diff, format_snapshot,
+    read_snapshot, take_snapshot, write_snapshot,
+)
+
+BOOK = "exercises.ecommerce.book.Book"
+CART = "exercises.ecommerce.cart.ShoppingCart"
+
+
+class TestSnapshots:
+    """Test cases for live instance accounting."""
+
+    def test_counts_live_instances_per_class(self):
+        """New instances show up in the diff with their sizes."""
+        before = take_snapshot()
+        books = [Book(f"Title {n}", 10.0 + n, "Author", str(n)) for n in range(50)]
+        cart = ShoppingCart()
+        for book in books:
+            cart.add(book, 2)
+        extra = [Circle(1.0), Dog("Rex", 3, "Lab")]
+        deltas = {delta.name: delta for delta in diff_snapshots(before, take_snapshot())}
+        assert deltas[BOOK].count == 50
+        assert deltas[CART].count == 1
+        assert deltas["exercises.shapes.circle.Circle"].count == 1
+        assert deltas["inheritance.Dog"].count == 1
+        assert deltas[BOOK].retained_bytes > deltas[BOOK].shallow_bytes > 0
+        # The cart owns its item list and tuples, but not the books themselves
+        assert 0 < deltas[CART].retained_bytes < deltas[BOOK].retained_bytes
+        del books, cart, extra
+
+    def test_released_instances_disappear(self):
+        """Dropping instances gives negative deltas."""
+        books = [Book("T", 1.0, "A", "1") for _ in range(20)]
+        before = take_snapshot()
+        del books
+        deltas = {delta.name: delta for delta in diff_snapshots(before, take_snapshot())}
+        assert deltas[BOOK].count == -20
+
+    def test_reports_are_sorted_and_round_trip(self, tmp_path):
+        """Text reports are sorted by class; JSON snapshots round-trip."""
+        keep = [Book("T", 1.0, "A", "1"), Circle(2.0)]
+        snapshot = take_snapshot()
+        lines = format_snapshot(snapshot).splitlines()
+        names = [line.split()[0] for line in lines[1:-1]]
+        assert names == sorted(names)
+        assert lines[-1].startswith("total")
+        path = tmp_path / "snapshot.json"
+        write_snapshot(snapshot, path)
+        assert read_snapshot(path) == snapshot
+        assert format_diff(diff_snapshots(snapshot, snapshot)).count("\n") == 0
+        del keep
+
+
+class TestAllocationProfile:
+    """Test cases for tracemalloc hotspots."""
+
+    def test_hotspots_point_at_allocating_line(self):
+        """The line building the objects is the top hotspot."""
+        with AllocationProfile(limit=3) as profile:
+            data = [Book(f"Title {n}", float(n), "Author", str(n)) for n in range(5000)]
+        assert profile.hotspots
+        assert "test_tools_memory_profile.py" in profile.hotspots[0].location
+        assert profile.net_bytes > 0 and profile.peak_bytes >= profile.net_bytes
+        assert "bytes" in profile.report()
+        del data
@@ -0,0 +1,120 @@
+"""
+Measure the cold import time of the lesson packages.
+
+Each import runs in a fresh interpreter with ``-X importtime``, so nothing
+is cached from earlier imports in the same process. The reported time is the
+cumulative import time of the requested module as printed by the
+interpreter (interpreter start-up is not included).
+
+Usage (from the repository root):
+    python -m tools.import_time exercises.ecommerce exercises.shapes examples
+    python -m tools.import_time exercises.ecommerce --access Book --budget-ms 20
+    python -m tools.import_time exercises.shapes --top 10
+
+With ``--budget-ms`` the command exits with status 1 if any import takes
+longer than the budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ("exercises", "exercises.ecommerce", "exercises.shapes", "examples", "examples.animals", "examples.payments")
+
+ImportTiming = namedtuple("ImportTiming", "module self_us cumulative_us depth")
+ImportReport = namedtuple("ImportReport", "module cumulative_ms timings loaded")
+
+
+def _parse_importtime(stderr: str) -> list:
+    """Parse ``-X importtime`` output into ``ImportTiming`` entries."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth))
+    return timings
+
+
+def measure_import(module: str, access=(), python: str = sys.executable) -> ImportReport:
+    """
+    Import a module in a fresh interpreter and time it.
+
+    Args:
+        module (str): Dotted module name
+        access (optional): Attribute names read from the module after the
+            import (to include lazily loaded names in the measurement)
+        python (str, optional): Interpreter to run
+
+    Returns:
+        ImportReport: cumulative milliseconds for ``module`` and the modules
+            it loaded, every timing line, and the names of the loaded
+            repository modules
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    code = [f"import {module}"]
+    for name in access:
+        code.append(f"getattr({module}, {name!r})")
+    prefixes = tuple(f"{package}." for package in ("exercises", "examples", "simulation", "tools", "benchmarks"))
+    code.append(
+        "import sys; print('\\n'.join(sorted(m for m in sys.modules "
+        f"if m.startswith({prefixes!r}) or m in ('exercises', 'examples'))))"
+    )
+    environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    environment.pop("PYTHONPROFILEIMPORTTIME", None)
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", "\n".join(code)],
+        cwd=ROOT, env=environment, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    timings = _parse_importtime(result.stderr)
+    # Top-level entries that belong to the requested tree (the import itself
+    # and any lazily loaded submodules reached through ``access``)
+    root = module.split(".")[0]
+    cumulative = sum(
+        timing.cumulative_us for timing in timings
+        if timing.depth == 0 and (timing.module == root or timing.module.startswith(root + "."))
+    )
+    return ImportReport(module, cumulative / 1000, timings, result.stdout.split())
+
+
+def format_report(report: ImportReport, top: int = 0) -> str:
+    """Render a report; ``top`` adds the slowest modules by self time."""
+    lines = [f"{report.module:<32} {report.cumulative_ms:>8.2f} ms  ({len(report.loaded)} repository modules loaded)"]
+    if top:
+        slowest = sorted(report.timings, key=lambda timing: timing.self_us, reverse=True)[:top]
+        for timing in slowest:
+            lines.append(f"    {timing.module:<40} self {timing.self_us / 1000:>7.2f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=list(PACKAGES))
+    parser.add_argument("--access", nargs="*", default=(), help="attributes to read after importing")
+    parser.add_argument("--budget-ms", type=float, help="fail if an import takes longer")
+    parser.add_argument("--repeat", type=int, default=3, help="keep the fastest of this many runs")
+    parser.add_argument("--top", type=int, default=0, help="show the slowest modules")
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    for module in args.modules:
+        reports = [measure_import(module, args.access) for _ in range(args.repeat)]
+        report = min(reports, key=lambda item: item.cumulative_ms)
+        print(format_report(report, args.top))
+        if args.budget_ms is not None and report.cumulative_ms > args.budget_ms:
+            over_budget.append(module)
+    if over_budget:
+        print(f"Over the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
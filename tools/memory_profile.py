@@ -0,0 +1,254 @@
+"""
+Per-class memory accounting and allocation profiling.
+
+Two tools for finding out where the memory of a run goes:
+
+- ``take_snapshot`` walks the objects tracked by the garbage collector and
+  reports, for every class in the ``Product``, ``ShoppingCart``, ``Shape``
+  and ``Animal`` hierarchies, how many instances are alive, their shallow
+  size (object + ``__dict__``) and their retained size (shallow size plus the
+  containers and values they own). ``diff_snapshots`` compares two
+  snapshots; reports are sorted by class name so the text and JSON forms
+  diff cleanly.
+- ``AllocationProfile`` is a context manager that records a ``tracemalloc``
+  snapshot before and after a block of code and reports the source lines
+  that allocated the most memory in between.
+
+Retained sizes are estimates: an object reachable from several tracked
+instances (an interned string, a shared product) is only counted once, for
+the first instance that reaches it, and other tracked instances are never
+counted as owned.
+
+Usage (from the repository root):
+    python -m tools.memory_profile --count 100000
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from benchmarks.generators import make_animals, make_cart, make_shapes
+from exercises.ecommerce.cart import ShoppingCart
+from exercises.ecommerce.product import Product
+from exercises.shapes.shape import Shape
+from inheritance import Animal
+
+DEFAULT_ROOTS = (Product, ShoppingCart, Shape, Animal)
+
+ClassStats = namedtuple("ClassStats", "count shallow_bytes retained_bytes")
+ClassDelta = namedtuple("ClassDelta", "name count shallow_bytes retained_bytes")
+Hotspot = namedtuple("Hotspot", "location size_bytes count")
+
+# Values owned by an instance whose contents are walked for the retained size
+_CONTAINERS = (list, tuple, dict, set, frozenset)
+
+
+def _class_name(cls) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _owned_size(value, seen: set, roots) -> int:
+    """Size of ``value`` and everything it contains, skipping tracked instances."""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, roots):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            stack.extend(item)
+    return size
+
+
+def take_snapshot(roots=DEFAULT_ROOTS) -> dict:
+    """
+    Count live instances and their memory per class.
+
+    Args:
+        roots (optional): Tuple of base classes; instances of these classes
+            and their subclasses are accounted
+
+    Returns:
+        dict: "module.Class" -> ClassStats(count, shallow_bytes, retained_bytes)
+    """
+    roots = tuple(roots)
+    gc.collect()
+    instances = [obj for obj in gc.get_objects() if isinstance(obj, roots)]
+    seen = {id(obj) for obj in instances}
+    stats = {}
+    for obj in instances:
+        shallow = sys.getsizeof(obj)
+        retained = shallow
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is not None:
+            shallow += sys.getsizeof(attributes)
+            retained += _owned_size(attributes, seen, roots)
+        name = _class_name(type(obj))
+        count, old_shallow, old_retained = stats.get(name, (0, 0, 0))
+        stats[name] = ClassStats(count + 1, old_shallow + shallow, old_retained + retained)
+    return stats
+
+
+def diff_snapshots(before: dict, after: dict) -> list:
+    """
+    Compare two snapshots.
+
+    Args:
+        before (dict): Earlier result of ``take_snapshot``
+        after (dict): Later result of ``take_snapshot``
+
+    Returns:
+        list: ``ClassDelta`` per class present in either snapshot with a
+            non-zero change, sorted by class name
+    """
+    empty = ClassStats(0, 0, 0)
+    deltas = []
+    for name in sorted(before.keys() | after.keys()):
+        old, new = before.get(name, empty), after.get(name, empty)
+        delta = ClassDelta(name, *(b - a for a, b in zip(old, new)))
+        if delta[1:] != (0, 0, 0):
+            deltas.append(delta)
+    return deltas
+
+
+def format_snapshot(snapshot: dict) -> str:
+    """Render a snapshot as a text table sorted by class name."""
+    lines = [f"{'class':<48} {'count':>10} {'shallow':>14} {'retained':>14}"]
+    total = [0, 0, 0]
+    for name in sorted(snapshot):
+        stats = snapshot[name]
+        lines.append(f"{name:<48} {stats.count:>10,} {stats.shallow_bytes:>14,} {stats.retained_bytes:>14,}")
+        total = [a + b for a, b in zip(total, stats)]
+    lines.append(f"{'total':<48} {total[0]:>10,} {total[1]:>14,} {total[2]:>14,}")
+    return "\n".join(lines)
+
+
+def format_diff(deltas: list) -> str:
+    """Render ``diff_snapshots`` output as a text table."""
+    lines = [f"{'class':<48} {'count':>10} {'shallow':>14} {'retained':>14}"]
+    for delta in deltas:
+        lines.append(
+            f"{delta.name:<48} {delta.count:>+10,} {delta.shallow_bytes:>+14,} {delta.retained_bytes:>+14,}"
+        )
+    return "\n".join(lines)
+
+
+def write_snapshot(snapshot: dict, path):
+    """Write a snapshot as JSON with sorted keys, so two files diff cleanly."""
+    data = {name: stats._asdict() for name, stats in snapshot.items()}
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def read_snapshot(path) -> dict:
+    """Read a snapshot written by ``write_snapshot``."""
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    return {name: ClassStats(**stats) for name, stats in data.items()}
+
+
+class AllocationProfile:
+    """
+    Record where a block of code allocates memory.
+
+    Example:
+        with AllocationProfile(limit=5) as profile:
+            products = make_products(100000)
+        print(profile.report())
+    """
+
+    def __init__(self, limit: int = 10, frames: int = 1, key_type: str = "lineno", include=None):
+        """
+        Configure the profile.
+
+        Args:
+            limit (int, optional): Number of hotspots kept
+            frames (int, optional): Traceback depth recorded per allocation
+            key_type (str, optional): "lineno", "filename" or "traceback"
+            include (optional): Filename patterns to keep (fnmatch syntax),
+                e.g. ``["*/exercises/*"]``; defaults to everything except
+                tracemalloc and importlib internals
+        """
+        self.limit = limit
+        self.frames = frames
+        self.key_type = key_type
+        self.include = include
+        self.hotspots = []
+        self.peak_bytes = 0
+        self.net_bytes = 0
+        self._before = None
+        self._started = False
+
+    def _filters(self):
+        if self.include:
+            return [tracemalloc.Filter(True, pattern) for pattern in self.include]
+        return [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, __file__),
+        ]
+
+    def __enter__(self):
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, *exc_info):
+        after = tracemalloc.take_snapshot()
+        _, self.peak_bytes = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+        filters = self._filters()
+        changes = after.filter_traces(filters).compare_to(self._before.filter_traces(filters), self.key_type)
+        self.net_bytes = sum(change.size_diff for change in changes)
+        changes.sort(key=lambda change: change.size_diff, reverse=True)
+        self.hotspots = [
+            Hotspot(str(change.traceback), change.size_diff, change.count_diff)
+            for change in changes[:self.limit]
+            if change.size_diff > 0
+        ]
+        self._before = None
+
+    def report(self) -> str:
+        """Render the hotspots as text."""
+        lines = [f"net {self.net_bytes:+,} bytes, peak {self.peak_bytes:,} bytes"]
+        for hotspot in self.hotspots:
+            lines.append(f"{hotspot.size_bytes:>+14,} bytes {hotspot.count:>+10,} blocks  {hotspot.location}")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000, help="objects of each family to build")
+    parser.add_argument("--limit", type=int, default=10, help="allocation hotspots to show")
+    parser.add_argument("--output", help="write the final snapshot as JSON to this file")
+    args = parser.parse_args(argv)
+
+    before = take_snapshot()
+    with AllocationProfile(limit=args.limit) as profile:
+        data = (make_cart(args.count), make_shapes(args.count), make_animals(args.count))
+    after = take_snapshot()
+    print(format_snapshot(after))
+    print()
+    print(format_diff(diff_snapshots(before, after)))
+    print()
+    print(profile.report())
+    if args.output:
+        write_snapshot(after, args.output)
+    del data
+
+
+if __name__ == "__main__":
+    main()